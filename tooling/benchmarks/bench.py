@@ -0,0 +1,199 @@
+"""Latency and memory benchmarks for cspec commands on synthetic projects.
+
+For each project size, generates a project (benchmarks/generate.py) under
+--work-dir, or reuses the one already there, then runs every case as a
+fresh `cspec` process:
+
+    cold    one run with cspec/.index removed
+    p50/p99 over --repeat runs with warm caches
+    rss     peak resident memory of the process
+
+Results are compared against a stored baseline (per size and case); a case
+regresses when its p50, p99 or rss exceeds the baseline by more than
+--tolerance. Baselines are machine-specific: record one with
+--save-baseline on the machine that runs the comparison.
+
+    uv run python benchmarks/bench.py --sizes 1k,10k --save-baseline
+    uv run python benchmarks/bench.py --sizes 1k,10k
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate import MARKER, SIZES, generate  # noqa: E402
+
+TOOLING_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Case name -> cspec argv
+CASES: dict[str, list[str]] = {
+    "status": ["status"],
+    "work list": ["work", "list"],
+    "specs list": ["specs", "list"],
+    "templates get": ["templates", "get", "feature"],
+    "validate": ["validate"],
+}
+
+# Exit codes a case may end with besides 0: the generated projects contain
+# deliberately invalid issues, which validate reports with 1
+EXIT_CODES: dict[str, tuple[int, ...]] = {
+    "validate": (0, 1),
+}
+
+# Run as the entry point does
+ENTRY = "import sys; from cspec.cli import main; sys.argv[0] = 'cspec'; main()"
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def run_once(argv: list[str], project: Path, exit_codes: tuple[int, ...] = (0,)) -> tuple[float, float]:
+    """Run one cspec process; return (wall ms, peak rss MB).
+
+    Raises RuntimeError with the captured stderr if the process exits with
+    a code outside exit_codes or prints a traceback, so a broken command is
+    not timed as a fast one.
+    """
+    env = {**os.environ, "CSPEC_NO_DAEMON": "1", "PYTHONPATH": str(TOOLING_DIR)}
+    # A file rather than a pipe: nothing drains a pipe while wait4 blocks
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-c", ENTRY, *argv],
+            cwd=project,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr,
+        )
+        _, wait_status, rusage = os.wait4(proc.pid, 0)
+        wall_ms = (time.perf_counter() - start) * 1000
+        # Reaped by wait4, so tell Popen it is done
+        proc.returncode = os.waitstatus_to_exitcode(wait_status)
+        stderr.seek(0)
+        output = stderr.read().decode(errors="replace").strip()
+    if proc.returncode not in exit_codes or "Traceback (most recent call last)" in output:
+        message = f"cspec {' '.join(argv)} exited with {proc.returncode} in {project}"
+        raise RuntimeError(f"{message}:\n{output}" if output else message)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = rusage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return wall_ms, rss
+
+
+def project_for(size: str, work_dir: Path) -> Path:
+    """Return a generated project for size, generating it if needed."""
+    project = work_dir / size
+    if (project / MARKER).exists():
+        return project
+    if project.exists():
+        shutil.rmtree(project)
+    project.mkdir(parents=True)
+    count = SIZES[size]
+    print(f"Generating {size} project in {project} ...", flush=True)
+    start = time.perf_counter()
+    generate(project, count, max(1, count // 10))
+    print(f"  done in {time.perf_counter() - start:.1f} s", flush=True)
+    return project
+
+
+def bench_case(argv: list[str], project: Path, repeat: int, exit_codes: tuple[int, ...] = (0,)) -> dict:
+    shutil.rmtree(project / "cspec" / ".index", ignore_errors=True)
+    cold_ms, cold_rss = run_once(argv, project, exit_codes)
+    runs = [run_once(argv, project, exit_codes) for _ in range(repeat)]
+    walls = [wall for wall, _ in runs]
+    return {
+        "cold": round(cold_ms, 1),
+        "p50": round(percentile(walls, 50), 1),
+        "p99": round(percentile(walls, 99), 1),
+        "rss": round(max([cold_rss, *(rss for _, rss in runs)]), 1),
+    }
+
+
+def compare(result: dict, base: dict | None, tolerance: float) -> list[str]:
+    """Return the metrics of result that regressed against base."""
+    if not base:
+        return []
+    return [
+        f"{metric} {result[metric]} vs {base[metric]}"
+        for metric in ("p50", "p99", "rss")
+        if metric in base and result[metric] > base[metric] * (1 + tolerance)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1k", help=f"Comma-separated sizes ({', '.join(SIZES)})")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated cases to run")
+    parser.add_argument("--repeat", type=int, default=10, help="Warm runs per case")
+    parser.add_argument("--work-dir", type=Path, default=Path.home() / ".cache" / "cspec-bench", help="Where generated projects are kept")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown or growth over the baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = [s for s in sizes if s not in SIZES] + [c for c in cases if c not in CASES]
+    if unknown:
+        print(f"Unknown size or case: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    results: dict[str, dict] = {}
+    regressions = []
+    for size in sizes:
+        project = project_for(size, args.work_dir)
+        print(f"\n{size} ({project})")
+        print(f"  {'case':<16} {'cold':>9} {'p50':>9} {'p99':>9} {'rss':>8}")
+        results[size] = {}
+        for case in cases:
+            try:
+                result = bench_case(CASES[case], project, args.repeat, EXIT_CODES.get(case, (0,)))
+            except RuntimeError as e:
+                print(f"\n{e}", file=sys.stderr)
+                return 2
+            results[size][case] = result
+            regressed = compare(result, baseline.get(size, {}).get(case), args.tolerance)
+            note = f"  REGRESSED: {', '.join(regressed)}" if regressed else ""
+            print(
+                f"  {case:<16} {result['cold']:7.1f}ms {result['p50']:7.1f}ms "
+                f"{result['p99']:7.1f}ms {result['rss']:6.1f}MB{note}",
+                flush=True,
+            )
+            regressions += [f"{size} {case}: {r}" for r in regressed]
+
+    if args.save_baseline:
+        for size, cases_result in results.items():
+            baseline.setdefault(size, {}).update(cases_result)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\nRegressions (tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Generate a synthetic cspec project for benchmarks.
+
+Builds cspec/work/ with N work items and cspec/specs/ with N/10 specs (by
+default). Work items have an issue.md shaped like testing/specs/issues/
+ISSUE-001.md, plus, for some of them, a proposal, delta specs, required
+context files and dependencies. Specs hold requirements with scenarios and
+some have .mmd diagrams. A few issues are deliberately invalid so validation
+exercises its error path. Output is deterministic for a given seed.
+
+    uv run python benchmarks/generate.py /tmp/cspec-10k --size 10k
+    uv run python benchmarks/generate.py /tmp/small --work-items 250 --specs 40
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Named project sizes (work items)
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+# Records how a project was generated, so benchmarks can reuse it
+MARKER = ".cspec-bench"
+
+NATURES = {
+    "feature": ["problem-statement"],
+    "enhancement": ["current-behavior", "delta-description"],
+    "bug": ["rca"],
+    "refactor": ["architecture-scope", "behavioral-equivalence"],
+    "optimization": ["baseline-metrics", "target-metrics", "measurement-method"],
+    "security": ["vulnerability-report", "attack-vector", "severity", "affected-versions"],
+    "hotfix": ["incident-reference", "impact-assessment", "rollback-plan"],
+    "migration": ["current-state", "target-state", "transformation-rules", "rollback-plan"],
+    "configuration": ["current-config", "new-config", "impact-assessment"],
+    "deprecation": ["sunset-timeline", "migration-path", "consumer-impact"],
+    "removal": ["deprecation-reference", "migration-confirmation", "impact-assessment"],
+}
+IMPACT_VERSION = {"breaking": "major", "additive": "minor", "invisible": "patch"}
+STATUSES = ["draft", "ready", "in-progress", "blocked", "done"]
+
+WORDS = (
+    "session login token cache export report invoice payment search index "
+    "profile account audit webhook queue retry timeout upload download "
+    "billing schedule notification permission role tenant import sync"
+).split()
+
+# Share of issues written with a version that doesn't match their impact
+INVALID_RATE = 0.02
+
+
+def _phrase(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _issue(rng: random.Random, number: int, nature: str, feature: str) -> str:
+    impact = rng.choice(list(IMPACT_VERSION))
+    version = IMPACT_VERSION[impact]
+    if rng.random() < INVALID_RATE:
+        version = rng.choice([v for v in IMPACT_VERSION.values() if v != version])
+    created = date(2025, 1, 1) + timedelta(days=rng.randrange(300))
+    updated = created + timedelta(days=rng.randrange(60))
+    required = "\n".join(
+        f"    - type: {kind}\n      path: context/{kind}.md" for kind in NATURES[nature]
+    )
+    depends = [f"ISSUE-{rng.randrange(1, number):03d}" for _ in range(rng.choice([0, 0, 0, 1, 2]))] if number > 1 else []
+    title = f"{_phrase(rng, 3).capitalize()} for {feature}"
+    return f"""---
+id: ISSUE-{number:03d}
+title: "{title}"
+nature: {nature}
+impact: {impact}
+version: {version}
+status: {rng.choice(STATUSES)}
+created: {created.isoformat()}
+updated: {updated.isoformat()}
+
+context:
+  required:
+{required}
+  recommended: []
+
+depends_on: [{", ".join(depends)}]
+blocks: []
+---
+
+## Problem
+
+The {feature} {_phrase(rng, 6)} does not behave as expected.
+
+## Scope
+
+### In Scope
+
+- [ ] {_phrase(rng, 5).capitalize()}
+- [ ] {_phrase(rng, 4).capitalize()}
+
+### Out of Scope
+
+- {_phrase(rng, 3).capitalize()}
+
+## Acceptance Criteria
+
+- [ ] cspec validate passes
+- [ ] {_phrase(rng, 5).capitalize()}
+
+## Notes
+
+{_phrase(rng, 12).capitalize()}.
+"""
+
+
+def _requirement(rng: random.Random, name: str, heading: str = "## Requirement:") -> str:
+    scenarios = "\n".join(
+        f"""### Scenario: {_phrase(rng, 3)}
+
+**Given** {_phrase(rng, 4)}
+**When** {_phrase(rng, 3)}
+**Then** {_phrase(rng, 4)}
+"""
+        for _ in range(rng.randint(1, 3))
+    )
+    return f"{heading} {name}\n\nThe system SHALL {_phrase(rng, 6)}.\n\n{scenarios}"
+
+
+def _spec(rng: random.Random, feature: str) -> tuple[str, list[str]]:
+    names = [f"{_phrase(rng, 2).title()} {i}" for i in range(rng.randint(3, 8))]
+    body = "\n---\n\n".join(_requirement(rng, name) for name in names)
+    text = f"# {feature} Specification\n\n## Overview\n\n{_phrase(rng, 10).capitalize()}.\n\n---\n\n{body}"
+    return text, names
+
+
+def _diagram(rng: random.Random, names: list[str]) -> str:
+    lines = ["flowchart TD"]
+    for i, name in enumerate(names):
+        lines.append(f"    N{i}[\"{name}\"]")
+    for i in range(1, len(names)):
+        lines.append(f"    N{rng.randrange(i)} --> N{i}")
+    return "\n".join(lines) + "\n"
+
+
+def generate(root: Path, work_items: int, specs: int, seed: int = 0) -> None:
+    """Write a synthetic project under root (which should be empty)."""
+    rng = random.Random(seed)
+    for sub in ("cspec/specs", "cspec/work", ".claude/commands/cspec"):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+    (root / "AGENTS.md").write_text("# Agents\n\n## PROJECT CONTEXT\n\nSynthetic benchmark project.\n")
+
+    features = [f"feature-{i:05d}" for i in range(specs)]
+    requirement_names = {}
+    for feature in features:
+        spec_dir = root / "cspec" / "specs" / feature
+        spec_dir.mkdir()
+        text, names = _spec(rng, feature)
+        requirement_names[feature] = names
+        (spec_dir / "spec.md").write_text(text)
+        if rng.random() < 0.3:
+            (spec_dir / "flow.mmd").write_text(_diagram(rng, names))
+
+    for number in range(1, work_items + 1):
+        nature = rng.choice(list(NATURES))
+        feature = rng.choice(features) if features else "core"
+        work_dir = root / "cspec" / "work" / f"{nature}-{number:06d}"
+        work_dir.mkdir()
+        (work_dir / "issue.md").write_text(_issue(rng, number, nature, feature))
+
+        if rng.random() < 0.8:
+            context_dir = work_dir / "context"
+            context_dir.mkdir()
+            for kind in NATURES[nature]:
+                (context_dir / f"{kind}.md").write_text(f"# {kind}\n\n{_phrase(rng, 20).capitalize()}.\n")
+        if rng.random() < 0.5:
+            (work_dir / "proposal.md").write_text(f"# Proposal\n\n{_phrase(rng, 30).capitalize()}.\n")
+        if rng.random() < 0.6 and feature in requirement_names:
+            modified = rng.choice(requirement_names[feature])
+            delta = _requirement(rng, f"{_phrase(rng, 2).title()} {number}", "### ADDED:")
+            (work_dir / f"spec-{feature}.md").write_text(
+                f"# {feature} Specification (delta)\n\n### MODIFIED: {modified}\n"
+                f"~~The system SHALL {_phrase(rng, 4)}.~~\nThe system SHALL {_phrase(rng, 6)}.\n\n{delta}"
+            )
+
+    (root / MARKER).write_text(f"work_items={work_items}\nspecs={specs}\nseed={seed}\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", type=Path, help="Directory to create (must not exist or be empty)")
+    parser.add_argument("--size", choices=sorted(SIZES, key=SIZES.get), default="1k", help="Number of work items")
+    parser.add_argument("--work-items", type=int, default=None, help="Exact number of work items (overrides --size)")
+    parser.add_argument("--specs", type=int, default=None, help="Number of specs (default: work items / 10)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.root.exists() and any(args.root.iterdir()):
+        print(f"{args.root} is not empty", file=sys.stderr)
+        return 1
+    work_items = args.work_items if args.work_items is not None else SIZES[args.size]
+    specs = args.specs if args.specs is not None else max(1, work_items // 10)
+    generate(args.root, work_items, specs, args.seed)
+    print(f"Generated {work_items} work item(s) and {specs} spec(s) in {args.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Import-time regression check for cspec cold start.
+
+Runs each command below under `python -X importtime` in a scratch project and
+fails if it imports a module it should not need (YAML, Pydantic, the daemon
+server, ...). The time spent importing beyond interpreter startup is
+reported per command; pass --max-ms to also fail when one exceeds a budget.
+
+    uv run python benchmarks/importtime.py
+    uv run python benchmarks/importtime.py --max-ms 60 --repeat 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TOOLING_DIR = Path(__file__).resolve().parent.parent
+
+# Imported only by commands that parse YAML, validate issues or run the daemon
+HEAVY_MODULES = {"yaml", "pydantic", "cspec.schemas", "cspec.frontmatter", "socketserver"}
+
+# argv -> heavy modules it is allowed to import
+COMMANDS: dict[tuple[str, ...], set[str]] = {
+    ("--version",): set(),
+    ("specs", "template"): set(),
+    ("design", "template"): set(),
+    ("onboard",): set(),
+    ("status",): set(),
+    ("specs", "list"): set(),
+    ("templates", "list"): set(),
+    ("templates", "get", "feature"): set(),
+    ("work", "list"): {"yaml", "pydantic", "cspec.schemas", "cspec.frontmatter"},
+}
+
+
+# Run as the entry point does, so cspec.cli shows up in the importtime output
+ENTRY = "import sys; from cspec.cli import main; sys.argv[0] = 'cspec'; main()"
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int]]:
+    """Return (module, cumulative µs) for each top-level import, in import order.
+
+    Nested imports are indented in the name column and already counted in
+    their parent's cumulative time.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip() == "cumulative" or name.startswith("  "):
+            continue
+        imports.append((name.strip(), int(cumulative)))
+    return imports
+
+
+def imported(stderr: str) -> set[str]:
+    """Every module name (nested or not) in the importtime output."""
+    return {line.rsplit("|", 1)[1].strip() for line in stderr.splitlines() if line.startswith("import time:")}
+
+
+def run(args: list[str], project: Path) -> str:
+    env = {**os.environ, "CSPEC_NO_DAEMON": "1", "PYTHONPATH": str(TOOLING_DIR)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    return result.stderr
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if a command's cspec imports exceed this")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command; the fastest is reported")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp)
+        for sub in ("cspec/specs", "cspec/work"):
+            (project / sub).mkdir(parents=True)
+
+        # Modules the interpreter loads before cspec does anything
+        startup = {name for name, _ in parse_importtime(run(["-c", "pass"], project))}
+
+        for argv, allowed in COMMANDS.items():
+            # Warm-up run fills the project index and the template bundle
+            run(["-c", ENTRY, *argv], project)
+            outputs = [run(["-c", ENTRY, *argv], project) for _ in range(args.repeat)]
+            unexpected = sorted((HEAVY_MODULES - allowed) & imported(outputs[0]))
+            total_ms = min(
+                sum(us for name, us in parse_importtime(out) if name not in startup) for out in outputs
+            ) / 1000
+
+            label = " ".join(argv)
+            note = f"  imports {', '.join(unexpected)}" if unexpected else ""
+            print(f"  {label:<24} {total_ms:7.1f} ms{note}")
+            if unexpected:
+                failures.append(f"{label}: imports {', '.join(unexpected)}")
+            if args.max_ms is not None and total_ms > args.max_ms:
+                failures.append(f"{label}: {total_ms:.1f} ms > {args.max_ms} ms")
+
+    if failures:
+        print("\nRegressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
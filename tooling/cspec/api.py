@@ -0,0 +1,623 @@
+"""Library API: what the cspec commands do, without click.
+
+Every function takes a project root and returns data; nothing here prints,
+reads the working directory or exits the process. Failures raise CspecError
+subclasses carrying the message the CLI would show. The CLI commands in
+cspec.subcommands are renderers over these functions, and a long-lived
+process can import this module instead of spawning `cspec`:
+
+    from pathlib import Path
+    from cspec import api
+
+    root = Path("~/src/shop").expanduser()
+    if api.status(root).healthy:
+        for summary in api.list_work(root):
+            print(summary.item.name, summary.fields.status if summary.fields else "-")
+
+Like the CLI, this module imports YAML, Pydantic and the search index only
+in the functions that need them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    # Only for annotations: importing them at runtime would pull in YAML,
+    # Pydantic and the search index for every command
+    from cspec.diagrams import DiagramInfo, RenderResult
+    from cspec.graph import IssueGraph
+    from cspec.health import ProjectStatus
+    from cspec.index import SpecEntry, WorkItem
+    from cspec.issuefields import IssueFields
+    from cspec.merge import MergeResult
+    from cspec.pack import ContextPack
+    from cspec.schemas import IssueFrontmatter
+    from cspec.search import SearchResult
+    from cspec.validation import ValidationResult
+
+
+class CspecError(Exception):
+    """Base class for errors reported by the API."""
+
+
+class NotInitialized(CspecError):
+    """A required cspec directory is missing; `cspec init` creates it."""
+
+    def __init__(self, directory: str):
+        super().__init__(f"No {directory} directory found. Run 'cspec init' first.")
+        self.directory = directory
+
+
+class NotFound(CspecError):
+    """A named spec, work item, section or template does not exist.
+
+    available lists the names that do, for suggestions.
+    """
+
+    def __init__(self, message: str, available: list[str] | None = None):
+        super().__init__(message)
+        self.available = available or []
+
+
+class SectionNotFound(NotFound):
+    """No requirement or scenario matches, or the name is ambiguous."""
+
+
+class InvalidQuery(CspecError):
+    """A listing was given an unknown sort or filter value."""
+
+
+class MergeConflict(CspecError):
+    """Work specs that cannot be merged; problems maps each work spec to its conflicts."""
+
+    def __init__(self, problems: dict[Path, list[str]]):
+        super().__init__("; ".join(f"{path.name}: {p}" for path, ps in problems.items() for p in ps))
+        self.problems = problems
+
+
+# Orders accepted by list_work and list_specs; mtime is most recent first
+WORK_SORTS = ("name", "mtime", "status")
+SPEC_SORTS = ("name", "mtime")
+
+
+@dataclass
+class SpecView:
+    """A permanent spec's text and the diagrams next to it."""
+    name: str
+    path: Path
+    text: str
+    diagrams: list[str] = field(default_factory=list)
+
+
+@dataclass
+class WorkSummary:
+    """A work item and its issue (None if it has none or it is invalid).
+
+    fields holds the issue's summary fields, read without Pydantic; issue,
+    the full validated frontmatter, is parsed on first access.
+    """
+    item: WorkItem
+    fields: IssueFields | None = None
+    issue_errors: list[str] | None = None
+    issue_file: Path | None = None
+    _issue: IssueFrontmatter | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def issue(self) -> IssueFrontmatter | None:
+        if self._issue is None and self.fields is not None and self.issue_file is not None:
+            from cspec.frontmatter import read_issue
+
+            self._issue = read_issue(self.issue_file)[2].issue
+        return self._issue
+
+
+@dataclass
+class SpecMerge:
+    """A work spec merged (or to be merged) into a permanent spec.
+
+    original is None when the permanent spec is new.
+    """
+    work_spec: Path
+    target: Path
+    original: bytes | None
+    result: MergeResult
+    written: bool = False
+
+
+def _require_dir(project_root: Path, rel: str) -> Path:
+    path = project_root / rel
+    if not path.is_dir():
+        raise NotInitialized(rel)
+    return path
+
+
+def _children(directory: Path) -> list[str]:
+    if not directory.is_dir():
+        return []
+    return sorted(d.name for d in directory.iterdir() if d.is_dir())
+
+
+def status(project_root: Path, scan_threads: int | None = None) -> ProjectStatus:
+    """Project health (cspec.health.ProjectStatus).
+
+    scan_threads, here and in the listing functions, sets how many threads
+    read directories; by default remote filesystems get a pool and local
+    disks are read serially (cspec.index.scan_threads).
+    """
+    from cspec.health import project_status
+
+    return project_status(project_root, scan_threads)
+
+
+def iter_status(project_root: Path, scan_threads: int | None = None) -> Iterator[dict]:
+    """Status records (directories, specs, work items, AGENTS.md) as each directory is read.
+
+    cspec.health.records_healthy() tells whether the records add up to a
+    healthy project.
+    """
+    from cspec.health import status_records
+
+    return status_records(project_root, stream=True, scan_threads=scan_threads)
+
+
+def _check_sort(sort: str, allowed: tuple[str, ...]) -> None:
+    if sort not in allowed:
+        raise InvalidQuery(f"Unknown sort: {sort} (choose from {', '.join(allowed)})")
+
+
+def _mtime_key(record) -> tuple:
+    return (-record.mtime_ns, record.name)
+
+
+def _page(records: Iterator, key, ordered: bool, offset: int, limit: int | None) -> list:
+    """Return records[offset:offset + limit] in key order.
+
+    If records already arrive in order, reading stops once the page is full;
+    otherwise a heap keeps only the first offset + limit.
+    """
+    import heapq
+    from itertools import islice
+
+    end = None if limit is None else offset + limit
+    try:
+        if ordered:
+            return list(islice(records, offset, end))
+        if end is None:
+            return sorted(records, key=key)[offset:]
+        return heapq.nsmallest(end, records, key=key)[offset:]
+    finally:
+        # Stops the scan (and saves what it read) if the page filled early
+        records.close()
+
+
+def list_specs(
+    project_root: Path,
+    scan_threads: int | None = None,
+    *,
+    sort: str = "name",
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[SpecEntry]:
+    """Permanent specs with a spec.md (cspec.index.SpecEntry), sorted by name or mtime.
+
+    offset and limit select a page. Sorted by name, the scan stops once the
+    page is full.
+    """
+    from cspec.index import iter_specs as scan
+
+    _check_sort(sort, SPEC_SORTS)
+    _require_dir(project_root, "cspec/specs")
+    specs = (spec for spec in scan(project_root, scan_threads, ordered=sort == "name") if spec.has_spec)
+    return _page(specs, _mtime_key, sort == "name", offset, limit)
+
+
+def iter_specs(project_root: Path, scan_threads: int | None = None) -> Iterator[SpecEntry]:
+    """Like list_specs, in scan order as each directory is read."""
+    from cspec.index import iter_specs as scan
+
+    _require_dir(project_root, "cspec/specs")
+    return (spec for spec in scan(project_root, scan_threads) if spec.has_spec)
+
+
+def _spec_files(project_root: Path, feature: str) -> tuple[Path, set[str]]:
+    """Return a spec's spec.md and the names of the files next to it."""
+    from cspec.index import list_dir
+
+    spec_dir = project_root / "cspec" / "specs" / feature
+    if not spec_dir.is_dir():
+        raise NotFound(f"Spec not found: {feature}", _children(project_root / "cspec" / "specs"))
+    files, _ = list_dir(spec_dir)
+    if "spec.md" not in files:
+        raise NotFound(f"No spec.md found in {feature}/")
+    return spec_dir / "spec.md", files
+
+
+def show_spec(project_root: Path, feature: str) -> SpecView:
+    """Read a permanent spec."""
+    spec_file, files = _spec_files(project_root, feature)
+    diagrams = sorted(f for f in files if f.endswith(".mmd"))
+    return SpecView(feature, spec_file, spec_file.read_text(encoding="utf-8"), diagrams)
+
+
+def spec_section(project_root: Path, feature: str, requirement: str | None = None, scenario: str | None = None) -> str:
+    """Read one requirement or scenario of a spec (name or unique part of it).
+
+    With both, the scenario is looked up within the requirement.
+    """
+    from cspec.specdoc import SpecLoader, find_section, read_section
+
+    if not requirement and not scenario:
+        raise ValueError("requirement or scenario is required")
+    spec_file, _ = _spec_files(project_root, feature)
+    loader = SpecLoader(project_root)
+    doc = loader.load(spec_file)
+    loader.save()
+
+    try:
+        if requirement:
+            section = find_section(doc.requirements, requirement, "requirement")
+            if scenario:
+                section = find_section(section.scenarios, scenario, "scenario")
+        else:
+            section = find_section([s for r in doc.requirements for s in r.scenarios], scenario, "scenario")
+    except LookupError as e:
+        raise SectionNotFound(str(e)) from None
+    return read_section(spec_file, section)
+
+
+def _summaries(project_root: Path, items: Iterator[WorkItem], prune: bool = True) -> Iterator[WorkSummary]:
+    """Attach issue summary fields to work items.
+
+    With prune, a run that reaches the end drops cached fields of issues
+    under cspec/work/ it did not load, so prune only when items is every
+    work item.
+    """
+    from cspec.issuefields import FieldsLoader
+
+    work_dir = project_root / "cspec" / "work"
+    loader = FieldsLoader(project_root)
+    complete = False
+    try:
+        for item in items:
+            summary = WorkSummary(item)
+            if item.has_issue:
+                summary.issue_file = work_dir / item.name / "issue.md"
+                summary.fields, summary.issue_errors = loader.load(summary.issue_file)
+            yield summary
+        complete = True
+    finally:
+        loader.save(prune=work_dir if prune and complete else None)
+
+
+def _work_filters(status: list[str] | None, nature: list[str] | None) -> tuple[set[str], set[str]]:
+    """Check status and nature filter values against the issue schema."""
+    from cspec.enums import Nature, Status
+
+    for kind, values, enum in (("status", status, Status), ("nature", nature, Nature)):
+        allowed = [member.value for member in enum]
+        unknown = [v for v in values or [] if v not in allowed]
+        if unknown:
+            raise InvalidQuery(f"Unknown {kind}: {', '.join(unknown)} (choose from {', '.join(allowed)})")
+    return set(status or []), set(nature or [])
+
+
+def _work_items(project_root: Path, scan_threads: int | None, has_spec: bool | None, ordered: bool) -> Iterator[WorkItem]:
+    from cspec.index import iter_work_items
+
+    _require_dir(project_root, "cspec/work")
+    items = iter_work_items(project_root, scan_threads, ordered=ordered)
+    if has_spec is None:
+        return items
+    return (item for item in items if bool(item.spec_files) == has_spec)
+
+
+def _issue_filter(summaries: Iterator[WorkSummary], statuses: set[str], natures: set[str]) -> Iterator[WorkSummary]:
+    if not statuses and not natures:
+        return summaries
+    return (
+        s for s in summaries
+        if s.fields is not None
+        and (not statuses or s.fields.status in statuses)
+        and (not natures or s.fields.nature in natures)
+    )
+
+
+def _status_key(summary: WorkSummary) -> tuple:
+    from cspec.enums import Status
+
+    rank = list(Status).index(Status(summary.fields.status)) if summary.fields else len(Status)
+    return (rank, summary.item.name)
+
+
+def list_work(
+    project_root: Path,
+    scan_threads: int | None = None,
+    *,
+    status: list[str] | None = None,
+    nature: list[str] | None = None,
+    has_spec: bool | None = None,
+    sort: str = "name",
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[WorkSummary]:
+    """Work items with their issues, sorted by name, mtime or status.
+
+    status and nature keep items whose issue is valid and has one of the
+    given values; has_spec keeps items with (True) or without (False) spec
+    files. Filters run as directories are scanned. offset and limit select
+    a page: sorted by name the scan stops once the page is full, otherwise
+    a heap keeps only the first offset + limit. Issues are loaded only for
+    the page unless a filter or the sort needs them.
+    """
+    _check_sort(sort, WORK_SORTS)
+    statuses, natures = _work_filters(status, nature)
+    items = _work_items(project_root, scan_threads, has_spec, ordered=sort == "name")
+    # Cached issues of items not loaded this run are only dropped after a full listing
+    full = has_spec is None and not offset and limit is None
+
+    if sort == "mtime" and not statuses and not natures:
+        page = _page(items, _mtime_key, False, offset, limit)
+        return list(_summaries(project_root, page, prune=full))
+
+    summaries = _issue_filter(_summaries(project_root, items, prune=full), statuses, natures)
+    if sort == "status":
+        return _page(summaries, _status_key, False, offset, limit)
+    return _page(summaries, lambda s: _mtime_key(s.item), sort == "name", offset, limit)
+
+
+def iter_work(
+    project_root: Path,
+    scan_threads: int | None = None,
+    *,
+    status: list[str] | None = None,
+    nature: list[str] | None = None,
+    has_spec: bool | None = None,
+) -> Iterator[WorkSummary]:
+    """Like list_work, unpaged, in scan order as each directory is read."""
+    statuses, natures = _work_filters(status, nature)
+    items = _work_items(project_root, scan_threads, has_spec, ordered=False)
+    return _issue_filter(_summaries(project_root, items, prune=has_spec is None), statuses, natures)
+
+
+def show_work(project_root: Path, slug: str) -> WorkSummary:
+    """One work item with its issue."""
+    from cspec.index import read_work_item
+
+    work_dir = project_root / "cspec" / "work" / slug
+    if not work_dir.is_dir():
+        raise NotFound(f"Work item not found: {slug}", _children(project_root / "cspec" / "work"))
+    summary = WorkSummary(read_work_item(work_dir))
+    if summary.item.has_issue:
+        from cspec.issuefields import FieldsLoader
+
+        summary.issue_file = work_dir / "issue.md"
+        loader = FieldsLoader(project_root)
+        summary.fields, summary.issue_errors = loader.load(summary.issue_file)
+        loader.save()
+    return summary
+
+
+def iter_validate(
+    project_root: Path,
+    paths: list[Path] | None = None,
+    jobs: int | None = None,
+    changed: list[Path] | None = None,
+) -> Iterator[ValidationResult]:
+    """Validate issues under paths (default cspec/work/), yielding each result as it finishes.
+
+    With changed (absolute paths of changed files), only the changed issues
+    and the issues whose depends_on/blocks reference them are checked, and
+    their references must name existing issues. Yields
+    cspec.validation.ValidationResult objects.
+    """
+    from cspec.validation import affected_issue_files, find_issue_files, validate_issues
+
+    if not paths:
+        paths = [_require_dir(project_root, "cspec/work")]
+    if changed is not None:
+        files = affected_issue_files(project_root, changed, list(paths))
+    else:
+        files = [(project_root / p).absolute() for p in find_issue_files(list(paths))]
+    return validate_issues(project_root, files, jobs=jobs, check_refs=changed is not None)
+
+
+def validate(
+    project_root: Path,
+    paths: list[Path] | None = None,
+    jobs: int | None = None,
+    changed: list[Path] | None = None,
+) -> list[ValidationResult]:
+    """iter_validate() results, sorted by path."""
+    return sorted(iter_validate(project_root, paths, jobs, changed), key=lambda r: str(r.path))
+
+
+def dependency_graph(project_root: Path) -> IssueGraph:
+    """Issue dependency graph (cspec.graph.IssueGraph) of cspec/work/.
+
+    The dependency index is synced with the work items first, re-reading
+    only issues that changed.
+    """
+    from cspec.frontmatter import IssueLoader
+    from cspec.graph import DependencyIndex, IssueGraph
+    from cspec.index import list_work_items
+
+    work_dir = _require_dir(project_root, "cspec/work")
+    issue_files = [work_dir / item.name / "issue.md" for item in list_work_items(project_root) if item.has_issue]
+    loader = IssueLoader(project_root)
+    deps = DependencyIndex(project_root)
+    deps.sync(issue_files, loader)
+    loader.save()
+    deps.save()
+    return IssueGraph.from_index(deps)
+
+
+def search(project_root: Path, query: str | list[str], limit: int | None = 20) -> list[SearchResult]:
+    """Ranked search (cspec.search.SearchResult); query words may include key:value filters."""
+    from cspec.search import SearchIndex, parse_query
+
+    words = query.split() if isinstance(query, str) else list(query)
+    text, filters = parse_query(words)
+    _require_dir(project_root, "cspec")
+
+    index = SearchIndex(project_root)
+    index.refresh()
+    index.save()
+    return index.search(text, filters, limit=limit)
+
+
+def context_pack(project_root: Path, slug: str, budget: int = 8000) -> ContextPack:
+    """Token-budgeted context pack for a work item (cspec.pack.ContextPack)."""
+    from cspec.pack import context_pack as build
+
+    try:
+        pack, _ = build(project_root, slug, budget)
+    except FileNotFoundError:
+        raise NotFound(f"Work item not found: {slug}", _children(project_root / "cspec" / "work")) from None
+    return pack
+
+
+def merge_specs(project_root: Path, slug: str, feature: str | None = None, write: bool = True) -> list[SpecMerge]:
+    """Merge a work item's spec-*.md files into the permanent specs.
+
+    Every work spec is checked before any is written; with write=False
+    nothing is written (a dry run). Raises MergeConflict listing every
+    conflict.
+    """
+    from cspec.atomic import write_bytes
+    from cspec.merge import MergeError, merge_spec
+
+    work_dir = project_root / "cspec" / "work" / slug
+    if not work_dir.is_dir():
+        raise NotFound(f"Work item not found: {slug}", _children(project_root / "cspec" / "work"))
+    work_specs = sorted(work_dir.glob("spec-*.md"))
+    if feature:
+        work_specs = [p for p in work_specs if p.name == f"spec-{feature}.md"]
+    if not work_specs:
+        raise NotFound(f"No spec-{feature or '*'}.md in cspec/work/{slug}")
+
+    merges = []
+    problems: dict[Path, list[str]] = {}
+    for work_spec in work_specs:
+        target = project_root / "cspec" / "specs" / work_spec.stem.removeprefix("spec-") / "spec.md"
+        original = target.read_bytes() if target.exists() else None
+        try:
+            result = merge_spec(original, work_spec.read_bytes())
+        except MergeError as e:
+            problems[work_spec] = e.problems
+            continue
+        merges.append(SpecMerge(work_spec, target, original, result))
+    if problems:
+        raise MergeConflict(problems)
+
+    if write:
+        for merge in merges:
+            if merge.result.text != merge.original:
+                write_bytes(merge.target, merge.result.text)
+                merge.written = True
+    return merges
+
+
+def list_diagrams(project_root: Path, feature: str | None = None) -> list[DiagramInfo]:
+    """Mermaid diagrams of every spec, or of one, sorted by spec and name.
+
+    Returns cspec.diagrams.DiagramInfo objects: kind, node and edge counts,
+    and the spec's requirements each diagram names.
+    """
+    from cspec.diagrams import DiagramIndex
+    from cspec.index import list_dir, list_specs as scan
+
+    specs_dir = _require_dir(project_root, "cspec/specs")
+    if feature:
+        if not (specs_dir / feature).is_dir():
+            raise NotFound(f"Spec not found: {feature}", _children(specs_dir))
+        names = {feature: sorted(f for f in list_dir(specs_dir / feature)[0] if f.endswith(".mmd"))}
+    else:
+        names = {spec.name: spec.diagrams for spec in scan(project_root) if spec.diagrams}
+
+    index = DiagramIndex(project_root)
+    try:
+        return [index.load(spec, name) for spec, diagrams in names.items() for name in diagrams]
+    finally:
+        index.save(prune=feature is None)
+
+
+def render_diagrams(
+    project_root: Path,
+    feature: str | None = None,
+    max_cache_bytes: int | None = None,
+    jobs: int = 4,
+    output_dir: Path | None = None,
+) -> tuple[list[RenderResult], int]:
+    """Render diagrams to SVG through the content-addressed render cache.
+
+    Only diagrams whose content has no cached SVG are rendered, jobs at a
+    time. With output_dir, each SVG is also copied to
+    output_dir/<feature>/<name>.svg and the result points there. Afterwards
+    the least recently used SVGs are evicted until the cache fits
+    max_cache_bytes, never those of this run. Returns
+    (cspec.diagrams.RenderResult list, number of evicted SVGs); a failed
+    render or copy is a result with an error.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from cspec.atomic import copy_file
+    from cspec.diagrams import (
+        DEFAULT_CACHE_BYTES,
+        RenderResult,
+        evict,
+        find_renderer,
+        render,
+        render_cache_dir,
+        render_key,
+    )
+
+    diagrams = list_diagrams(project_root, feature)
+    renderer = find_renderer()
+    cache_dir = render_cache_dir()
+
+    def one(info: DiagramInfo) -> RenderResult:
+        source = project_root / "cspec" / "specs" / info.spec / info.name
+        try:
+            svg, rendered = render(source, info.digest, renderer, cache_dir)
+        except RuntimeError as e:
+            return RenderResult(info, "failed", error=str(e))
+        result = RenderResult(info, "rendered" if rendered else "cached", svg)
+        if output_dir is not None:
+            dest = output_dir / info.spec / (Path(info.name).stem + ".svg")
+            try:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                copy_file(svg, dest)
+            except OSError as e:
+                return RenderResult(info, "failed", error=f"cannot copy to {dest}: {e}")
+            result.svg = dest
+        return result
+
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            results = list(pool.map(one, diagrams))
+    finally:
+        keep = {cache_dir / render_key(info.digest) for info in diagrams}
+        evicted = evict(cache_dir, DEFAULT_CACHE_BYTES if max_cache_bytes is None else max_cache_bytes, keep)
+    return results, len(evicted)
+
+
+def list_templates() -> dict[str, dict]:
+    """Bundled issue templates by name: description, labels and rendered formats."""
+    from cspec.bundle import load_templates
+    from cspec.manifest import ISSUE_TEMPLATES_DIR
+
+    if not ISSUE_TEMPLATES_DIR.exists():
+        return {}
+    return load_templates(ISSUE_TEMPLATES_DIR)
+
+
+def get_template(name: str, output_format: str = "markdown") -> str:
+    """A fillable issue template as markdown, yaml or json."""
+    compiled = list_templates()
+    if name not in compiled:
+        raise NotFound(f"Template not found: {name}", sorted(compiled))
+    return compiled[name][output_format]
@@ -0,0 +1,92 @@
+"""Atomic file writes: readers see the old file or the new one, never a partial write.
+
+file_lock() serializes writers that do more than one write, such as
+`cspec update`, across processes sharing a checkout.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def _create_temp(path: Path) -> tuple[int, str]:
+    """Create an empty temporary file next to path; return (fd, name).
+
+    Unlike tempfile.mkstemp (mode 0600) the file is created with mode 0666,
+    so the kernel applies the process umask: reading the umask with
+    os.umask() would briefly change it for every thread.
+    """
+    for _ in range(100):
+        name = os.path.join(path.parent, f".{path.name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temporary name for {path}")
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path through a temporary file in the same directory and os.replace.
+
+    Keeps the existing file's permissions; a new file gets 0666 less the
+    umask. Raises OSError on failure, leaving the original untouched.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_name, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def write_text(path: Path, text: str) -> None:
+    """Write UTF-8 text atomically (see write_bytes)."""
+    write_bytes(path, text.encode("utf-8"))
+
+
+def copy_file(src: Path, dest: Path) -> bool:
+    """Copy src over dest atomically unless dest already has the same content.
+
+    Returns True if dest was written.
+    """
+    data = src.read_bytes()
+    try:
+        if dest.stat().st_size == len(data) and dest.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    write_bytes(dest, data)
+    return True
+
+
+@contextmanager
+def file_lock(path: Path):
+    """Hold an exclusive advisory lock on path (created if missing) for the block.
+
+    Blocks until the lock is free. Where fcntl is unavailable the block runs
+    unlocked; the writes themselves are still atomic.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
@@ -0,0 +1,227 @@
+"""Precompiled bundle of the packaged issue templates.
+
+`templates list` and `templates get` read one pickle holding every template's
+description, labels and its rendered markdown, yaml and json output, instead
+of parsing each YAML file per call.
+
+The bundle records the cspec version and each file's size, mtime and content
+hash. Loading it costs one read plus a stat of the template directory; a file
+whose stat changed is hashed, and only a real edit (or a new cspec version)
+recompiles. Build it ahead of time with `python -m cspec.bundle`; otherwise
+the first call compiles it into the user cache directory.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+
+from cspec import __version__
+
+# Bump when the compiled template layout changes
+BUNDLE_VERSION = 1
+
+# Bundle shipped next to the templates, written by `python -m cspec.bundle`
+SHIPPED_BUNDLE_NAME = "issue_templates.bundle"
+
+# In-process copy per template directory (matters under cspec serve)
+_memo: dict[Path, dict] = {}
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _stat_templates(template_dir: Path) -> dict[str, tuple[int, int]]:
+    stats = {}
+    with os.scandir(template_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".yml") and entry.is_file():
+                st = entry.stat()
+                stats[entry.name] = (st.st_size, st.st_mtime_ns)
+    return stats
+
+
+def render_markdown(name: str, content: dict) -> str:
+    """Render a parsed issue template as a fillable markdown document."""
+    template_name = content.get("name", name.title())
+    description = content.get("description", "")
+
+    lines = [f"# {template_name}", ""]
+    if description:
+        lines.append(f"> {description}")
+        lines.append("")
+
+    body = content.get("body", [])
+    for field in body:
+        field_type = field.get("type")
+        attrs = field.get("attributes", {})
+        validations = field.get("validations", {})
+
+        label = attrs.get("label", "")
+        field_desc = attrs.get("description", "")
+        placeholder = attrs.get("placeholder", "")
+        required = validations.get("required", False)
+        options = attrs.get("options", [])
+
+        # Section header
+        req_marker = " *" if required else ""
+        lines.append(f"## {label}{req_marker}")
+
+        # Description as comment
+        if field_desc:
+            lines.append(f"<!-- {field_desc} -->")
+
+        # Options for dropdowns
+        if field_type == "dropdown" and options:
+            opts_str = ", ".join(options)
+            lines.append(f"<!-- Options: {opts_str} -->")
+            lines.append("")
+            lines.append(f"[SELECT: {opts_str}]")
+
+        # Placeholder content
+        elif placeholder:
+            lines.append("")
+            lines.append(placeholder.rstrip())
+
+        else:
+            lines.append("")
+
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def compile_templates(template_dir: Path) -> dict:
+    """Parse and render every template in template_dir into a bundle."""
+    import json
+
+    import yaml
+
+    files = {}
+    compiled = {}
+    for file_name, (size, mtime) in sorted(_stat_templates(template_dir).items()):
+        path = template_dir / file_name
+        raw = path.read_bytes()
+        text = raw.decode()
+        content = yaml.safe_load(text)
+        name = path.stem
+        files[file_name] = (size, mtime, hashlib.sha256(raw).hexdigest())
+        compiled[name] = {
+            "description": content.get("description", "No description"),
+            "labels": content.get("labels", []),
+            "yaml": text,
+            "json": json.dumps(content, indent=2),
+            "markdown": render_markdown(name, content),
+        }
+    return {"version": (__version__, BUNDLE_VERSION), "files": files, "templates": compiled}
+
+
+def _is_current(bundle: dict, template_dir: Path, stats: dict[str, tuple[int, int]]) -> tuple[bool, bool]:
+    """Check a bundle against the directory. Returns (current, stats_changed)."""
+    if bundle.get("version") != (__version__, BUNDLE_VERSION):
+        return False, False
+    recorded = bundle["files"]
+    if recorded.keys() != stats.keys():
+        return False, False
+    stats_changed = False
+    for file_name, (size, mtime) in stats.items():
+        old_size, old_mtime, digest = recorded[file_name]
+        if (size, mtime) == (old_size, old_mtime):
+            continue
+        # Touched or re-copied (e.g. on install): only a content change invalidates
+        if size != old_size or _sha256(template_dir / file_name) != digest:
+            return False, False
+        stats_changed = True
+    return True, stats_changed
+
+
+def user_bundle_path(template_dir: Path) -> Path:
+    """Return the user cache location for a template directory's bundle."""
+    digest = hashlib.sha256(str(template_dir.resolve()).encode()).hexdigest()[:16]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "cspec" / f"templates-{digest}.pickle"
+
+
+def _read(path: Path) -> dict | None:
+    try:
+        with path.open("rb") as f:
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A corrupt or incompatible bundle is just a miss
+        return None
+    return data if isinstance(data, dict) and "files" in data else None
+
+
+def write_bundle(path: Path, bundle: dict) -> bool:
+    """Write a bundle atomically. Returns False if it could not be written."""
+    import tempfile
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        # Read-only home or cache dir: templates still work, just recompiled per call
+        return False
+    return True
+
+
+def load_templates(template_dir: Path) -> dict[str, dict]:
+    """Return the compiled templates for template_dir, keyed by name.
+
+    Tries the in-process copy, the user cache and the shipped bundle, in that
+    order, and compiles a fresh bundle into the user cache if none is current.
+    """
+    stats = _stat_templates(template_dir)
+    memo = _memo.get(template_dir)
+    if memo is not None and _is_current(memo, template_dir, stats) == (True, False):
+        return memo["templates"]
+
+    user_path = user_bundle_path(template_dir)
+    for path in (user_path, template_dir.parent / SHIPPED_BUNDLE_NAME):
+        bundle = _read(path)
+        if bundle is None:
+            continue
+        current, stats_changed = _is_current(bundle, template_dir, stats)
+        if current:
+            if stats_changed:
+                # Record the new stats so the next call skips hashing
+                bundle["files"] = {
+                    name: (*stats[name], digest) for name, (_, _, digest) in bundle["files"].items()
+                }
+                write_bundle(user_path, bundle)
+            _memo[template_dir] = bundle
+            return bundle["templates"]
+
+    bundle = compile_templates(template_dir)
+    write_bundle(user_path, bundle)
+    _memo[template_dir] = bundle
+    return bundle["templates"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compile the packaged templates: python -m cspec.bundle [OUTPUT]."""
+    from cspec.manifest import ISSUE_TEMPLATES_DIR
+
+    argv = sys.argv[1:] if argv is None else argv
+    output = Path(argv[0]) if argv else ISSUE_TEMPLATES_DIR.parent / SHIPPED_BUNDLE_NAME
+    bundle = compile_templates(ISSUE_TEMPLATES_DIR)
+    if not write_bundle(output, bundle):
+        print(f"Cannot write {output}", file=sys.stderr)
+        return 1
+    print(f"Compiled {len(bundle['templates'])} template(s) into {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Local cache files stored under cspec/.index.
+
+cspec/.index sits inside the project, so anyone who controls the checkout
+controls its files. Each cache file therefore carries an HMAC-SHA256 of its
+pickled payload under a per-user key kept in the user cache directory, and
+is only unpickled once the MAC checks out; a planted or foreign file is a
+cache miss and gets rewritten.
+"""
+
+import os
+import pickle
+from pathlib import Path
+
+from cspec import __version__, trace
+
+# Cache directory, relative to the project root
+INDEX_DIR = Path("cspec") / ".index"
+
+# Keeps the cache out of version control without touching the project's .gitignore
+INDEX_GITIGNORE = "*\n"
+
+# Per-user key authenticating cache files, under the user cache directory
+KEY_FILE = Path("cspec") / "cache.key"
+KEY_BYTES = 32
+MAC_BYTES = 32
+
+# In-process copies of loaded caches, keyed by file, so long-running processes
+# (cspec serve) skip unpickling while the file on disk is unchanged
+_memo: dict[Path, tuple[tuple, tuple, dict]] = {}
+
+
+_key: bytes | None = None
+
+
+def _cache_key() -> bytes | None:
+    """Return the key authenticating cache files, creating it on first use.
+
+    Returns None (no persistent cache) if it cannot be read or created, or if
+    someone else could have written it.
+    """
+    global _key
+    if _key is not None:
+        return _key
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key_file = Path(cache_home) / KEY_FILE
+    try:
+        try:
+            fd = os.open(key_file, os.O_RDONLY)
+        except FileNotFoundError:
+            key_file.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                # Another process created it first
+                fd = os.open(key_file, os.O_RDONLY)
+            else:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(os.urandom(KEY_BYTES))
+                fd = os.open(key_file, os.O_RDONLY)
+        with os.fdopen(fd, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_uid != os.geteuid() or st.st_mode & 0o077:
+                return None
+            key = f.read()
+    except OSError:
+        return None
+    if len(key) != KEY_BYTES:
+        return None
+    _key = key
+    return key
+
+
+def _mac(key: bytes, payload: bytes) -> bytes:
+    import hashlib
+    import hmac
+
+    return hmac.new(key, payload, hashlib.sha256).digest()
+
+
+def _verified(key: bytes, blob: bytes) -> bytes | None:
+    """The payload of a cache file, or None if its MAC does not match."""
+    import hmac
+
+    mac, payload = blob[:MAC_BYTES], blob[MAC_BYTES:]
+    return payload if hmac.compare_digest(mac, _mac(key, payload)) else None
+
+
+def _file_key(st: os.stat_result) -> tuple:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def index_dir(project_root: Path) -> Path:
+    """Return the cache directory for a project."""
+    return project_root / INDEX_DIR
+
+
+def ensure_index_dir(project_root: Path) -> Path:
+    """Create the cache directory (ignored by git) if needed and return it. Raises OSError."""
+    cache_dir = index_dir(project_root)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text(INDEX_GITIGNORE)
+    return cache_dir
+
+
+def load_cache(project_root: Path, name: str, version: int) -> dict:
+    """Load a named cache. Returns an empty dict if missing, stale, or unreadable."""
+    with trace.span(f"load {name}", "cache"):
+        return _load_cache(project_root, name, version)
+
+
+def _load_cache(project_root: Path, name: str, version: int) -> dict:
+    cache_file = index_dir(project_root) / f"{name}.pickle"
+    tag = (__version__, version)
+    try:
+        with cache_file.open("rb") as f:
+            file_key = _file_key(os.fstat(f.fileno()))
+            memo = _memo.get(cache_file)
+            if memo is not None and memo[0] == file_key and memo[1] == tag:
+                return dict(memo[2])
+            key = _cache_key()
+            if key is None:
+                return {}
+            payload = _verified(key, f.read())
+        if payload is None:
+            # Not written by this user's cspec: never unpickle it
+            return {}
+        data = pickle.loads(payload)
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        # A corrupt or incompatible cache is just a cache miss
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != tag:
+        return {}
+    entries = data.get("entries", {})
+    _memo[cache_file] = (file_key, tag, entries)
+    return dict(entries)
+
+
+def save_cache(project_root: Path, name: str, version: int, entries: dict) -> bool:
+    """Write a named cache atomically. Returns False if the cache could not be written."""
+    with trace.span(f"save {name}", "cache"):
+        return _save_cache(project_root, name, version, entries)
+
+
+def _save_cache(project_root: Path, name: str, version: int, entries: dict) -> bool:
+    import tempfile
+
+    key = _cache_key()
+    if key is None:
+        return False
+    payload = pickle.dumps({"version": (__version__, version), "entries": entries}, protocol=pickle.HIGHEST_PROTOCOL)
+    cache_dir = index_dir(project_root)
+    try:
+        ensure_index_dir(project_root)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_mac(key, payload))
+                f.write(payload)
+                f.flush()
+                file_key = _file_key(os.fstat(f.fileno()))
+            os.replace(tmp_name, cache_dir / f"{name}.pickle")
+            _memo[cache_dir / f"{name}.pickle"] = (file_key, (__version__, version), dict(entries))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        # Read-only checkouts still work, just without a persistent cache
+        return False
+    return True
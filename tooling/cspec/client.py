@@ -0,0 +1,82 @@
+"""Client side of the cspec daemon: find a project's socket and forward argv to it.
+
+Kept apart from cspec.server so the CLI can check for a daemon on every call
+without importing socketserver and threading. socket and json are imported
+only once a socket file is found.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from cspec import __version__
+
+# Read-only commands the daemon answers, by command path; everything else
+# (writes such as specs merge, slow ones such as specs diagrams render)
+# always runs locally
+SERVED_COMMANDS = {
+    ("status",),
+    ("search",),
+    ("context", "pack"),
+    ("specs", "list"),
+    ("specs", "show"),
+    ("specs", "template"),
+    ("specs", "diagrams", "list"),
+    ("work", "list"),
+    ("work", "show"),
+    ("templates", "list"),
+    ("templates", "get"),
+}
+
+# Set inside the daemon (so it never forwards to itself) or by users to opt out
+NO_DAEMON_ENV = "CSPEC_NO_DAEMON"
+
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30.0
+
+
+def is_served(argv: list[str]) -> bool:
+    """True if argv runs a command in SERVED_COMMANDS."""
+    return any(tuple(argv[:len(path)]) == path for path in SERVED_COMMANDS)
+
+
+def socket_path(project_root: Path) -> Path:
+    """Return the daemon socket path for a project.
+
+    Lives in the runtime directory rather than the project to stay under the
+    Unix socket path length limit.
+    """
+    digest = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        import tempfile
+
+        runtime_dir = tempfile.gettempdir()
+    return Path(runtime_dir) / f"cspec-{digest}.sock"
+
+
+def forward(project_root: Path, argv: list[str], color: bool = False) -> tuple[str, str, int] | None:
+    """Run argv on the project's daemon. Returns (stdout, stderr, exit_code), or None if no daemon answered."""
+    path = socket_path(project_root)
+    if not path.exists():
+        return None
+
+    import json
+    import socket
+
+    request = {"version": __version__, "argv": argv, "color": color}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(path))
+            sock.settimeout(REQUEST_TIMEOUT)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                reply = json.loads(f.readline())
+    except (OSError, ValueError):
+        # Stale socket, daemon busy past the timeout, or garbled reply
+        return None
+
+    if "error" in reply:
+        return None
+    return reply["stdout"], reply["stderr"], reply["exit_code"]
@@ -0,0 +1,325 @@
+"""Index of Mermaid diagrams (*.mmd) next to permanent specs, and their SVG renders.
+
+Each diagram is parsed once per change: its kind (flowchart, sequenceDiagram,
+...), node and edge counts, and which of its spec's requirements it names.
+Results live in cspec/.index keyed by the stat of the diagram and of
+spec.md, so a listing re-reads only diagrams (or specs) that changed.
+
+Renders are cached by content: the SVG of a diagram is stored under the
+SHA-256 of its source in the user cache directory, shared by every project,
+so only changed diagrams reach the renderer. The renderer is mermaid-cli
+(`mmdc`) from PATH or CSPEC_MERMAID_RENDERER. Each cache hit refreshes the
+file's mtime, and after rendering the least recently used SVGs are removed
+until the cache fits its size cap.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cspec.cache import load_cache, save_cache
+
+# Bump when DiagramInfo or the parser changes
+DIAGRAM_CACHE_VERSION = 1
+
+# Renderer command, if mmdc is not on PATH or another tool is wanted
+RENDERER_ENV = "CSPEC_MERMAID_RENDERER"
+
+# Default size cap of the SVG cache
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+# Part of every render key; bump when the render command changes
+RENDER_VERSION = "mmdc-svg-1"
+
+# Seconds a single render may take
+RENDER_TIMEOUT = 120
+
+NO_RENDERER = (
+    "No Mermaid renderer found: install mermaid-cli "
+    f"(npm install -g @mermaid-js/mermaid-cli) or set {RENDERER_ENV}"
+)
+
+# Lines that declare layout or styling rather than nodes and edges
+_DIRECTIVES = re.compile(
+    r"^(subgraph|end|direction|classDef|style|linkStyle|click|class\s+\S+\s*,|class\s+\S+\s+\S+$|"
+    r"title|accTitle|accDescr|note|Note|loop|alt|else|opt|par|and|rect|critical|break|"
+    r"activate|deactivate|autonumber|box)\b"
+)
+
+# Arrows of flowcharts, sequence, class, state and ER diagrams. End markers
+# (o, x, |, {, ...) only count when they don't run into a node id.
+_ARROW = re.compile(
+    r"\s*(?:(?:(?<!\w)[<xo*|}{]{1,2})?(?:-{2,}|={2,}|-\.+-|\.{2,})(?:>|[xo|{}*](?!\w)){0,2}"
+    r"|--?>>|--?x(?!\w)|--?\)|->)\s*"
+)
+
+# Node shapes: A[..], A(..), A{..}, A((..)), A>..], ...; group 1 is the id
+_SHAPE = re.compile(r"(\w+)\s*(?:\(\(|\[\[|\[\(|\(\[|\{\{|\[/|\[\\|\[|\(|\{|>)[^\]\)\}]*(?:\)\)|\]\]|\)\]|\]\)|\}\}|/\]|\\\]|\]|\)|\})")
+
+# -- text --> and == text ==> edge labels
+_INLINE_LABEL = re.compile(r"(--|==|-\.)\s+[^-=.>|]+?\s+(-->|==>|\.->|---|===)")
+
+_ID = re.compile(r"[\w.-]*\w|\[\*\]")
+
+
+@dataclass
+class DiagramInfo:
+    """One .mmd file of a permanent spec."""
+    spec: str
+    name: str
+    kind: str = ""
+    nodes: int = 0
+    edges: int = 0
+    # Requirement names of the spec that appear in the diagram, in spec order
+    requirements: list[str] = field(default_factory=list)
+    digest: str = ""
+
+
+@dataclass
+class RenderResult:
+    """Outcome of rendering one diagram: rendered, cached or failed."""
+    diagram: DiagramInfo
+    outcome: str
+    svg: Path | None = None
+    error: str | None = None
+
+
+def _strip(text: str) -> list[str]:
+    """Lines without %% comments, blank lines and front matter."""
+    lines = []
+    in_front_matter = False
+    for raw in text.splitlines():
+        line = raw.split("%%", 1)[0].strip()
+        if line == "---" and (in_front_matter or not lines):
+            in_front_matter = not in_front_matter
+            continue
+        if line and not in_front_matter:
+            lines.append(line)
+    return lines
+
+
+def parse_diagram(text: str) -> tuple[str, int, int]:
+    """Return (kind, node count, edge count) of a Mermaid diagram.
+
+    Nodes are distinct ids that are declared (A[label], participant A,
+    class A, state A, an ER entity) or joined by an arrow; `A & B --> C`
+    counts two edges. Other statements are ignored.
+    """
+    lines = _strip(text)
+    if not lines:
+        return "", 0, 0
+    kind = lines[0].split()[0]
+    nodes: set[str] = set()
+    edges = 0
+    in_block = False
+
+    for line in lines[1:]:
+        if in_block:
+            # Attributes of a class or ER entity
+            in_block = not line.endswith("}")
+            continue
+        if line == "}":
+            continue
+        if line.endswith("{") and not _ARROW.search(line):
+            # `class A {`, `ENTITY {` and composite `state S {`
+            words = line[:-1].split()
+            if words:
+                nodes.add(words[-1])
+            in_block = kind in ("classDiagram", "erDiagram")
+            continue
+        words = line.split()
+        if words[0] in ("participant", "actor", "state", "class") and len(words) > 1 and not _ARROW.search(line):
+            if words[0] != "class" or kind == "classDiagram":
+                # `participant A as Alice` is known by A, `state "Long name" as S` by S
+                alias = words[0] == "state" and "as" in words[:-1]
+                nodes.add(words[words.index("as") + 1] if alias else words[1].rstrip(":{"))
+            continue
+        if _DIRECTIVES.match(line):
+            continue
+
+        line = re.sub(r"\|[^|]*\|", " ", line)
+        line = _INLINE_LABEL.sub(r" \2 ", line)
+        line = re.sub(r'"[^"]*"', '""', line)
+        line = _SHAPE.sub(lambda m: m.group(1), line)
+        parts = _ARROW.split(line)
+        groups = []
+        for part in parts:
+            # Sequence messages, class/ER/state labels: `A->>B: text`
+            part = part.split(":", 1)[0]
+            ids = [m.group(0) for m in (_ID.match(p.strip()) for p in part.split("&")) if m]
+            nodes.update(i for i in ids if i != "[*]")
+            groups.append(ids)
+        for left, right in zip(groups, groups[1:]):
+            edges += len(left) * len(right)
+    return kind, len(nodes), edges
+
+
+def requirement_refs(text: str, requirements: list[str]) -> list[str]:
+    """Requirement names (from the spec) that appear in the diagram, case-insensitively."""
+    lowered = " ".join(text.lower().split())
+    return [name for name in requirements if " ".join(name.lower().split()) in lowered]
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class DiagramIndex:
+    """Diagram records of a project, through the diagrams cache.
+
+    Call save() when done to persist new entries.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self._entries = load_cache(project_root, "diagrams", DIAGRAM_CACHE_VERSION)
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._specs = None
+
+    def _requirements(self, spec_file: Path) -> list[str]:
+        from cspec.specdoc import SpecLoader
+
+        if not spec_file.exists():
+            return []
+        if self._specs is None:
+            self._specs = SpecLoader(self.project_root)
+        return [r.name for r in self._specs.load(spec_file).requirements]
+
+    def load(self, spec: str, name: str) -> DiagramInfo:
+        """Index cspec/specs/<spec>/<name>. Raises OSError if it cannot be read."""
+        path = self.project_root / "cspec" / "specs" / spec / name
+        spec_file = path.parent / "spec.md"
+        cache_key = f"{spec}/{name}"
+        self._seen.add(cache_key)
+        key = (_stat_key(path), _stat_key(spec_file))
+        hit = self._entries.get(cache_key)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+
+        data = path.read_bytes()
+        text = data.decode("utf-8", errors="replace")
+        kind, nodes, edges = parse_diagram(text)
+        info = DiagramInfo(
+            spec=spec,
+            name=name,
+            kind=kind,
+            nodes=nodes,
+            edges=edges,
+            requirements=requirement_refs(text, self._requirements(spec_file)),
+            digest=hashlib.sha256(data).hexdigest(),
+        )
+        self._entries[cache_key] = (key, info)
+        self._dirty = True
+        return info
+
+    def save(self, prune: bool = False) -> None:
+        """Persist the cache. With prune, drop diagrams not loaded during this run."""
+        if self._specs is not None:
+            self._specs.save()
+        if prune and len(self._seen) != len(self._entries):
+            self._entries = {k: v for k, v in self._entries.items() if k in self._seen}
+            self._dirty = True
+        if self._dirty:
+            save_cache(self.project_root, "diagrams", DIAGRAM_CACHE_VERSION, self._entries)
+            self._dirty = False
+
+
+def render_cache_dir() -> Path:
+    """Directory of rendered SVGs, shared by all projects."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "cspec" / "diagrams"
+
+
+def render_key(digest: str) -> str:
+    """Cache file name for a diagram's content hash."""
+    return hashlib.sha256(f"{RENDER_VERSION}:{digest}".encode()).hexdigest() + ".svg"
+
+
+def find_renderer() -> list[str] | None:
+    """Return the renderer command (argv prefix), or None if none is installed."""
+    import shlex
+    import shutil
+
+    configured = os.environ.get(RENDERER_ENV)
+    if configured:
+        return shlex.split(configured)
+    mmdc = shutil.which("mmdc")
+    return [mmdc] if mmdc else None
+
+
+def render(source: Path, digest: str, renderer: list[str] | None, cache_dir: Path) -> tuple[Path, bool]:
+    """Return (svg path, rendered) for a diagram, rendering it only on a cache miss.
+
+    A cached SVG needs no renderer. Raises RuntimeError if there is none or
+    it fails.
+    """
+    import subprocess
+    import tempfile
+
+    svg = cache_dir / render_key(digest)
+    try:
+        # A hit counts as a use for LRU eviction
+        os.utime(svg)
+        return svg, False
+    except FileNotFoundError:
+        pass
+    if renderer is None:
+        raise RuntimeError(NO_RENDERER)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=cache_dir, prefix=".render-") as tmp:
+        out = Path(tmp) / "out.svg"
+        try:
+            proc = subprocess.run(
+                [*renderer, "-i", str(source), "-o", str(out)],
+                capture_output=True,
+                text=True,
+                timeout=RENDER_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise RuntimeError(str(e)) from None
+        if proc.returncode != 0 or not out.exists():
+            message = (proc.stderr or proc.stdout).strip().splitlines()
+            raise RuntimeError(message[-1] if message else f"renderer exited with {proc.returncode}")
+        os.replace(out, svg)
+    return svg, True
+
+
+def evict(cache_dir: Path, max_bytes: int, keep: set[Path] = frozenset()) -> list[Path]:
+    """Remove the least recently used SVGs until the cache fits max_bytes.
+
+    SVGs in keep (those the current run produced or used) are never removed,
+    even if the cache stays over the cap.
+    """
+    files = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".svg") and entry.is_file():
+                    st = entry.stat()
+                    files.append((st.st_mtime_ns, st.st_size, Path(entry.path)))
+                    total += st.st_size
+    except FileNotFoundError:
+        return []
+
+    removed = []
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        if path in keep:
+            continue
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed.append(path)
+    return removed
@@ -0,0 +1,45 @@
+"""Issue field values, importable without Pydantic.
+
+cspec.schemas builds the issue model on these; listings that only compare
+or order values (work list --status, --sort status) use them directly.
+"""
+
+from enum import Enum
+
+
+class Nature(str, Enum):
+    """Type of change."""
+    FEATURE = "feature"
+    ENHANCEMENT = "enhancement"
+    BUG = "bug"
+    REFACTOR = "refactor"
+    OPTIMIZATION = "optimization"
+    SECURITY = "security"
+    HOTFIX = "hotfix"
+    MIGRATION = "migration"
+    CONFIGURATION = "configuration"
+    DEPRECATION = "deprecation"
+    REMOVAL = "removal"
+
+
+class Impact(str, Enum):
+    """Consumer impact level."""
+    BREAKING = "breaking"
+    ADDITIVE = "additive"
+    INVISIBLE = "invisible"
+
+
+class Version(str, Enum):
+    """Semantic version increment."""
+    MAJOR = "major"
+    MINOR = "minor"
+    PATCH = "patch"
+
+
+class Status(str, Enum):
+    """Issue lifecycle status."""
+    DRAFT = "draft"
+    READY = "ready"
+    IN_PROGRESS = "in-progress"
+    BLOCKED = "blocked"
+    DONE = "done"
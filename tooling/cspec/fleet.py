@@ -0,0 +1,110 @@
+"""Run project checks across many repositories at once.
+
+The checks are I/O-bound (stat, scandir, small reads), so repositories are
+checked in a thread pool and results are yielded as each one finishes, each
+with its own wall-clock timing.
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+# Threads used when --jobs is not given
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@dataclass
+class RepoResult:
+    """Outcome of checking one repository.
+
+    error is set when the check itself failed (missing root, not a cspec
+    project, unreadable files); ok is False then too.
+    """
+    root: Path
+    ok: bool
+    ms: float
+    data: dict | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return {"root": str(self.root), "ok": self.ok, "ms": self.ms, "data": self.data, "error": self.error}
+
+
+def resolve_repos(spec: str) -> list[Path]:
+    """Expand --repos into project roots.
+
+    spec is a file listing one root per line (blank lines and # comments
+    ignored), or a glob pattern (** allowed). Roots are kept in order,
+    without duplicates. Listed roots are kept even if they are missing, so
+    run_fleet reports them; glob matches that are not directories are
+    skipped.
+    """
+    path = Path(spec)
+    if path.is_file():
+        lines = path.read_text(encoding="utf-8").splitlines()
+        base = path.parent
+        candidates = [base / line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+    else:
+        matches = sorted(glob.glob(os.path.expanduser(spec), recursive=True))
+        candidates = [Path(p) for p in matches if os.path.isdir(p)]
+
+    roots = []
+    seen = set()
+    for candidate in candidates:
+        root = candidate.expanduser().resolve()
+        if root not in seen:
+            seen.add(root)
+            roots.append(root)
+    return roots
+
+
+def _timed(check: Callable[[Path], tuple[bool, dict]], root: Path) -> RepoResult:
+    if not root.is_dir():
+        return RepoResult(root, False, 0.0, error="not a directory" if root.exists() else "no such directory")
+    start = time.perf_counter()
+    try:
+        ok, data = check(root)
+        error = None
+    except Exception as e:
+        ok, data, error = False, None, f"{type(e).__name__}: {e}"
+    ms = round((time.perf_counter() - start) * 1000, 2)
+    return RepoResult(root, ok, ms, data, error)
+
+
+def run_fleet(
+    roots: list[Path],
+    check: Callable[[Path], tuple[bool, dict]],
+    jobs: int | None = None,
+) -> Iterator[RepoResult]:
+    """Run check(root) -> (ok, data) for every root, yielding results as they finish."""
+    if not roots:
+        return
+    with ThreadPoolExecutor(max_workers=min(jobs or DEFAULT_JOBS, len(roots))) as pool:
+        futures = [pool.submit(_timed, check, root) for root in roots]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def status_check(root: Path) -> tuple[bool, dict]:
+    from cspec import api
+
+    # The fleet's threads provide the parallelism
+    status = api.status(root, scan_threads=1)
+    return status.healthy, {**status.to_dict(), "problems": status.problems}
+
+
+def validate_check(root: Path) -> tuple[bool, dict]:
+    from cspec import api
+    from cspec.validation import summarize
+
+    # One process per repository; the fleet's threads provide the parallelism
+    results = api.validate(root, jobs=1)
+    summary = summarize(results)
+    failed = [r.to_dict() for r in results if not r.ok]
+    for record in failed:
+        record["path"] = os.path.relpath(record["path"], root)
+    return not summary["failed"], {"summary": summary, "failed": failed}
@@ -0,0 +1,155 @@
+"""Issue frontmatter loading with a persistent validation cache.
+
+Validated issues are cached in cspec/.index keyed by file mtime/size and
+content hash. A file whose stat is unchanged costs one stat call; a file that
+was touched but not edited costs one read and a hash. Only real edits pay for
+YAML parsing and Pydantic validation.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+from pydantic import ValidationError
+
+from cspec import trace
+from cspec.cache import load_cache, save_cache
+from cspec.schemas import IssueFrontmatter
+
+# Bump when LoadedIssue or IssueFrontmatter change shape
+FRONTMATTER_CACHE_VERSION = 1
+
+FRONTMATTER_RE = re.compile(r"\A---[ \t]*\r?\n(.*?)^---[ \t]*\r?$", re.DOTALL | re.MULTILINE)
+
+
+@dataclass
+class LoadedIssue:
+    """Result of loading an issue file: the validated model or the errors found."""
+    path: Path
+    issue: IssueFrontmatter | None = None
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.issue is not None
+
+
+def split_frontmatter(text: str) -> tuple[str | None, str]:
+    """Split a markdown document into (frontmatter, body). Frontmatter is None if absent."""
+    match = FRONTMATTER_RE.match(text)
+    if not match:
+        return None, text
+    return match.group(1), text[match.end():].lstrip("\r\n")
+
+
+def _format_validation_error(exc: ValidationError) -> list[str]:
+    errors = []
+    for err in exc.errors():
+        loc = ".".join(str(part) for part in err["loc"])
+        msg = err["msg"].removeprefix("Value error, ")
+        errors.append(f"{loc}: {msg}" if loc else msg)
+    return errors
+
+
+def parse_issue(path: Path, text: str) -> LoadedIssue:
+    """Parse and validate the frontmatter of an issue document."""
+    raw, _ = split_frontmatter(text)
+    if raw is None:
+        return LoadedIssue(path, errors=["Missing YAML frontmatter (expected leading '---' block)"])
+
+    try:
+        with trace.span("yaml.safe_load", "yaml"):
+            data = yaml.safe_load(raw)
+    except yaml.YAMLError as e:
+        return LoadedIssue(path, errors=[f"Invalid YAML frontmatter: {e}"])
+
+    if not isinstance(data, dict):
+        return LoadedIssue(path, errors=["Frontmatter must be a YAML mapping"])
+
+    try:
+        with trace.span("IssueFrontmatter", "pydantic"):
+            issue = IssueFrontmatter.model_validate(data)
+        return LoadedIssue(path, issue=issue)
+    except ValidationError as e:
+        return LoadedIssue(path, errors=_format_validation_error(e))
+
+
+def read_issue(path: Path, previous: tuple | None = None) -> tuple:
+    """Read an issue into a cache entry of (stat_key, digest, LoadedIssue).
+
+    If previous is an entry for the same file with a matching content hash,
+    its result is reused instead of parsing again.
+    """
+    st = os.stat(path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if previous is not None and previous[1] == digest:
+        # Touched but not edited
+        result = previous[2]
+    else:
+        result = parse_issue(path, data.decode("utf-8", errors="replace"))
+    return ((st.st_mtime_ns, st.st_size), digest, result)
+
+
+class IssueLoader:
+    """Loads issue files through the frontmatter cache of a project.
+
+    Call save() when done to persist new entries; nothing is written if every
+    lookup was a cache hit.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self._entries = load_cache(project_root, "issues", FRONTMATTER_CACHE_VERSION)
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    def cached(self, path: Path) -> LoadedIssue | None:
+        """Return the cached result if the file is unchanged, else None. Costs one stat."""
+        key = os.path.abspath(path)
+        self._seen.add(key)
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        st = os.stat(path)
+        if hit[0] != (st.st_mtime_ns, st.st_size):
+            return None
+        return hit[2]
+
+    def get_entry(self, path: Path) -> tuple | None:
+        """Return the raw cache entry for a file, fresh or not."""
+        return self._entries.get(os.path.abspath(path))
+
+    def store(self, path: Path, entry: tuple) -> None:
+        """Record an entry produced by read_issue()."""
+        key = os.path.abspath(path)
+        self._seen.add(key)
+        self._entries[key] = entry
+        self._dirty = True
+
+    def load(self, path: Path) -> LoadedIssue:
+        """Load an issue file. Raises OSError if the file cannot be read."""
+        result = self.cached(path)
+        if result is not None:
+            return result
+        entry = read_issue(path, self.get_entry(path))
+        self.store(path, entry)
+        return entry[2]
+
+    def save(self, prune: Path | None = None) -> None:
+        """Persist the cache. With prune, drop entries under that directory not loaded during this run.
+
+        Entries elsewhere (issues validated outside cspec/work/) are kept.
+        """
+        if prune is not None:
+            prefix = os.path.join(os.path.abspath(prune), "")
+            stale = [k for k in self._entries if k.startswith(prefix) and k not in self._seen]
+            for key in stale:
+                del self._entries[key]
+            self._dirty = self._dirty or bool(stale)
+        if self._dirty:
+            save_cache(self.project_root, "issues", FRONTMATTER_CACHE_VERSION, self._entries)
+            self._dirty = False
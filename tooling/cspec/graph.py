@@ -0,0 +1,242 @@
+"""Issue dependency graph built from depends_on/blocks fields.
+
+DependencyIndex maps each issue file to its id, status and outgoing references
+and is kept in cspec/.index. It is refreshed as a side effect of validation and
+by sync(), which only re-reads files whose stat changed, so the graph can be
+rebuilt without loading every issue.
+
+IssueGraph normalizes both fields into "A depends on B" edges and provides
+consistency checks, cycle detection (Tarjan's SCC), topological ordering and
+the set of issues ready to be picked up. All operations are linear in the
+number of issues plus edges.
+"""
+
+import heapq
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cspec.cache import load_cache, save_cache
+from cspec.frontmatter import IssueLoader
+from cspec.schemas import IssueFrontmatter, Status
+
+# Bump when the entry layout changes
+DEPS_CACHE_VERSION = 2
+
+
+class DependencyIndex:
+    """Persistent map of issue file -> (id, depends_on, blocks, status), with reverse lookups."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self._issues: dict[str, tuple[str, tuple[str, ...], tuple[str, ...], str]] = load_cache(
+            project_root, "deps", DEPS_CACHE_VERSION
+        )
+        self._referrers: dict[str, set[str]] | None = None
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def paths(self) -> list[Path]:
+        """Return every indexed issue file."""
+        return [Path(key) for key in self._issues]
+
+    def entries(self) -> list[tuple[Path, str, tuple[str, ...], tuple[str, ...], str]]:
+        """Return (path, id, depends_on, blocks, status) for every issue, sorted by path."""
+        return [(Path(key), *self._issues[key]) for key in sorted(self._issues)]
+
+    def ids(self) -> set[str]:
+        """Return the id of every indexed issue."""
+        return {entry[0] for entry in self._issues.values()}
+
+    def id_for(self, path: Path) -> str | None:
+        """Return the issue id last recorded for a file."""
+        entry = self._issues.get(os.path.abspath(path))
+        return entry[0] if entry else None
+
+    def update(self, path: Path, issue: IssueFrontmatter | None) -> None:
+        """Record the references of a loaded issue. Invalid issues (None) are dropped."""
+        key = os.path.abspath(path)
+        if issue is None:
+            self.remove(path)
+            return
+        entry = (issue.id, tuple(issue.depends_on), tuple(issue.blocks), issue.status.value)
+        if self._issues.get(key) != entry:
+            self._issues[key] = entry
+            self._referrers = None
+            self._dirty = True
+
+    def remove(self, path: Path) -> None:
+        """Forget a file, e.g. after it was deleted."""
+        if self._issues.pop(os.path.abspath(path), None) is not None:
+            self._referrers = None
+            self._dirty = True
+
+    def sync(self, files: list[Path], loader: IssueLoader) -> None:
+        """Make the index match exactly the given issue files.
+
+        Unchanged files cost one stat through the loader's cache.
+        """
+        keep = {os.path.abspath(path) for path in files}
+        for key in [k for k in self._issues if k not in keep]:
+            self.remove(Path(key))
+        for path in files:
+            self.update(path, loader.load(path).issue)
+
+    def referrers(self, issue_id: str) -> set[Path]:
+        """Return files whose depends_on or blocks mention issue_id."""
+        if self._referrers is None:
+            self._referrers = {}
+            for key, (_, depends_on, blocks, _) in self._issues.items():
+                for ref in (*depends_on, *blocks):
+                    self._referrers.setdefault(ref, set()).add(key)
+        return {Path(key) for key in self._referrers.get(issue_id, ())}
+
+    def save(self) -> None:
+        if self._dirty:
+            save_cache(self.project_root, "deps", DEPS_CACHE_VERSION, self._issues)
+            self._dirty = False
+
+
+class CycleError(ValueError):
+    """Raised when a topological order is requested for a graph with cycles."""
+
+    def __init__(self, cycles: list[list[str]]):
+        self.cycles = cycles
+        super().__init__(f"Dependency graph has {len(cycles)} cycle(s)")
+
+
+@dataclass
+class IssueGraph:
+    """Dependency graph keyed by issue id. edges[a] holds the ids a depends on."""
+    status: dict[str, str] = field(default_factory=dict)
+    paths: dict[str, Path] = field(default_factory=dict)
+    edges: dict[str, set[str]] = field(default_factory=dict)
+    problems: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_index(cls, index: DependencyIndex) -> "IssueGraph":
+        """Build the graph in one pass over the index, recording consistency problems."""
+        graph = cls()
+        declared: list[tuple[str, tuple[str, ...], tuple[str, ...]]] = []
+
+        for path, issue_id, depends_on, blocks, status in index.entries():
+            if issue_id in graph.status:
+                graph.problems.append(
+                    f"Duplicate id {issue_id}: {path} (already defined in {graph.paths[issue_id]})"
+                )
+                continue
+            graph.status[issue_id] = status
+            graph.paths[issue_id] = path
+            graph.edges[issue_id] = set()
+            declared.append((issue_id, depends_on, blocks))
+
+        for issue_id, depends_on, blocks in declared:
+            for dep in depends_on:
+                graph.edges[issue_id].add(dep)
+            # "A blocks B" is the same edge as "B depends on A"
+            for blocked in blocks:
+                if blocked in graph.edges:
+                    graph.edges[blocked].add(issue_id)
+
+        # The two fields must mirror each other
+        by_id = {issue_id: (set(depends_on), set(blocks)) for issue_id, depends_on, blocks in declared}
+        for issue_id, depends_on, blocks in declared:
+            for ref in (*depends_on, *blocks):
+                if ref == issue_id:
+                    graph.problems.append(f"{issue_id} references itself")
+                elif ref not in by_id:
+                    graph.problems.append(f"{issue_id} references unknown issue {ref}")
+            for dep in depends_on:
+                if dep != issue_id and dep in by_id and issue_id not in by_id[dep][1]:
+                    graph.problems.append(f"{issue_id} depends on {dep}, but {dep} does not list it in blocks")
+            for blocked in blocks:
+                if blocked != issue_id and blocked in by_id and issue_id not in by_id[blocked][0]:
+                    graph.problems.append(f"{issue_id} blocks {blocked}, but {blocked} does not list it in depends_on")
+
+        return graph
+
+    def cycles(self) -> list[list[str]]:
+        """Return dependency cycles as lists of ids (Tarjan's SCC, iterative)."""
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        cycles = []
+
+        for root in sorted(self.edges):
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.edges[root]))]
+
+            while work:
+                node, successors = work[-1]
+                for succ in successors:
+                    if succ not in self.edges:
+                        continue
+                    if succ not in index:
+                        index[succ] = low[succ] = len(index)
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(self.edges[succ])))
+                        break
+                    if succ in on_stack:
+                        low[node] = min(low[node], index[succ])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in self.edges[node]:
+                            cycles.append(sorted(component))
+
+        return sorted(cycles)
+
+    def topological_order(self) -> list[str]:
+        """Return ids with every issue after its dependencies. Raises CycleError."""
+        dependents: dict[str, list[str]] = {issue_id: [] for issue_id in self.edges}
+        remaining: dict[str, int] = {}
+        for issue_id, deps in self.edges.items():
+            known = [dep for dep in deps if dep in self.edges]
+            remaining[issue_id] = len(known)
+            for dep in known:
+                dependents[dep].append(issue_id)
+
+        # Heap keeps the order deterministic among independent issues
+        heap = [issue_id for issue_id, count in remaining.items() if count == 0]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            issue_id = heapq.heappop(heap)
+            order.append(issue_id)
+            for dependent in dependents[issue_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(heap, dependent)
+
+        if len(order) < len(self.edges):
+            raise CycleError(self.cycles())
+        return order
+
+    def ready(self) -> list[str]:
+        """Return issues in 'ready' status whose dependencies are all done."""
+        done = Status.DONE.value
+        return sorted(
+            issue_id
+            for issue_id, deps in self.edges.items()
+            if self.status[issue_id] == Status.READY.value
+            and all(self.status.get(dep) == done for dep in deps)
+        )
+
@@ -0,0 +1,91 @@
+"""Project health checks behind `cspec status` and `cspec fleet status`."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cspec.index import iter_specs, iter_work_items, list_specs, list_work_items
+
+# Directories a cspec project needs, as reported
+REQUIRED_DIRS = ("cspec/specs/", "cspec/work/", ".claude/commands/")
+
+
+@dataclass
+class ProjectStatus:
+    """Health of one project. specs/work are None when their directory is missing."""
+    root: Path
+    directories: dict[str, bool] = field(default_factory=dict)
+    specs: list[str] | None = None
+    work: list[dict] | None = None
+    agents_md: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        return all(self.directories.values()) and self.agents_md
+
+    @property
+    def problems(self) -> list[str]:
+        missing = [name for name, ok in self.directories.items() if not ok]
+        if not self.agents_md:
+            missing.append("AGENTS.md")
+        return [f"missing {name}" for name in missing]
+
+    def to_dict(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "directories": self.directories,
+            "specs": self.specs,
+            "work": self.work,
+            "agents_md": self.agents_md,
+        }
+
+
+def status_records(project_root: Path, stream: bool = False, scan_threads: int | None = None):
+    """Yield status records: directories, specs, work items, then AGENTS.md.
+
+    With stream, specs and work items are yielded in scan order as each
+    directory is read; otherwise they are sorted by name. scan_threads is
+    passed to the index scans.
+    """
+    present = {}
+    for name in REQUIRED_DIRS:
+        present[name] = (project_root / name).exists()
+        yield {"type": "directory", "name": name, "ok": present[name]}
+
+    if present["cspec/specs/"]:
+        spec_entries = iter_specs(project_root, scan_threads) if stream else list_specs(project_root, scan_threads)
+        for spec in spec_entries:
+            if spec.has_spec:
+                yield {"type": "spec", "name": spec.name}
+
+    if present["cspec/work/"]:
+        work_items = iter_work_items(project_root, scan_threads) if stream else list_work_items(project_root, scan_threads)
+        for item in work_items:
+            yield {"type": "work_item", "name": item.name, "has_issue": item.has_issue, "spec_files": item.spec_files}
+
+    yield {"type": "agents_md", "ok": (project_root / "AGENTS.md").exists()}
+
+
+def records_healthy(records: list[dict]) -> bool:
+    return all(r["ok"] for r in records if r["type"] in ("directory", "agents_md"))
+
+
+def project_status(project_root: Path, scan_threads: int | None = None) -> ProjectStatus:
+    """Check a project's structure, specs and work in progress."""
+    status = ProjectStatus(project_root)
+    for record in status_records(project_root, scan_threads=scan_threads):
+        if record["type"] == "directory":
+            status.directories[record["name"]] = record["ok"]
+        elif record["type"] == "spec":
+            status.specs = status.specs or []
+            status.specs.append(record["name"])
+        elif record["type"] == "work_item":
+            status.work = status.work or []
+            status.work.append({k: v for k, v in record.items() if k != "type"})
+        else:
+            status.agents_md = record["ok"]
+    # An existing but empty directory reports an empty list, not None
+    if status.directories["cspec/specs/"] and status.specs is None:
+        status.specs = []
+    if status.directories["cspec/work/"] and status.work is None:
+        status.work = []
+    return status
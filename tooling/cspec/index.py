@@ -0,0 +1,345 @@
+"""Persistent index of work items and permanent specs.
+
+Each directory under cspec/work/ and cspec/specs/ is keyed by its inode and
+mtime. Listing stats every directory once but only re-reads the ones whose
+key changed since the last run; everything else comes from cspec/.index.
+Re-reading a directory is one scandir (two for a work item with context/),
+classified by name, rather than an exists or glob per kind of file.
+
+When a watcher runs in the same process (cspec.watch), the index is held in
+memory and patched per changed entry, so listings skip the stat pass too.
+
+On network and FUSE filesystems, where every stat is a round trip, the
+per-directory work is spread over a thread pool; local disks are scanned
+serially, since threads only add overhead there.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+from cspec import trace
+from cspec.cache import load_cache, save_cache
+
+# Bump when the record or key layout changes
+INDEX_VERSION = 4
+
+# Threads used to scan a directory on a remote filesystem by default
+REMOTE_SCAN_THREADS = 32
+
+# Filesystem types scanned in parallel by default (from /proc/self/mountinfo);
+# any fuse.* type counts too
+REMOTE_FILESYSTEMS = {
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "ncpfs", "afs", "9p", "virtiofs",
+    "ceph", "glusterfs", "lustre", "gpfs", "beegfs", "fuse", "fuseblk",
+}
+
+
+@dataclass
+class WorkItem:
+    """Contents of a cspec/work/<slug>/ directory."""
+    name: str
+    has_issue: bool = False
+    has_proposal: bool = False
+    spec_files: list[str] = field(default_factory=list)
+    context_files: list[str] = field(default_factory=list)
+    # Latest change to the directory, context/ or any of the item's .md files
+    mtime_ns: int = 0
+
+
+@dataclass
+class SpecEntry:
+    """Contents of a cspec/specs/<feature>/ directory."""
+    name: str
+    has_spec: bool = False
+    title: str = ""
+    requirements: int = 0
+    scenarios: int = 0
+    diagrams: list[str] = field(default_factory=list)
+    # Latest change to the directory or spec.md
+    mtime_ns: int = 0
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Return (inode, mtime_ns) for a path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_ino, st.st_mtime_ns)
+
+
+def _md_mtime(path: Path) -> int:
+    """Return the latest mtime of the .md files in path (0 if none or missing)."""
+    latest = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file():
+                    latest = max(latest, entry.stat().st_mtime_ns)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return latest
+
+
+def _work_key(path: Path) -> tuple:
+    # context/ is a subdirectory and issue.md, proposal.md, spec-*.md and
+    # context/*.md are edited in place; none of that bumps the directory
+    # mtime. Adding or removing a file does, so the directory stats cover
+    # the listing and the latest file mtimes cover in-place edits.
+    context = _stat_key(path / "context")
+    return (_stat_key(path), context, _md_mtime(path), _md_mtime(path / "context") if context else 0)
+
+
+def _spec_key(path: Path) -> tuple:
+    # The title comes from spec.md, whose edits don't bump the directory mtime
+    return (_stat_key(path), _stat_key(path / "spec.md"))
+
+
+def list_dir(path: Path) -> tuple[set[str], set[str]]:
+    """Return (file names, directory names) in path from a single scandir.
+
+    Hidden entries are left out, as glob("*") would. A missing directory is
+    empty. Entry types come from the directory listing, so this costs no
+    per-entry stat on filesystems that report them.
+    """
+    files, dirs = set(), set()
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                (dirs if entry.is_dir() else files).add(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return files, dirs
+
+
+def read_work_item(path: Path) -> WorkItem:
+    """Read the contents of one work item directory."""
+    files, dirs = list_dir(path)
+    context_files = list_dir(path / "context")[0] if "context" in dirs else set()
+    return WorkItem(
+        name=path.name,
+        has_issue="issue.md" in files,
+        has_proposal="proposal.md" in files,
+        spec_files=sorted(f for f in files if f.startswith("spec-") and f.endswith(".md")),
+        context_files=sorted(f for f in context_files if f.endswith(".md")),
+    )
+
+
+def _read_spec_entry(path: Path) -> SpecEntry:
+    files, _ = list_dir(path)
+    entry = SpecEntry(name=path.name, title=path.name)
+    if "spec.md" in files:
+        from cspec.specdoc import parse_spec
+
+        entry.has_spec = True
+        doc = parse_spec((path / "spec.md").read_bytes())
+        if doc.title:
+            entry.title = doc.title
+        entry.requirements = len(doc.requirements)
+        entry.scenarios = doc.scenario_count
+    entry.diagrams = sorted(f for f in files if f.endswith(".mmd"))
+    return entry
+
+
+# Directory under cspec/, key function and reader for each kind of entry
+_KINDS: dict[str, tuple[str, Callable, Callable]] = {
+    "work": ("work", _work_key, read_work_item),
+    "specs": ("specs", _spec_key, _read_spec_entry),
+}
+
+# Entries kept current by a filesystem watcher running in this process
+# (cspec watch / cspec serve --watch). Scans serve these without any stat
+# calls. Each dict is replaced, never mutated, so readers can iterate safely.
+_watched: dict[tuple[Path, str], dict] = {}
+
+
+# Device ("major:minor") -> filesystem type, read once per process
+_fs_types: dict[str, str] | None = None
+
+
+def filesystem_type(path: Path) -> str | None:
+    """Return the type of the filesystem holding path, or None if unknown (non-Linux)."""
+    global _fs_types
+    if _fs_types is None:
+        _fs_types = {}
+        try:
+            with open("/proc/self/mountinfo", encoding="utf-8") as f:
+                for line in f:
+                    fields, _, tail = line.partition(" - ")
+                    parts = fields.split()
+                    if len(parts) >= 3 and tail:
+                        _fs_types[parts[2]] = tail.split()[0]
+        except OSError:
+            pass
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _fs_types.get(f"{os.major(st.st_dev)}:{os.minor(st.st_dev)}")
+
+
+def scan_threads(path: Path, requested: int | None = None) -> int:
+    """Threads to scan path with: requested if given, else by filesystem type."""
+    if requested:
+        return requested
+    fstype = filesystem_type(path) or ""
+    if fstype in REMOTE_FILESYSTEMS or fstype.startswith("fuse."):
+        return REMOTE_SCAN_THREADS
+    return 1
+
+
+def _read(kind: str, path: Path, key: tuple):
+    record = _KINDS[kind][2](path)
+    # Key parts are (inode, mtime) stats or bare mtimes
+    record.mtime_ns = max((part[1] if isinstance(part, tuple) else part for part in key if part), default=0)
+    return record
+
+
+def _refresh(name: str, path: Path, kind: str, cached: dict) -> tuple[tuple, bool]:
+    """Return ((key, record), changed) for one directory, reading it only if its key changed."""
+    # Take the key before reading so a concurrent edit is picked up next run
+    with trace.span(f"stat {kind}", "scan"):
+        key = _KINDS[kind][1](path)
+    hit = cached.get(name)
+    if hit is not None and hit[0] == key:
+        return hit, False
+    with trace.span(f"read {kind}", "scan"):
+        return (key, _read(kind, path, key)), True
+
+
+def _refreshed(base: Path, kind: str, cached: dict, threads: int, ordered: bool) -> Iterator[tuple[str, tuple, bool]]:
+    """Yield (name, (key, record), changed) for each subdirectory of base.
+
+    In directory order, or by name if ordered.
+    """
+    if threads <= 1 and not ordered:
+        with os.scandir(base) as it:
+            for entry in it:
+                if entry.is_dir():
+                    yield (entry.name, *_refresh(entry.name, Path(entry.path), kind, cached))
+        return
+
+    with os.scandir(base) as it:
+        names = [entry.name for entry in it if entry.is_dir()]
+    if ordered:
+        names.sort()
+    if threads <= 1:
+        for name in names:
+            yield (name, *_refresh(name, base / name, kind, cached))
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = ThreadPoolExecutor(max_workers=min(threads, max(1, len(names))))
+    try:
+        # map keeps the input order, so records stream in the same order as serially
+        results = pool.map(lambda name: _refresh(name, base / name, kind, cached), names)
+        for name, (value, changed) in zip(names, results):
+            yield name, value, changed
+    finally:
+        # Don't read the rest if the caller stopped early
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _scan(
+    project_root: Path,
+    kind: str,
+    fresh: dict | None = None,
+    threads: int | None = None,
+    ordered: bool = False,
+) -> Iterator:
+    """Yield records for every subdirectory of cspec/<kind>/ in directory order.
+
+    Only directories whose key changed are re-read. The cache is written once
+    the scan finishes; if the caller stops early, entries read so far are kept
+    and the rest are never read. With ordered, directories are visited by
+    name, so a caller that needs the first N by name can stop after N.
+    If fresh is given it receives the complete {name: (key, record)} mapping.
+    threads is the scan parallelism (default: by filesystem, see scan_threads).
+    """
+    hot = _watched.get((project_root, kind))
+    if hot is not None:
+        for _, (_, record) in sorted(hot.items()) if ordered else hot.items():
+            yield record
+        return
+
+    base = project_root / "cspec" / _KINDS[kind][0]
+    cached = load_cache(project_root, kind, INDEX_VERSION)
+    fresh = {} if fresh is None else fresh
+    changed = False
+    complete = False
+
+    try:
+        for name, value, refreshed in _refreshed(base, kind, cached, scan_threads(base, threads), ordered):
+            fresh[name] = value
+            changed = changed or refreshed
+            yield value[1]
+        complete = True
+    finally:
+        if complete and (changed or len(fresh) != len(cached)):
+            save_cache(project_root, kind, INDEX_VERSION, fresh)
+        elif changed:
+            save_cache(project_root, kind, INDEX_VERSION, {**cached, **fresh})
+
+
+def watch_index(project_root: Path, kind: str) -> None:
+    """Scan cspec/<kind>/ once and serve it from memory until unwatch_index().
+
+    The caller is responsible for calling update_entries() on every change.
+    """
+    _watched.pop((project_root, kind), None)
+    fresh: dict = {}
+    for _ in _scan(project_root, kind, fresh):
+        pass
+    _watched[(project_root, kind)] = fresh
+
+
+def unwatch_index(project_root: Path, kind: str) -> None:
+    """Stop serving cspec/<kind>/ from memory."""
+    _watched.pop((project_root, kind), None)
+
+
+def update_entries(project_root: Path, kind: str, names: set[str]) -> None:
+    """Re-read only the named entries of cspec/<kind>/ and persist the index."""
+    subdir, key_fn, _ = _KINDS[kind]
+    watched = (project_root, kind) in _watched
+    entries = dict(_watched[(project_root, kind)]) if watched else load_cache(project_root, kind, INDEX_VERSION)
+
+    for name in names:
+        path = project_root / "cspec" / subdir / name
+        if path.is_dir():
+            key = key_fn(path)
+            entries[name] = (key, _read(kind, path, key))
+        else:
+            entries.pop(name, None)
+
+    if watched:
+        _watched[(project_root, kind)] = entries
+    save_cache(project_root, kind, INDEX_VERSION, entries)
+
+
+def iter_work_items(project_root: Path, threads: int | None = None, ordered: bool = False) -> Iterator[WorkItem]:
+    """Yield work items under cspec/work/ as they are scanned (by name if ordered)."""
+    return _scan(project_root, "work", threads=threads, ordered=ordered)
+
+
+def iter_specs(project_root: Path, threads: int | None = None, ordered: bool = False) -> Iterator[SpecEntry]:
+    """Yield spec directories under cspec/specs/ as they are scanned (by name if ordered)."""
+    return _scan(project_root, "specs", threads=threads, ordered=ordered)
+
+
+def list_work_items(project_root: Path, threads: int | None = None) -> list[WorkItem]:
+    """List work items under cspec/work/, sorted by name."""
+    return sorted(iter_work_items(project_root, threads), key=lambda item: item.name)
+
+
+def list_specs(project_root: Path, threads: int | None = None) -> list[SpecEntry]:
+    """List spec directories under cspec/specs/, sorted by name.
+
+    Includes directories without a spec.md; filter on has_spec where needed.
+    """
+    return sorted(iter_specs(project_root, threads), key=lambda spec: spec.name)
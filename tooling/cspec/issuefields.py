@@ -0,0 +1,91 @@
+"""Issue summary fields for listings, cached as plain data.
+
+`work list` shows each issue's status, nature and impact. Getting them from
+the frontmatter cache means unpickling validated Pydantic models, which
+imports Pydantic and the schemas: most of a listing's time. This cache keeps
+only the summary fields, as strings, keyed like the frontmatter cache by the
+file's mtime/size; a miss goes through IssueLoader and fills it.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from cspec.cache import load_cache, save_cache
+
+# Bump when IssueFields changes shape
+FIELDS_CACHE_VERSION = 1
+
+
+@dataclass
+class IssueFields:
+    """The frontmatter fields of a valid issue that listings show and filter on."""
+    id: str
+    title: str
+    status: str
+    nature: str
+    impact: str
+    version: str
+
+
+class FieldsLoader:
+    """Loads issue summary fields through the fields cache of a project.
+
+    Call save() when done to persist new entries.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self._entries = load_cache(project_root, "issuefields", FIELDS_CACHE_VERSION)
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._issues = None
+
+    def load(self, path: Path) -> tuple[IssueFields | None, list[str] | None]:
+        """Return (fields, None) for a valid issue, (None, errors) for an invalid one.
+
+        Raises OSError if the file cannot be read.
+        """
+        key = os.path.abspath(path)
+        self._seen.add(key)
+        st = os.stat(path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] == stat_key:
+            return hit[1], hit[2]
+
+        if self._issues is None:
+            from cspec.frontmatter import IssueLoader
+
+            self._issues = IssueLoader(self.project_root)
+        loaded = self._issues.load(path)
+        if loaded.ok:
+            issue = loaded.issue
+            fields = IssueFields(
+                id=issue.id,
+                title=issue.title,
+                status=issue.status.value,
+                nature=issue.nature.value,
+                impact=issue.impact.value,
+                version=issue.version.value,
+            )
+            entry = (stat_key, fields, None)
+        else:
+            entry = (stat_key, None, list(loaded.errors))
+        self._entries[key] = entry
+        self._dirty = True
+        return entry[1], entry[2]
+
+    def save(self, prune: Path | None = None) -> None:
+        """Persist the cache. With prune, drop entries under that directory not loaded during this run."""
+        if self._issues is not None:
+            self._issues.save()
+        if prune is not None:
+            prefix = os.path.join(os.path.abspath(prune), "")
+            stale = [k for k in self._entries if k.startswith(prefix) and k not in self._seen]
+            for key in stale:
+                del self._entries[key]
+            self._dirty = self._dirty or bool(stale)
+        if self._dirty:
+            save_cache(self.project_root, "issuefields", FIELDS_CACHE_VERSION, self._entries)
+            self._dirty = False
@@ -0,0 +1,178 @@
+"""Hash manifests for installed resources.
+
+`cspec init`/`update` copy packaged files (slash commands, issue templates)
+into a project. Each destination directory keeps a MANIFEST_NAME file
+recording, per installed file, the sha256 it was installed with. The
+manifest is committed with the project, so it holds content hashes only;
+the sizes/mtimes behind the fast path below are machine-local and live in
+the git-ignored cspec/.index instead.
+
+That lets an install tell apart:
+
+    unchanged   the project file already matches the package
+    updated     the project file is as cspec left it and the package changed
+    edited      the project file was changed locally since it was installed
+    exists      an untracked file of the same name (installed by hand)
+
+and skip the whole directory, without reading any file, when neither the
+package files, the installed ones nor the manifest changed since the last
+run.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cspec.atomic import write_bytes, write_text
+from cspec.cache import load_cache, save_cache
+
+# Packaged resources that init/update install into a project
+PACKAGE_DIR = Path(__file__).parent
+COMMANDS_DIR = PACKAGE_DIR / "commands" / "cspec"
+TEMPLATES_DIR = PACKAGE_DIR / "templates"
+ISSUE_TEMPLATES_DIR = PACKAGE_DIR / "templates" / "issue_templates"
+
+MANIFEST_NAME = ".cspec-manifest"
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 2
+
+# Bump when the layout of the stat cache entries changes
+STAT_CACHE_VERSION = 1
+
+# Outcomes that wrote the destination file
+WRITTEN = ("installed", "updated", "overwritten")
+
+
+@dataclass
+class SyncResult:
+    """What happened to each file of a sync, in source order.
+
+    fresh is True when the stat fast path found nothing to do.
+    """
+    outcomes: list[tuple[str, str]] = field(default_factory=list)
+    fresh: bool = False
+
+    @property
+    def written(self) -> int:
+        return sum(1 for _, outcome in self.outcomes if outcome in WRITTEN)
+
+
+def _stat_key(path: Path) -> list[int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(dest_dir: Path) -> tuple[dict[str, str], int | None]:
+    """Load a destination directory's manifest as ({file name: sha256}, layout version).
+
+    Empty with version None if missing, unreadable or of an unknown layout.
+    """
+    import json
+
+    try:
+        data = json.loads((dest_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, None
+    if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+        return {}, None
+    if data.get("version") == 1:
+        # Version 1 kept machine-local stats next to each hash
+        return {name: record["sha256"] for name, record in data["files"].items()}, 1
+    if data.get("version") != MANIFEST_VERSION:
+        return {}, None
+    return data["files"], MANIFEST_VERSION
+
+
+def save_manifest(dest_dir: Path, hashes: dict[str, str]) -> None:
+    import json
+
+    manifest = {"version": MANIFEST_VERSION, "files": hashes}
+    write_text(dest_dir / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+def sync_files(project_root: Path, sources: list[Path], dest_dir: Path, force: bool = False) -> SyncResult:
+    """Copy sources into dest_dir, writing only files that need it.
+
+    Files edited locally, or present without having been installed by cspec,
+    are left alone unless force is set. The manifest is rewritten only when
+    a recorded hash changes. Raises OSError if a file cannot be read or
+    written.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    recorded, version = load_manifest(dest_dir)
+    source_stats = {src.name: _stat_key(src) for src in sources}
+
+    # Stats seen after the last sync of this directory, keyed by its path in the project
+    cache_key = dest_dir.relative_to(project_root).as_posix()
+    stat_cache = load_cache(project_root, "manifests", STAT_CACHE_VERSION)
+    seen = stat_cache.get(cache_key)
+    if seen is not None and seen["manifest"] != _stat_key(dest_dir / MANIFEST_NAME):
+        seen = None
+
+    result = SyncResult()
+    if (
+        seen is not None
+        and seen["source"] == source_stats
+        and all(
+            name in recorded and seen["files"].get(name) == _stat_key(dest_dir / name)
+            for name in source_stats
+        )
+    ):
+        result.fresh = True
+        result.outcomes = [(name, "unchanged") for name in source_stats]
+        return result
+
+    seen_files = seen["files"] if seen is not None else {}
+    hashes = {}
+    for src in sources:
+        name = src.name
+        dest = dest_dir / name
+        data = src.read_bytes()
+        digest = _sha256(data)
+        installed = recorded.get(name)
+        dest_stat = _stat_key(dest)
+
+        if dest_stat is None:
+            outcome = "installed"
+        else:
+            if installed is not None and seen_files.get(name) == dest_stat:
+                dest_digest = installed
+            else:
+                dest_digest = _sha256(dest.read_bytes())
+            if dest_digest == digest:
+                outcome = "unchanged"
+            elif installed is not None and dest_digest == installed:
+                outcome = "updated"
+            elif force:
+                outcome = "overwritten"
+            else:
+                outcome = "edited" if installed is not None else "exists"
+
+        if outcome in WRITTEN:
+            write_bytes(dest, data)
+        if outcome in ("edited", "exists"):
+            # Keep what we knew; an untracked file stays untracked
+            if installed is not None:
+                hashes[name] = installed
+        else:
+            hashes[name] = digest
+        result.outcomes.append((name, outcome))
+
+    if hashes != recorded or version != MANIFEST_VERSION:
+        save_manifest(dest_dir, hashes)
+    stat_cache[cache_key] = {
+        "manifest": _stat_key(dest_dir / MANIFEST_NAME),
+        "source": source_stats,
+        "files": {name: _stat_key(dest_dir / name) for name in hashes},
+    }
+    save_cache(project_root, "manifests", STAT_CACHE_VERSION, stat_cache)
+    return result
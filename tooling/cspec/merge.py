@@ -0,0 +1,156 @@
+"""Deterministic merge of a work spec's delta markers into a permanent spec.
+
+A work spec (cspec/work/<slug>/spec-<feature>.md) either is a whole new spec,
+copied as-is when cspec/specs/<feature>/spec.md does not exist yet, or
+carries delta requirements:
+
+    ADDED: <name>      appended after the last requirement
+    MODIFIED: <name>   replaces the requirement of that name; its scenarios
+                       are kept unless the delta brings its own
+    REMOVED: <name>    replaced by an HTML comment noting the removal
+
+Both files are parsed once (cspec.specdoc) and only the byte ranges of the
+affected requirements are rewritten; everything else is copied through
+untouched. Struck-through lines (~~old~~) in a delta are dropped.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from cspec.specdoc import Requirement, parse_spec
+
+SCENARIO_HEADING_RE = re.compile(rb"^#{2,6}(\s+Scenario:)", re.MULTILINE)
+STRUCK_LINE_RE = re.compile(rb"^\s*~~.*~~\s*$")
+
+
+class MergeError(Exception):
+    """The delta cannot be applied; problems lists every conflict found."""
+
+    def __init__(self, problems: list[str]):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+@dataclass
+class MergeResult:
+    """Merged spec text and what changed."""
+    text: bytes
+    created: bool = False
+    added: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+def _strip_tail(lines: list[bytes]) -> list[bytes]:
+    while lines and lines[-1].strip() in (b"", b"---"):
+        lines.pop()
+    return lines
+
+
+def _split_tail(chunk: bytes) -> tuple[bytes, bytes]:
+    """Split a requirement's bytes into its content and the trailing blank/--- separator lines."""
+    lines = chunk.splitlines(keepends=True)
+    cut = len(lines)
+    while cut and lines[cut - 1].strip() in (b"", b"---"):
+        cut -= 1
+    return b"".join(lines[:cut]), b"".join(lines[cut:])
+
+
+def _delta_body(delta_data: bytes, requirement: Requirement) -> tuple[list[bytes], bool]:
+    """Return a delta requirement's body lines (no heading, no struck lines) and whether it has scenarios."""
+    lines = delta_data[requirement.start:requirement.end].splitlines()[1:]
+    body = [SCENARIO_HEADING_RE.sub(rb"###\1", line) for line in lines if not STRUCK_LINE_RE.match(line)]
+    return _strip_tail(body), bool(requirement.scenarios)
+
+
+def _render(heading: bytes, body: list[bytes]) -> bytes:
+    if body and body[0].strip():
+        body = [b"", *body]
+    return b"\n".join([heading, *body]) + b"\n"
+
+
+def merge_spec(spec_data: bytes | None, delta_data: bytes) -> MergeResult:
+    """Apply a work spec to a permanent spec (None if it does not exist yet).
+
+    Raises MergeError listing every conflict; nothing is partially applied.
+    """
+    delta = parse_spec(delta_data)
+    changes = [r for r in delta.requirements if r.delta]
+
+    if spec_data is None:
+        if changes:
+            kinds = sorted({r.delta for r in changes} - {"ADDED"})
+            if kinds:
+                raise MergeError([f"No permanent spec to apply {', '.join(kinds)} requirements to"])
+        # A new spec is taken as written
+        return MergeResult(delta_data, created=True, added=[r.name for r in delta.requirements])
+
+    if not changes:
+        raise MergeError(["Work spec has no ADDED/MODIFIED/REMOVED markers but a permanent spec exists"])
+
+    spec = parse_spec(spec_data)
+    existing = {r.name.lower(): r for r in spec.requirements}
+    result = MergeResult(b"")
+    edits: list[tuple[int, int, bytes]] = []
+    appended: list[bytes] = []
+    problems = []
+    seen: set[str] = set()
+
+    for change in changes:
+        key = change.name.lower()
+        if key in seen:
+            problems.append(f"{change.delta}: {change.name}: requirement changed more than once")
+            continue
+        seen.add(key)
+        target = existing.get(key)
+        body, has_scenarios = _delta_body(delta_data, change)
+
+        if change.delta == "ADDED":
+            if target is not None:
+                problems.append(f"ADDED: {change.name}: requirement already exists (line {target.line})")
+                continue
+            appended.append(_render(f"## Requirement: {change.name}".encode(), body))
+            result.added.append(change.name)
+        elif target is None:
+            problems.append(f"{change.delta}: {change.name}: no such requirement in the permanent spec")
+        elif change.delta == "MODIFIED":
+            content, tail = _split_tail(spec_data[target.start:target.end])
+            if not has_scenarios and target.scenarios:
+                # Keep the existing scenarios when the delta only restates the requirement
+                kept = spec_data[target.scenarios[0].start:target.start + len(content)]
+                body = body + [b""] + kept.rstrip(b"\n").splitlines()
+            heading = spec_data[target.start:target.end].splitlines()[0]
+            edits.append((target.start, target.end, _render(heading, body) + tail))
+            result.modified.append(target.name)
+        else:
+            _, tail = _split_tail(spec_data[target.start:target.end])
+            edits.append((target.start, target.end, f"<!-- REMOVED: {target.name} -->\n".encode() + tail))
+            result.removed.append(target.name)
+
+    if problems:
+        raise MergeError(problems)
+
+    if appended:
+        # New requirements go after the last one, separated the way the spec separates requirements
+        ruled = any(b"---" in _split_tail(spec_data[r.start:r.end])[1] for r in spec.requirements)
+        separator = b"\n---\n\n" if ruled else b"\n"
+        block = separator.join(appended)
+        at = spec.requirements[-1].end if spec.requirements else len(spec_data)
+        if at < len(spec_data):
+            insertion = block + separator
+        else:
+            lead = b"\n" if spec_data and not spec_data.endswith(b"\n") else b""
+            _, tail = _split_tail(spec_data[spec.requirements[-1].start:]) if spec.requirements else (b"", b"")
+            # Don't repeat a separator the last requirement already ends with
+            insertion = lead + (b"\n" if b"---" in tail else separator) + block
+        edits.append((at, at, insertion))
+
+    out = []
+    position = 0
+    for start, end, replacement in sorted(edits, key=lambda edit: (edit[0], edit[1])):
+        out.append(spec_data[position:start])
+        out.append(replacement)
+        position = end
+    out.append(spec_data[position:])
+    result.text = b"".join(out)
+    return result
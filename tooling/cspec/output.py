@@ -0,0 +1,66 @@
+"""Structured output for listing commands (--format json/ndjson)."""
+
+import dataclasses
+from pathlib import Path
+from typing import Any
+
+import click
+
+# Formats accepted by listing commands; text is the human-readable default
+OUTPUT_FORMATS = ["text", "json", "ndjson"]
+
+
+def format_option(f):
+    """Add the shared --format/-f option to a command."""
+    return click.option(
+        "--format", "-f", "output_format",
+        type=click.Choice(OUTPUT_FORMATS),
+        default="text",
+        help="Output format (ndjson streams one record per line)",
+    )(f)
+
+
+def scan_threads_option(f):
+    """Add the shared --scan-threads option (env CSPEC_SCAN_THREADS) to a command."""
+    return click.option(
+        "--scan-threads",
+        type=click.IntRange(min=1),
+        envvar="CSPEC_SCAN_THREADS",
+        default=None,
+        help="Threads reading directories (default: 1 on local disks, more on network filesystems)",
+    )(f)
+
+
+def _default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def emit_json(data: Any) -> None:
+    """Write one indented JSON document."""
+    import json
+
+    click.echo(json.dumps(data, indent=2, default=_default))
+
+
+def emit_record(record: Any) -> None:
+    """Write one NDJSON record and flush so consumers see it immediately."""
+    import json
+
+    click.echo(json.dumps(record, default=_default))
+    click.get_text_stream("stdout").flush()
+
+
+def display_path(path: Path) -> str:
+    """Show a path relative to the current directory when possible."""
+    try:
+        return str(path.relative_to(Path.cwd()))
+    except ValueError:
+        return str(path)
@@ -0,0 +1,296 @@
+"""Token-budgeted context packs for a work item.
+
+A pack gathers what an agent needs to work on cspec/work/<slug>/ into one
+document: the issue, its context files, the work specs, the proposal and the
+permanent specs they change. Every file is split into heading sections and
+sections are taken in priority order until the budget is spent:
+
+    1. the issue
+    2. context files of the types the issue's nature requires
+       (REQUIRED_CONTEXT_BY_NATURE), then any other required context
+    3. work specs (spec-*.md)
+    4. the proposal
+    5. permanent spec requirements (with their scenarios) named in the
+       work specs
+    6. recommended context
+    7. everything else
+
+The first section that does not fit is truncated and the rest are omitted
+(listed in the JSON output). Selected sections keep their original order
+within each file. Tokens are estimated at four characters each.
+
+Packs are cached in cspec/.index per (slug, budget) and reused until a source
+file is added, removed or changes mtime/size.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cspec.cache import load_cache, save_cache
+from cspec.search import split_sections
+
+# Bump when the pack layout or ranking changes
+PACK_CACHE_VERSION = 1
+
+CHARS_PER_TOKEN = 4
+
+# Don't bother truncating a section into less than this
+MIN_TRUNCATED_TOKENS = 32
+
+TRUNCATED_MARKER = "[… truncated to fit the token budget]"
+
+OMITTED_NOTE = "<!-- {count} section(s) omitted to fit the token budget; raise --budget or see --format json -->"
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class PackSection:
+    """A heading section of a source file."""
+    heading: str
+    text: str
+    tokens: int
+    priority: int
+    truncated: bool = False
+
+
+@dataclass
+class PackFile:
+    """A source file and the sections selected from it."""
+    path: str
+    kind: str
+    sections: list[PackSection] = field(default_factory=list)
+
+    @property
+    def header(self) -> str:
+        return f'<file path="{self.path}" kind="{self.kind}">'
+
+    @property
+    def footer(self) -> str:
+        return "</file>"
+
+
+@dataclass
+class ContextPack:
+    """A packed bundle: the selected files and what was left out."""
+    slug: str
+    budget: int
+    tokens: int = 0
+    files: list[PackFile] = field(default_factory=list)
+    omitted: list[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        parts = [f"<!-- cspec context pack: {self.slug}, ~{self.tokens}/{self.budget} tokens -->"]
+        for pack_file in self.files:
+            parts.append(pack_file.header)
+            parts.append("\n\n".join(section.text for section in pack_file.sections))
+            parts.append(pack_file.footer)
+        if self.omitted:
+            parts.append(OMITTED_NOTE.format(count=len(self.omitted)))
+        return "\n".join(parts) + "\n"
+
+
+def _split(text: str, priority: int) -> list[PackSection]:
+    """Split a document into heading sections."""
+    lines = text.splitlines()
+    found = split_sections(text)
+    sections = []
+    for i, (heading, line, _) in enumerate(found):
+        end = found[i + 1][1] - 1 if i + 1 < len(found) else len(lines)
+        chunk = "\n".join(lines[line - 1:end]).strip("\n")
+        sections.append(PackSection(heading, chunk, estimate_tokens(chunk) + 2, priority))
+    return sections
+
+
+def _split_spec(text: str, priority: int, boosted_priority: int, boost: set[str]) -> list[PackSection]:
+    """Split a permanent spec into whole requirements (with their scenarios) and the parts between them.
+
+    Requirements named in boost get boosted_priority.
+    """
+    from cspec.specdoc import parse_spec
+
+    data = text.encode()
+    cuts = []
+    position = 0
+    for requirement in parse_spec(data).requirements:
+        if requirement.start > position:
+            cuts.append((position, requirement.start, None))
+        cuts.append((requirement.start, requirement.end, requirement))
+        position = requirement.end
+    if position < len(data):
+        cuts.append((position, len(data), None))
+
+    sections = []
+    for start, end, requirement in cuts:
+        chunk = data[start:end].decode("utf-8", errors="replace").strip("\n")
+        if not chunk.strip():
+            continue
+        section_priority = priority
+        heading = ""
+        if requirement is not None:
+            heading = requirement.name
+            if requirement.name.lower() in boost:
+                section_priority = boosted_priority
+        sections.append(PackSection(heading, chunk, estimate_tokens(chunk) + 2, section_priority))
+    return sections
+
+
+def _requirement_names(text: str) -> set[str]:
+    from cspec.specdoc import parse_spec
+
+    return {r.name.lower() for r in parse_spec(text.encode()).requirements if r.name}
+
+
+def _sources(project_root: Path, slug: str) -> list[tuple[str, str, int]]:
+    """Return (relative path, kind, priority) for each file that goes into the pack."""
+    from cspec.frontmatter import IssueLoader
+    from cspec.index import read_work_item
+    from cspec.schemas import REQUIRED_CONTEXT_BY_NATURE
+
+    work_rel = f"cspec/work/{slug}"
+    item = read_work_item(project_root / work_rel)
+    sources = []
+
+    required_types: list[str] = []
+    required_paths: list[str] = []
+    recommended_paths: list[str] = []
+    if item.has_issue:
+        sources.append((f"{work_rel}/issue.md", "issue", 1))
+        loader = IssueLoader(project_root)
+        loaded = loader.load(project_root / work_rel / "issue.md")
+        loader.save()
+        if loaded.ok:
+            issue = loaded.issue
+            required_types = REQUIRED_CONTEXT_BY_NATURE.get(issue.nature, [])
+            required_paths = [ref.path for ref in issue.context.required]
+            recommended_paths = [ref.path for ref in issue.context.recommended]
+
+    def context_rank(name: str) -> tuple[int, int]:
+        rel = f"context/{name}"
+        stem = Path(name).stem
+        if stem in required_types:
+            return (2, required_types.index(stem))
+        if rel in required_paths or f"{work_rel}/{rel}" in required_paths:
+            return (2, len(required_types))
+        if rel in recommended_paths or f"{work_rel}/{rel}" in recommended_paths:
+            return (6, 0)
+        return (7, 0)
+
+    for name in sorted(item.context_files, key=context_rank):
+        sources.append((f"{work_rel}/context/{name}", "context", context_rank(name)[0]))
+    for name in item.spec_files:
+        sources.append((f"{work_rel}/{name}", "work-spec", 3))
+    if item.has_proposal:
+        sources.append((f"{work_rel}/proposal.md", "proposal", 4))
+    for name in item.spec_files:
+        feature = name.removeprefix("spec-").removesuffix(".md")
+        rel = f"cspec/specs/{feature}/spec.md"
+        if (project_root / rel).exists():
+            sources.append((rel, "spec", 7))
+    return sources
+
+
+def _signature(project_root: Path, sources: list[tuple[str, str, int]]) -> tuple:
+    signature = []
+    for rel, _, _ in sources:
+        st = os.stat(project_root / rel)
+        signature.append((rel, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def build_pack(project_root: Path, slug: str, budget: int, sources: list[tuple[str, str, int]]) -> ContextPack:
+    """Read the sources and select sections until the budget is spent."""
+    from cspec.frontmatter import split_frontmatter
+
+    texts = {rel: (project_root / rel).read_text(encoding="utf-8", errors="replace") for rel, _, _ in sources}
+    # Permanent spec requirements that the work specs mention rank above the rest
+    mentioned: set[str] = set()
+    for rel, kind, _ in sources:
+        if kind == "work-spec":
+            mentioned |= _requirement_names(texts[rel])
+
+    files = []
+    for rel, kind, priority in sources:
+        text = texts[rel]
+        if kind == "issue":
+            raw, body = split_frontmatter(text)
+            # Keep the frontmatter with the issue's first section
+            sections = _split(body, priority)
+            if raw is not None:
+                front = f"---\n{raw}---"
+                if sections:
+                    sections[0].text = f"{front}\n{sections[0].text}"
+                    sections[0].tokens = estimate_tokens(sections[0].text) + 2
+                else:
+                    sections = [PackSection("", front, estimate_tokens(front) + 2, priority)]
+        elif kind == "spec":
+            sections = _split_spec(text, priority, boosted_priority=5, boost=mentioned)
+        else:
+            sections = _split(text, priority)
+        files.append((PackFile(rel, kind), sections))
+
+    pack = ContextPack(slug, budget)
+    overhead = [estimate_tokens(f.header) + estimate_tokens(f.footer) + 2 for f, _ in files]
+    # The pack header and the omitted note are always there
+    used = estimate_tokens(pack.render()) + estimate_tokens(OMITTED_NOTE.format(count=0)) + 1
+    ranked = sorted(
+        (section.priority, file_index, section_index)
+        for file_index, (_, sections) in enumerate(files)
+        for section_index, section in enumerate(sections)
+    )
+    chosen: dict[int, set[int]] = {}
+    full = False
+    for _, file_index, section_index in ranked:
+        pack_file, sections = files[file_index]
+        section = sections[section_index]
+        opening = overhead[file_index] if file_index not in chosen else 0
+        if not full and used + opening + section.tokens <= budget:
+            chosen.setdefault(file_index, set()).add(section_index)
+            used += opening + section.tokens
+            continue
+        if not full:
+            # Lower-priority sections never displace this one, so stop here
+            full = True
+            room = budget - used - opening - estimate_tokens(TRUNCATED_MARKER) - 1
+            if room >= MIN_TRUNCATED_TOKENS:
+                section.text = section.text[: room * CHARS_PER_TOKEN].rstrip() + "\n" + TRUNCATED_MARKER
+                section.tokens = estimate_tokens(section.text) + 2
+                section.truncated = True
+                chosen.setdefault(file_index, set()).add(section_index)
+                used += opening + section.tokens
+                continue
+        heading = f"#{section.heading}" if section.heading else ""
+        pack.omitted.append(f"{pack_file.path}{heading}")
+
+    for file_index, (pack_file, sections) in enumerate(files):
+        if file_index in chosen:
+            pack_file.sections = [sections[i] for i in sorted(chosen[file_index])]
+            pack.files.append(pack_file)
+    pack.tokens = estimate_tokens(pack.render())
+    return pack
+
+
+def context_pack(project_root: Path, slug: str, budget: int) -> tuple[ContextPack, bool]:
+    """Return the pack for a work item and whether it came from the cache.
+
+    Raises FileNotFoundError if the work item does not exist.
+    """
+    if not (project_root / "cspec" / "work" / slug).is_dir():
+        raise FileNotFoundError(slug)
+
+    sources = _sources(project_root, slug)
+    signature = _signature(project_root, sources)
+    cached = load_cache(project_root, "packs", PACK_CACHE_VERSION)
+    hit = cached.get((slug, budget))
+    if hit is not None and hit[0] == signature:
+        return hit[1], True
+
+    pack = build_pack(project_root, slug, budget, sources)
+    # Keep only packs for work items that still exist
+    entries = {key: value for key, value in cached.items() if (project_root / "cspec" / "work" / key[0]).is_dir()}
+    entries[(slug, budget)] = (signature, pack)
+    save_cache(project_root, "packs", PACK_CACHE_VERSION, entries)
+    return pack, False
@@ -1,48 +1,11 @@
 """Pydantic schemas for spec-driven development artifacts."""
 
 from datetime import date
-from enum import Enum
 from typing import Literal
 
 from pydantic import BaseModel, Field, model_validator
 
-
-class Nature(str, Enum):
-    """Type of change."""
-    FEATURE = "feature"
-    ENHANCEMENT = "enhancement"
-    BUG = "bug"
-    REFACTOR = "refactor"
-    OPTIMIZATION = "optimization"
-    SECURITY = "security"
-    HOTFIX = "hotfix"
-    MIGRATION = "migration"
-    CONFIGURATION = "configuration"
-    DEPRECATION = "deprecation"
-    REMOVAL = "removal"
-
-
-class Impact(str, Enum):
-    """Consumer impact level."""
-    BREAKING = "breaking"
-    ADDITIVE = "additive"
-    INVISIBLE = "invisible"
-
-
-class Version(str, Enum):
-    """Semantic version increment."""
-    MAJOR = "major"
-    MINOR = "minor"
-    PATCH = "patch"
-
-
-class Status(str, Enum):
-    """Issue lifecycle status."""
-    DRAFT = "draft"
-    READY = "ready"
-    IN_PROGRESS = "in-progress"
-    BLOCKED = "blocked"
-    DONE = "done"
+from cspec.enums import Impact, Nature, Status, Version
 
 
 # Impact to version mapping
@@ -0,0 +1,360 @@
+"""Ranked full-text search over specs, work items and their context.
+
+Every markdown file under cspec/specs/<feature>/spec.md and cspec/work/<slug>/
+(issue.md, proposal.md, spec-*.md, context/*.md) is split into sections at
+its headings, so a hit points at one requirement, scenario or context
+section rather than a whole file. The inverted index (term -> section ->
+weighted term frequency) lives in cspec/.index and is updated per file: a
+search stats each file and re-reads only the ones whose mtime/size changed.
+
+Results are ranked with BM25; terms in a heading or an issue title count
+HEADING_WEIGHT times. Work item sections can be filtered on the fields of
+their issue's frontmatter (nature:bug status:ready).
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from math import log
+from pathlib import Path
+
+from cspec.cache import load_cache, save_cache
+from cspec.index import list_specs, list_work_items
+
+# Bump when the entry layout or tokenization changes
+SEARCH_CACHE_VERSION = 2
+
+# IssueFrontmatter fields usable as key:value filters, plus the file kind
+FILTER_FIELDS = ("id", "nature", "impact", "version", "status", "kind")
+
+# Kinds of indexed file
+KINDS = ("spec", "issue", "proposal", "work-spec", "context")
+
+HEADING_WEIGHT = 3
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+
+
+@dataclass
+class Section:
+    """One heading-delimited part of an indexed file."""
+    heading: str
+    line: int
+    length: int
+
+
+@dataclass
+class SearchResult:
+    """A ranked search hit."""
+    path: Path
+    kind: str
+    line: int
+    heading: str
+    score: float
+    snippet: str = ""
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def split_sections(text: str, first_line: int = 1) -> list[tuple[str, int, list[str]]]:
+    """Split markdown into (heading, line, body lines) at each heading outside code fences.
+
+    Text before the first heading becomes a section with an empty heading.
+    """
+    sections = [("", first_line, [])]
+    in_fence = False
+    for offset, line in enumerate(text.splitlines()):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        if match:
+            sections.append((match.group(2), first_line + offset, []))
+        else:
+            sections[-1][2].append(line)
+    return [s for s in sections if s[0] or any(line.strip() for line in s[2])]
+
+
+def _term_counts(heading: str, body: list[str]) -> tuple[dict[str, int], int]:
+    counts: dict[str, int] = {}
+    for term in tokenize(heading):
+        counts[term] = counts.get(term, 0) + HEADING_WEIGHT
+    for line in body:
+        for term in tokenize(line):
+            counts[term] = counts.get(term, 0) + 1
+    return counts, sum(counts.values())
+
+
+def _issue_fields(loaded) -> dict[str, str]:
+    if loaded is None or not loaded.ok:
+        return {}
+    issue = loaded.issue
+    return {
+        "id": issue.id,
+        "title": issue.title,
+        "nature": issue.nature.value,
+        "impact": issue.impact.value,
+        "version": issue.version.value,
+        "status": issue.status.value,
+    }
+
+
+def _read_file(path: Path, kind: str, loader) -> tuple[list[Section], list[dict[str, int]], dict[str, str]]:
+    """Read one file into its sections, per-section term counts and issue fields."""
+    text = path.read_text(encoding="utf-8", errors="replace")
+    fields: dict[str, str] = {}
+    first_line = title_line = 1
+    if kind == "issue":
+        from cspec.frontmatter import split_frontmatter
+
+        fields = _issue_fields(loader.load(path))
+        raw, body = split_frontmatter(text)
+        if raw is not None:
+            head = text[: len(text) - len(body)]
+            first_line = head.count("\n") + 1
+            title_line = next(
+                (n for n, line in enumerate(head.splitlines(), 1) if re.match(r"title\s*:", line)), 1
+            )
+        text = body
+
+    sections = []
+    counts = []
+    if fields.get("title"):
+        # The title is what agents search issues by; index it as its own section
+        section_counts, length = _term_counts(fields["title"], [])
+        sections.append(Section(fields["title"], title_line, length))
+        counts.append(section_counts)
+    for heading, line, body_lines in split_sections(text, first_line):
+        section_counts, length = _term_counts(heading, body_lines)
+        sections.append(Section(heading, line, length))
+        counts.append(section_counts)
+    return sections, counts, fields
+
+
+def _indexed_files(project_root: Path) -> dict[str, tuple[Path, str, str]]:
+    """Map each indexable file's relative path to (path, kind, work slug or "")."""
+    files = {}
+    if (project_root / "cspec" / "specs").exists():
+        for spec in list_specs(project_root):
+            if spec.has_spec:
+                rel = f"cspec/specs/{spec.name}/spec.md"
+                files[rel] = (project_root / rel, "spec", "")
+    if (project_root / "cspec" / "work").exists():
+        for item in list_work_items(project_root):
+            base = f"cspec/work/{item.name}"
+            names = []
+            if item.has_issue:
+                names.append(("issue.md", "issue"))
+            if item.has_proposal:
+                names.append(("proposal.md", "proposal"))
+            names += [(name, "work-spec") for name in item.spec_files]
+            names += [(f"context/{name}", "context") for name in item.context_files]
+            for name, kind in names:
+                rel = f"{base}/{name}"
+                files[rel] = (project_root / rel, kind, item.name)
+    return files
+
+
+class SearchIndex:
+    """Persistent inverted index over a project's specs and work items.
+
+    Call refresh() before searching to bring changed files up to date, and
+    save() to persist; nothing is written if no file changed.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        cached = load_cache(project_root, "search", SEARCH_CACHE_VERSION)
+        # rel path -> (stat_key, kind, slug, sections, fields, terms)
+        self._files: dict[str, tuple] = dict(cached.get("files", {}))
+        # term -> {(rel path, section index): weighted term frequency}
+        self._postings: dict[str, dict[tuple[str, int], int]] = dict(cached.get("postings", {}))
+        # Terms whose postings were copied; the loaded ones are shared with the cache memo
+        self._owned: set[str] = set()
+        self._total_length = cached.get("total_length", 0)
+        self._section_count = cached.get("section_count", 0)
+        self._dirty = False
+
+    def _postings_for(self, term: str) -> dict[tuple[str, int], int]:
+        """Return a term's postings, safe to modify."""
+        if term not in self._owned:
+            self._postings[term] = dict(self._postings.get(term, {}))
+            self._owned.add(term)
+        return self._postings[term]
+
+    def _remove(self, rel: str) -> None:
+        entry = self._files.pop(rel)
+        _, _, _, sections, _, terms = entry
+        for term in terms:
+            if term not in self._postings:
+                continue
+            postings = self._postings_for(term)
+            for i in range(len(sections)):
+                postings.pop((rel, i), None)
+            if not postings:
+                del self._postings[term]
+                self._owned.discard(term)
+        self._total_length -= sum(s.length for s in sections)
+        self._section_count -= len(sections)
+        self._dirty = True
+
+    def _add(self, rel: str, path: Path, kind: str, slug: str, key: tuple, loader) -> None:
+        sections, counts, fields = _read_file(path, kind, loader)
+        terms = set()
+        for i, section_counts in enumerate(counts):
+            for term, tf in section_counts.items():
+                self._postings_for(term)[(rel, i)] = tf
+                terms.add(term)
+        self._files[rel] = (key, kind, slug, sections, fields, tuple(sorted(terms)))
+        self._total_length += sum(s.length for s in sections)
+        self._section_count += len(sections)
+        self._dirty = True
+
+    def refresh(self) -> None:
+        """Re-index files whose stat changed and drop files that are gone."""
+        from cspec.frontmatter import IssueLoader
+
+        current = _indexed_files(self.project_root)
+        for rel in [rel for rel in self._files if rel not in current]:
+            self._remove(rel)
+
+        loader = None
+        for rel, (path, kind, slug) in current.items():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                if rel in self._files:
+                    self._remove(rel)
+                continue
+            key = (st.st_mtime_ns, st.st_size)
+            entry = self._files.get(rel)
+            if entry is not None and entry[0] == key:
+                continue
+            if entry is not None:
+                self._remove(rel)
+            if loader is None:
+                loader = IssueLoader(self.project_root)
+            self._add(rel, path, kind, slug, key, loader)
+
+        if loader is not None:
+            loader.save()
+
+    def save(self) -> None:
+        if self._dirty:
+            save_cache(self.project_root, "search", SEARCH_CACHE_VERSION, {
+                "files": self._files,
+                "postings": self._postings,
+                "total_length": self._total_length,
+                "section_count": self._section_count,
+            })
+            self._dirty = False
+
+    def _fields_for(self, rel: str) -> dict[str, str]:
+        """Issue fields for a file: its own if it is an issue, else its work item's."""
+        _, kind, slug, _, fields, _ = self._files[rel]
+        if kind == "issue" or not slug:
+            return fields
+        issue = self._files.get(f"cspec/work/{slug}/issue.md")
+        return issue[4] if issue is not None else {}
+
+    def _matches(self, rel: str, filters: dict[str, set[str]]) -> bool:
+        if not filters:
+            return True
+        fields = {**self._fields_for(rel), "kind": self._files[rel][1]}
+        return all(fields.get(name, "").lower() in values for name, values in filters.items())
+
+    def search(self, text: str, filters: dict[str, set[str]] | None = None, limit: int | None = 20) -> list[SearchResult]:
+        """Rank sections against text, keeping only files that pass filters.
+
+        filters maps a FILTER_FIELDS name to the accepted (lowercase) values.
+        With no search terms, returns the title section of every matching file.
+        """
+        filters = filters or {}
+        terms = list(dict.fromkeys(tokenize(text)))
+
+        if not terms:
+            hits = {(rel, 0): (0, 0.0) for rel in sorted(self._files) if self._matches(rel, filters)}
+        else:
+            avg_length = self._total_length / self._section_count if self._section_count else 0
+            allowed: dict[str, bool] = {}
+            hits = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = log(1 + (self._section_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for (rel, i), tf in postings.items():
+                    if rel not in allowed:
+                        allowed[rel] = self._matches(rel, filters)
+                    if not allowed[rel]:
+                        continue
+                    length = self._files[rel][3][i].length
+                    norm = K1 * (1 - B + B * length / avg_length) if avg_length else K1
+                    matched, score = hits.get((rel, i), (0, 0.0))
+                    hits[(rel, i)] = (matched + 1, score + idf * tf * (K1 + 1) / (tf + norm))
+
+        # Sections matching more of the terms first, then by score
+        ranked = sorted(hits.items(), key=lambda hit: (-hit[1][0], -hit[1][1], hit[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        results = []
+        for (rel, i), (_, score) in ranked:
+            _, kind, _, sections, _, _ = self._files[rel]
+            section = sections[i]
+            results.append(SearchResult(
+                path=self.project_root / rel,
+                kind=kind,
+                line=section.line,
+                heading=section.heading,
+                score=round(score, 3),
+            ))
+        _add_snippets(results, terms)
+        return results
+
+
+def _add_snippets(results: list[SearchResult], terms: list[str]) -> None:
+    """Fill in the first line of each hit's section that contains a search term."""
+    wanted = set(terms)
+    lines_by_path: dict[Path, list[str]] = {}
+    for result in results:
+        if not wanted:
+            continue
+        if result.path not in lines_by_path:
+            try:
+                lines_by_path[result.path] = result.path.read_text(encoding="utf-8", errors="replace").splitlines()
+            except OSError:
+                lines_by_path[result.path] = []
+        lines = lines_by_path[result.path]
+        # Skip the heading line itself; text before the first heading has none
+        start = result.line if result.heading else result.line - 1
+        for line in lines[start:]:
+            if HEADING_RE.match(line):
+                break
+            if wanted & set(tokenize(line)):
+                result.snippet = line.strip()
+                break
+
+
+def parse_query(words: list[str]) -> tuple[str, dict[str, set[str]]]:
+    """Split query words into free text and key:value filters.
+
+    Only FILTER_FIELDS names are filters; other colon words (note:foo,
+    http://host/path) stay free text. Comma-separated values are
+    alternatives (status:ready,in-progress).
+    """
+    text = []
+    filters: dict[str, set[str]] = {}
+    for word in words:
+        name, sep, value = word.partition(":")
+        if sep and value and name in FILTER_FIELDS:
+            filters.setdefault(name, set()).update(v.strip().lower() for v in value.split(",") if v.strip())
+        else:
+            text.append(word)
+    return " ".join(text), filters
@@ -0,0 +1,106 @@
+"""Long-running cspec daemon answering read-only commands over a Unix socket.
+
+The daemon runs commands in-process, so imports, parsed templates and the
+caches from cspec/.index stay in memory between requests. The CLI forwards
+SERVED_COMMANDS to a running daemon for the current project (see cspec.client)
+and falls back to running locally if none answers.
+
+Protocol: the client sends one JSON line {"version", "argv", "color"} and
+reads one JSON line back, either {"stdout", "stderr", "exit_code"} or
+{"error"} when the daemon declines the request.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from pathlib import Path
+
+from cspec import __version__
+from cspec.client import CONNECT_TIMEOUT, NO_DAEMON_ENV, is_served, socket_path
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        argv = request.get("argv") or []
+        if request.get("version") != __version__:
+            reply = {"error": f"daemon runs cspec {__version__}"}
+        elif not is_served(argv):
+            reply = {"error": "command not served"}
+        else:
+            reply = self.server.run(argv, bool(request.get("color")))
+
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, cli):
+        from click.testing import CliRunner
+
+        super().__init__(path, _Handler)
+        self.cli = cli
+        self.runner = CliRunner()
+        # CliRunner swaps sys.stdout, so commands run one at a time
+        self.lock = threading.Lock()
+
+    def run(self, argv: list[str], color: bool) -> dict:
+        with self.lock:
+            result = self.runner.invoke(self.cli, argv, color=color)
+        if result.exception is not None and not isinstance(result.exception, SystemExit):
+            # Let the client run it locally and show the real traceback
+            return {"error": f"{type(result.exception).__name__}: {result.exception}"}
+        return {"stdout": result.stdout, "stderr": result.stderr, "exit_code": result.exit_code}
+
+
+def _is_alive(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def _stop(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(cli, project_root: Path, ready=None) -> None:
+    """Serve cli for project_root until interrupted.
+
+    Raises RuntimeError if another daemon already serves the project.
+    ready, if given, is called with the socket path once listening.
+    """
+    os.environ[NO_DAEMON_ENV] = "1"
+    path = socket_path(project_root)
+    if path.exists():
+        if _is_alive(path):
+            raise RuntimeError(f"A cspec daemon is already serving {project_root} ({path})")
+        path.unlink()
+
+    # Only the current user may connect. No other thread runs yet, so the
+    # process-wide umask change cannot leak into another thread's files
+    old_umask = os.umask(0o077)
+    try:
+        server = _Server(str(path), cli)
+    finally:
+        os.umask(old_umask)
+
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        if ready is not None:
+            ready(path)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
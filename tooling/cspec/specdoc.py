@@ -0,0 +1,252 @@
+"""Structured parsing of spec.md files into requirements and scenarios.
+
+Follows the structure of the spec template: `## Requirement: <name>` sections
+holding SHALL statements and `### Scenario: <name>` blocks of **Given**/
+**When**/**Then** steps, plus `ADDED:`/`MODIFIED:`/`REMOVED:` delta headings.
+The parser makes one pass over the file's lines and records the byte range
+and line of every requirement and scenario, so callers can slice the
+original text without re-parsing it.
+
+SpecLoader caches parsed documents in cspec/.index keyed by mtime/size and
+content hash, like the issue frontmatter cache.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cspec.cache import load_cache, save_cache
+
+# Bump when SpecDocument or its parts change shape
+SPECDOC_CACHE_VERSION = 1
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+DELTA_RE = re.compile(r"^(ADDED|MODIFIED|REMOVED):\s*(?:Requirement:\s*)?(.*)$")
+STEP_RE = re.compile(r"^\*\*(Given|When|Then|And|But)\*\*\s*(.*)$")
+STRUCK_RE = re.compile(r"^~~(.*)~~$")
+
+
+@dataclass
+class Scenario:
+    """A `### Scenario:` block. And/But steps take the keyword before them."""
+    name: str
+    line: int
+    start: int
+    end: int = 0
+    steps: list[tuple[str, str]] = field(default_factory=list)
+
+    def _steps(self, keyword: str) -> list[str]:
+        return [text for kw, text in self.steps if kw == keyword]
+
+    @property
+    def given(self) -> list[str]:
+        return self._steps("Given")
+
+    @property
+    def when(self) -> list[str]:
+        return self._steps("When")
+
+    @property
+    def then(self) -> list[str]:
+        return self._steps("Then")
+
+
+@dataclass
+class Requirement:
+    """A requirement section, optionally marked ADDED, MODIFIED or REMOVED.
+
+    start/end are byte offsets of the section, from its heading up to the
+    next heading that closes it.
+    """
+    name: str
+    line: int
+    start: int
+    end: int = 0
+    level: int = 2
+    delta: str | None = None
+    statements: list[str] = field(default_factory=list)
+    struck: list[str] = field(default_factory=list)
+    scenarios: list[Scenario] = field(default_factory=list)
+
+
+@dataclass
+class SpecDocument:
+    """Parsed contents of a spec.md."""
+    title: str = ""
+    overview: str = ""
+    requirements: list[Requirement] = field(default_factory=list)
+    size: int = 0
+
+    @property
+    def scenario_count(self) -> int:
+        return sum(len(r.scenarios) for r in self.requirements)
+
+
+def parse_spec(data: bytes) -> SpecDocument:
+    """Parse spec.md contents in one pass over its lines."""
+    doc = SpecDocument(size=len(data))
+    overview: list[str] | None = None
+    requirement: Requirement | None = None
+    scenario: Scenario | None = None
+    last_keyword = "Given"
+    in_fence = False
+    offset = 0
+
+    def close_scenario(at: int):
+        nonlocal scenario
+        if scenario is not None:
+            scenario.end = at
+            scenario = None
+
+    def close_requirement(at: int):
+        nonlocal requirement
+        close_scenario(at)
+        if requirement is not None:
+            requirement.end = at
+            requirement = None
+
+    for line_no, raw in enumerate(data.splitlines(keepends=True), start=1):
+        start = offset
+        offset += len(raw)
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        stripped = line.strip()
+
+        if stripped.startswith("```"):
+            in_fence = not in_fence
+        heading = None if in_fence else HEADING_RE.match(line)
+
+        if heading:
+            level, text = len(heading.group(1)), heading.group(2)
+            delta = DELTA_RE.match(text)
+            overview = None
+            if level == 1:
+                close_requirement(start)
+                if not doc.title:
+                    doc.title = text
+            elif (text.startswith("Requirement:") and level == 2) or (delta and level in (2, 3)):
+                close_requirement(start)
+                name = delta.group(2) if delta else text.removeprefix("Requirement:")
+                requirement = Requirement(
+                    name=name.strip(), line=line_no, start=start, level=level,
+                    delta=delta.group(1) if delta else None,
+                )
+                doc.requirements.append(requirement)
+            elif text.startswith("Scenario:") and requirement is not None and (
+                level > requirement.level or (requirement.delta and level == requirement.level)
+            ):
+                close_scenario(start)
+                scenario = Scenario(name=text.removeprefix("Scenario:").strip(), line=line_no, start=start)
+                requirement.scenarios.append(scenario)
+                last_keyword = "Given"
+            elif requirement is not None and level > requirement.level:
+                close_scenario(start)
+            else:
+                close_requirement(start)
+                if level == 2 and text == "Overview":
+                    overview = []
+            continue
+
+        if overview is not None:
+            if stripped and stripped != "---":
+                overview.append(stripped)
+                doc.overview = " ".join(overview)
+            continue
+
+        step = STEP_RE.match(stripped) if scenario is not None else None
+        if step:
+            keyword = step.group(1)
+            if keyword in ("And", "But"):
+                keyword = last_keyword
+            last_keyword = keyword
+            scenario.steps.append((keyword, step.group(2)))
+        elif requirement is not None and scenario is None and stripped:
+            struck = STRUCK_RE.match(stripped)
+            if struck:
+                requirement.struck.append(struck.group(1))
+            elif "SHALL" in stripped:
+                requirement.statements.append(stripped)
+
+    close_requirement(offset)
+    return doc
+
+
+def find_section(sections: list, name: str, kind: str):
+    """Pick a requirement or scenario by name.
+
+    An exact (case-insensitive) match wins, else a unique substring match.
+    Raises LookupError naming the candidates otherwise.
+    """
+    wanted = name.strip().lower()
+    exact = [s for s in sections if s.name.lower() == wanted]
+    if exact:
+        return exact[0]
+    partial = [s for s in sections if wanted in s.name.lower()]
+    if len(partial) == 1:
+        return partial[0]
+    if partial:
+        raise LookupError(f"Ambiguous {kind} '{name}': {', '.join(s.name for s in partial)}")
+    available = ", ".join(s.name for s in sections) or "none"
+    raise LookupError(f"No {kind} matching '{name}' (available: {available})")
+
+
+def read_section(path: Path, section) -> str:
+    """Read only a requirement's or scenario's byte range from its file.
+
+    Trailing blank lines and `---` separators are dropped.
+    """
+    with path.open("rb") as f:
+        f.seek(section.start)
+        data = f.read(section.end - section.start)
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    while lines and lines[-1].strip() in ("", "---"):
+        lines.pop()
+    return "\n".join(lines)
+
+
+def read_spec(path: Path, previous: tuple | None = None) -> tuple:
+    """Read a spec into a cache entry of (stat_key, digest, SpecDocument).
+
+    If previous is an entry for the same file with a matching content hash,
+    its document is reused instead of parsing again.
+    """
+    st = os.stat(path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if previous is not None and previous[1] == digest:
+        doc = previous[2]
+    else:
+        doc = parse_spec(data)
+    return ((st.st_mtime_ns, st.st_size), digest, doc)
+
+
+class SpecLoader:
+    """Loads spec files through the parsed-spec cache of a project.
+
+    Call save() when done to persist new entries; nothing is written if every
+    lookup was a cache hit.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self._entries = load_cache(project_root, "specdocs", SPECDOC_CACHE_VERSION)
+        self._dirty = False
+
+    def load(self, path: Path) -> SpecDocument:
+        """Load and parse a spec file. Raises OSError if it cannot be read."""
+        key = os.path.abspath(path)
+        hit = self._entries.get(key)
+        if hit is not None:
+            st = os.stat(path)
+            if hit[0] == (st.st_mtime_ns, st.st_size):
+                return hit[2]
+        entry = read_spec(path, hit)
+        self._entries[key] = entry
+        self._dirty = True
+        return entry[2]
+
+    def save(self) -> None:
+        if self._dirty:
+            save_cache(self.project_root, "specdocs", SPECDOC_CACHE_VERSION, self._entries)
+            self._dirty = False
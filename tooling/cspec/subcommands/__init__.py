@@ -0,0 +1 @@
+"""Command modules for the cspec CLI, imported on demand by cspec.cli."""
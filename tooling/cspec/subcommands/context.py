@@ -0,0 +1,46 @@
+"""cspec context: token-budgeted context packs for agents."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cspec import api
+from cspec.output import emit_json, emit_record, format_option
+
+
+@click.group()
+def context():
+    """Commands for assembling work item context."""
+    pass
+
+
+@context.command("pack")
+@click.argument("slug")
+@click.option("--budget", "-b", type=click.IntRange(min=100), default=8000, show_default=True, help="Token budget")
+@format_option
+def context_pack(slug: str, budget: int, output_format: str):
+    """Pack a work item's issue, context and specs into one token budget.
+
+    Includes the issue, required context for its nature, work specs, the
+    proposal and the permanent specs they change, in that priority, and
+    trims what does not fit. Packs are cached until a source file changes.
+
+    Examples:
+        cspec context pack login-fix
+        cspec context pack login-fix --budget 2000 --format json
+    """
+    try:
+        pack = api.context_pack(Path.cwd(), slug, budget)
+    except api.NotFound as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+
+    if output_format == "json":
+        emit_json(pack)
+    elif output_format == "ndjson":
+        for pack_file in pack.files:
+            emit_record(pack_file)
+        emit_record({"slug": pack.slug, "budget": pack.budget, "tokens": pack.tokens, "omitted": pack.omitted})
+    else:
+        click.echo(pack.render(), nl=False)
@@ -0,0 +1,115 @@
+"""cspec fleet: status and validate across many repositories."""
+
+import sys
+import time
+
+import click
+
+from cspec.output import emit_json, emit_record, format_option
+
+
+@click.group()
+def fleet():
+    """Run checks across many repositories concurrently."""
+    pass
+
+
+def _fleet_options(f):
+    f = format_option(f)
+    f = click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, help="Repositories checked at once (default: 4 per CPU, max 32)")(f)
+    f = click.option("--repos", "-r", "repos", required=True, help="File listing project roots (one per line) or a glob such as '~/src/*'")(f)
+    return f
+
+
+def _describe_status(data: dict) -> str:
+    specs = len(data["specs"] or [])
+    work = len(data["work"] or [])
+    if data["healthy"]:
+        return f"HEALTHY ({specs} spec(s), {work} work item(s))"
+    return f"ISSUES: {', '.join(data['problems'])}"
+
+
+def _describe_validate(data: dict) -> str:
+    summary = data["summary"]
+    text = f"{summary['checked']} issue(s): {summary['passed']} passed, {summary['failed']} failed"
+    for record in data["failed"]:
+        text += f"\n      ✗ {record['path']}: {'; '.join(record['errors'])}"
+    return text
+
+
+def _run(repos: str, jobs: int | None, output_format: str, check, describe, label: str) -> None:
+    from cspec.fleet import resolve_repos, run_fleet
+    from cspec.output import display_path
+
+    roots = resolve_repos(repos)
+    if not roots:
+        click.echo(f"No repositories matched: {repos}", err=True)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = []
+    for result in run_fleet(roots, check, jobs=jobs):
+        results.append(result)
+        if output_format == "ndjson":
+            emit_record(result.to_dict())
+        elif output_format == "text":
+            mark = "✓" if result.ok else click.style("✗", fg="red")
+            detail = result.error if result.error else describe(result.data)
+            click.echo(f"  {mark} {display_path(result.root)}  {detail}  [{result.ms:.1f} ms]")
+    elapsed = round((time.perf_counter() - start) * 1000, 2)
+
+    summary = {
+        "repos": len(results),
+        "ok": sum(1 for r in results if r.ok),
+        "failed": sum(1 for r in results if not r.ok and not r.error),
+        "errors": sum(1 for r in results if r.error),
+        "ms": elapsed,
+    }
+    if output_format == "json":
+        results.sort(key=lambda r: str(r.root))
+        emit_json({"results": [r.to_dict() for r in results], "summary": summary})
+    elif output_format == "ndjson":
+        emit_record({"summary": summary})
+    else:
+        slowest = max(results, key=lambda r: r.ms)
+        click.echo()
+        click.echo(
+            f"{summary['repos']} repositories {label} in {elapsed:.0f} ms: "
+            f"{summary['ok']} ok, {summary['failed']} with issues, {summary['errors']} error(s) "
+            f"(slowest: {display_path(slowest.root)}, {slowest.ms:.1f} ms)"
+        )
+    sys.exit(0 if summary["ok"] == summary["repos"] else 1)
+
+
+@fleet.command("status")
+@_fleet_options
+def fleet_status(repos: str, jobs: int | None, output_format: str):
+    """Check project health in every repository.
+
+    Runs the same checks as `cspec status` in each project root and
+    reports one line per repository with its timing. Exit code 0 if every
+    repository is healthy, 1 otherwise.
+
+    Examples:
+        cspec fleet status --repos repos.txt
+        cspec fleet status --repos '~/src/*' --format json
+    """
+    from cspec.fleet import status_check
+
+    _run(repos, jobs, output_format, status_check, _describe_status, "checked")
+
+
+@fleet.command("validate")
+@_fleet_options
+def fleet_validate(repos: str, jobs: int | None, output_format: str):
+    """Validate the issues of every repository.
+
+    Runs `cspec validate` over each project's cspec/work/. Exit code 0 if
+    every issue in every repository is valid, 1 otherwise.
+
+    Examples:
+        cspec fleet validate --repos repos.txt --jobs 16
+    """
+    from cspec.fleet import validate_check
+
+    _run(repos, jobs, output_format, validate_check, _describe_validate, "validated")
@@ -0,0 +1,102 @@
+"""cspec graph: issue dependency checks and ordering."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cspec import api
+from cspec.output import display_path, emit_json, emit_record, format_option
+
+
+@click.group()
+def graph():
+    """Commands for the issue dependency graph (depends_on/blocks)."""
+    pass
+
+
+def _load_issue_graph():
+    try:
+        return api.dependency_graph(Path.cwd())
+    except api.NotInitialized as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+
+def _echo_issue_ids(issue_graph, issue_ids: list[str], output_format: str):
+    records = [
+        {"id": issue_id, "status": issue_graph.status[issue_id], "path": display_path(issue_graph.paths[issue_id])}
+        for issue_id in issue_ids
+    ]
+    if output_format == "json":
+        emit_json(records)
+        return
+    for record in records:
+        if output_format == "ndjson":
+            emit_record(record)
+        else:
+            click.echo(f"  {record['id']:<12}  {record['status']:<11}  {record['path']}")
+
+
+@graph.command("check")
+@format_option
+def graph_check(output_format: str):
+    """Check that depends_on/blocks agree and the graph has no cycles.
+
+    Exit code 0 if consistent, 1 otherwise.
+    """
+    issue_graph = _load_issue_graph()
+    cycles = issue_graph.cycles()
+    edge_count = sum(len(deps) for deps in issue_graph.edges.values())
+
+    if output_format != "text":
+        report = {
+            "issues": len(issue_graph.edges),
+            "edges": edge_count,
+            "problems": issue_graph.problems,
+            "cycles": cycles,
+        }
+        if output_format == "json":
+            emit_json(report)
+        else:
+            emit_record(report)
+    else:
+        click.echo(f"Dependency graph: {len(issue_graph.edges)} issue(s), {edge_count} edge(s)")
+        if issue_graph.problems:
+            click.echo("\nProblems:")
+            for problem in issue_graph.problems:
+                click.echo(f"  - {problem}")
+        if cycles:
+            click.echo("\nCycles:")
+            for cycle in cycles:
+                click.echo(f"  - {' → '.join(cycle)}")
+        if not issue_graph.problems and not cycles:
+            click.echo("\n✓ No problems found")
+
+    sys.exit(1 if issue_graph.problems or cycles else 0)
+
+
+@graph.command("order")
+@format_option
+def graph_order(output_format: str):
+    """List issues in dependency order (dependencies first)."""
+    from cspec.graph import CycleError
+
+    issue_graph = _load_issue_graph()
+    try:
+        order = issue_graph.topological_order()
+    except CycleError as e:
+        click.echo(f"{e}:", err=True)
+        for cycle in e.cycles:
+            click.echo(f"  - {' → '.join(cycle)}", err=True)
+        sys.exit(1)
+
+    _echo_issue_ids(issue_graph, order, output_format)
+
+
+@graph.command("ready")
+@format_option
+def graph_ready(output_format: str):
+    """List issues in 'ready' status whose dependencies are all done."""
+    issue_graph = _load_issue_graph()
+    _echo_issue_ids(issue_graph, issue_graph.ready(), output_format)
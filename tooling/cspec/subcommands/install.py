@@ -0,0 +1,297 @@
+"""cspec init and cspec update: install slash commands, issue templates and AGENTS.md.
+
+Every file is written atomically (temp file + os.replace) and files that
+already match the package copy are left alone, so a no-op update writes
+nothing. Slash commands and issue templates are tracked in a hash manifest
+(cspec.manifest): files cspec installed are updated when the package
+changes, files edited locally are kept unless --force. The whole install runs under an advisory lock in cspec/.index, so
+concurrent `cspec update` runs in one checkout take turns.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cspec.atomic import copy_file, file_lock, write_text
+from cspec.cache import ensure_index_dir
+from cspec.manifest import COMMANDS_DIR, ISSUE_TEMPLATES_DIR, TEMPLATES_DIR, sync_files
+
+# Reference to add to CLAUDE.md
+AGENTS_REFERENCE = "\nSee [AGENTS.md](AGENTS.md) for cspec workflow and project context.\n"
+
+# Marker for preserving user content in AGENTS.md
+AGENTS_PROJECT_CONTEXT_MARKER = "## PROJECT CONTEXT"
+
+BANNER = r"""
+   _____ ____  _____ _    _ _    _ _____ _   _    _____ _____  ______ _____
+  / ____/ __ \|_   _| |  | | |  | |_   _| \ | |  / ____|  __ \|  ____/ ____|
+ | |   | |  | | | | | |__| | |  | | | | |  \| | | (___ | |__) | |__ | |
+ | |   | |  | | | | |  __  | |  | | | | | . ` |  \___ \|  ___/|  __|| |
+ | |___| |__| |_| |_| |  | | |__| |_| |_| |\  |  ____) | |    | |___| |____
+  \_____\____/|_____|_|  |_|\____/|_____|_| \_| |_____/|_|    |______\_____|
+
+  Spec-driven development for the age of coding agents
+"""
+
+
+# Commands to exclude from slash command installation (handled by CLI instead)
+EXCLUDED_COMMANDS = {"onboard.md"}
+
+# Advisory lock held while installing, in the cache directory
+INSTALL_LOCK = "install.lock"
+
+
+def install_lock(project_root: Path):
+    """Lock the project's install for the duration of a with block."""
+    return file_lock(ensure_index_dir(project_root) / INSTALL_LOCK)
+
+
+def _report(result, label, installed_message) -> None:
+    """Echo one line per file of a manifest sync."""
+    if result.fresh:
+        click.echo(f"  · All {len(result.outcomes)} up to date")
+        return
+    for name, outcome in result.outcomes:
+        stem = Path(name).stem
+        if outcome == "installed":
+            click.echo(f"  ✓ {installed_message(stem)}")
+        elif outcome == "updated":
+            click.echo(f"  ✓ Updated {label(stem)}")
+        elif outcome == "overwritten":
+            click.echo(f"  ✓ Overwrote {label(stem)} (--force)")
+        elif outcome == "unchanged":
+            click.echo(f"  · {label(stem)} up to date")
+        elif outcome == "edited":
+            click.echo(f"  ✎ {label(stem)} edited locally, kept (use --force to overwrite)")
+        else:
+            click.echo(f"  · {label(stem)} exists (use --force to overwrite)")
+
+
+def install_commands(project_root: Path, force: bool = False) -> int:
+    """Install slash commands to project. Returns count of installed commands."""
+    commands_dest = project_root / ".claude" / "commands" / "cspec"
+    commands_dest.mkdir(parents=True, exist_ok=True)
+
+    if not COMMANDS_DIR.exists():
+        return 0
+    # Skip excluded commands (these are handled by CLI instead)
+    sources = sorted(f for f in COMMANDS_DIR.glob("*.md") if f.name not in EXCLUDED_COMMANDS)
+    result = sync_files(project_root, sources, commands_dest, force)
+    _report(result, lambda stem: f"/{stem}", lambda stem: f"Installed /{stem} (cspec:{stem})")
+    return result.written
+
+
+def install_issue_templates(project_root: Path, force: bool = False) -> int:
+    """Install GitHub issue templates to project. Returns count of installed templates."""
+    templates_dest = project_root / ".github" / "ISSUE_TEMPLATE"
+    templates_dest.mkdir(parents=True, exist_ok=True)
+
+    if not ISSUE_TEMPLATES_DIR.exists():
+        click.echo("  ! Issue templates not found in package")
+        return 0
+    result = sync_files(project_root, sorted(ISSUE_TEMPLATES_DIR.glob("*.yml")), templates_dest, force)
+    _report(result, lambda stem: f"{stem} template", lambda stem: f"Installed {stem} issue template")
+    return result.written
+
+
+def install_agents_md(project_root: Path, force: bool = False) -> bool:
+    """Copy AGENTS.md template to project root. Returns True if installed."""
+    agents_template = TEMPLATES_DIR / "AGENTS.md"
+    agents_dest = project_root / "AGENTS.md"
+
+    if not agents_template.exists():
+        click.echo("  ! AGENTS.md template not found in package")
+        return False
+
+    if agents_dest.exists() and not force:
+        click.echo("  · AGENTS.md exists (use --force to overwrite)")
+        return False
+
+    if not copy_file(agents_template, agents_dest):
+        click.echo("  · AGENTS.md up to date")
+        return False
+    click.echo("  ✓ Installed AGENTS.md")
+    return True
+
+
+def update_claude_md(project_root: Path) -> bool:
+    """Append AGENTS.md reference to CLAUDE.md if it exists and doesn't already have it."""
+    claude_md = project_root / "CLAUDE.md"
+
+    if not claude_md.exists():
+        click.echo("  · CLAUDE.md not found (skipping reference)")
+        return False
+
+    content = claude_md.read_text(encoding="utf-8")
+
+    # Check if reference already exists (looking for the link pattern)
+    if "AGENTS.md" in content:
+        click.echo("  · CLAUDE.md already references AGENTS.md")
+        return False
+
+    # Append the reference
+    write_text(claude_md, content + AGENTS_REFERENCE)
+
+    click.echo("  ✓ Added AGENTS.md reference to CLAUDE.md")
+    return True
+
+
+def update_agents_md(project_root: Path, force: bool = False) -> bool:
+    """Update AGENTS.md while preserving PROJECT CONTEXT section.
+
+    If AGENTS.md exists, replaces everything before ## PROJECT CONTEXT
+    with the new template content. Preserves user's custom content.
+
+    If AGENTS.md doesn't exist, copies fresh template.
+
+    If force is True, overwrites AGENTS.md with the package template.
+
+    Returns True if updated/created, False otherwise.
+    """
+    agents_template = TEMPLATES_DIR / "AGENTS.md"
+    agents_dest = project_root / "AGENTS.md"
+
+    if not agents_template.exists():
+        click.echo("  ! AGENTS.md template not found in package")
+        return False
+
+    template_content = agents_template.read_text(encoding="utf-8")
+
+    # Find the marker in the template
+    template_marker_idx = template_content.find(AGENTS_PROJECT_CONTEXT_MARKER)
+    if template_marker_idx == -1:
+        click.echo("  ! Template missing PROJECT CONTEXT marker")
+        return False
+
+    # Get the new header content (everything before the marker)
+    new_header = template_content[:template_marker_idx]
+
+    if not agents_dest.exists():
+        # Fresh install - copy entire template
+        copy_file(agents_template, agents_dest)
+        click.echo("  ✓ Created AGENTS.md (fresh)")
+        return True
+
+    if force:
+        if not copy_file(agents_template, agents_dest):
+            click.echo("  · AGENTS.md up to date")
+            return False
+        click.echo("  ✓ Overwrote AGENTS.md (--force)")
+        return True
+
+    # AGENTS.md exists - merge with preserved user content
+    existing_content = agents_dest.read_text(encoding="utf-8")
+    existing_marker_idx = existing_content.find(AGENTS_PROJECT_CONTEXT_MARKER)
+
+    if existing_marker_idx == -1:
+        # No marker found - append existing content after new template
+        # This handles legacy files without the marker
+        merged_content = template_content + "\n\n<!-- Legacy content preserved below -->\n" + existing_content
+        click.echo("  ⚠ AGENTS.md had no PROJECT CONTEXT marker - content preserved at end")
+    else:
+        # Preserve everything from the marker onwards
+        preserved_content = existing_content[existing_marker_idx:]
+        merged_content = new_header + preserved_content
+
+    if merged_content == existing_content:
+        click.echo("  · AGENTS.md up to date")
+        return False
+
+    write_text(agents_dest, merged_content)
+    click.echo("  ✓ Updated AGENTS.md (preserved PROJECT CONTEXT)")
+    return True
+
+
+@click.command()
+@click.option("--force", "-f", is_flag=True, help="Overwrite existing files")
+def init(force: bool):
+    """Initialize spec-driven development in current project.
+
+    Creates directory structure (cspec/specs/ and cspec/work/),
+    installs Claude Code slash commands, copies AGENTS.md template,
+    and updates CLAUDE.md with reference.
+    """
+    click.echo(click.style(BANNER, fg="cyan"))
+
+    project_root = Path.cwd()
+
+    # Directories to create
+    dirs = [
+        project_root / "cspec" / "specs",
+        project_root / "cspec" / "work",
+        project_root / ".claude" / "commands" / "cspec",
+        project_root / ".github" / "ISSUE_TEMPLATE",
+    ]
+
+    click.echo("Initializing project...\n")
+
+    with install_lock(project_root):
+        # Create directories
+        for d in dirs:
+            if not d.exists():
+                d.mkdir(parents=True)
+                click.echo(f"  ✓ Created {d.relative_to(project_root)}/")
+            else:
+                click.echo(f"  · {d.relative_to(project_root)}/ exists")
+
+        # Install slash commands
+        click.echo("\nSlash Commands:")
+        install_commands(project_root, force)
+
+        # Install GitHub issue templates
+        click.echo("\nGitHub Issue Templates:")
+        install_issue_templates(project_root, force)
+
+        # Install AGENTS.md template
+        click.echo("\nAgent Configuration:")
+        install_agents_md(project_root, force)
+
+        # Update CLAUDE.md with reference to AGENTS.md (if it exists)
+        update_claude_md(project_root)
+
+    click.echo("\n✓ Initialization complete!")
+    click.echo("\nDirectory structure:")
+    click.echo("  cspec/specs/         - Permanent feature specs (source of truth)")
+    click.echo("  cspec/work/          - Ephemeral work directories")
+    click.echo("  .github/ISSUE_TEMPLATE/ - GitHub issue templates (11 natures)")
+    click.echo("\nWorkflow:")
+    click.echo("  1. Create issue on GitHub (use templates)")
+    click.echo("  2. /cspec:issue-start <github-url>  - Import and classify")
+    click.echo("  3. /cspec:proposal-write            - Draft proposal")
+    click.echo("  4. /cspec:spec-write                - Write spec")
+    click.echo("  5. /cspec:plan-write                - Create impl plan")
+    click.echo("  6. /cspec:work-complete             - Merge spec, cleanup")
+
+
+@click.command()
+@click.option("--force", "-f", is_flag=True, help="Overwrite existing files")
+def update(force: bool):
+    """Update cspec resources to latest version.
+
+    Re-installs slash commands, GitHub issue templates, and refreshes AGENTS.md.
+    AGENTS.md is merged to preserve the PROJECT CONTEXT section.
+    """
+    project_root = Path.cwd()
+    commands_dest = project_root / ".claude" / "commands" / "cspec"
+
+    if not commands_dest.exists():
+        click.echo("No cspec commands found. Run 'cspec init' first.")
+        sys.exit(1)
+
+    click.echo("Updating cspec resources...\n")
+
+    with install_lock(project_root):
+        # Update slash commands
+        click.echo("Slash Commands:")
+        commands_installed = install_commands(project_root, force=force)
+
+        # Update GitHub issue templates
+        click.echo("\nGitHub Issue Templates:")
+        templates_installed = install_issue_templates(project_root, force=force)
+
+        # Update AGENTS.md
+        click.echo("\nAGENTS.md:")
+        update_agents_md(project_root, force=force)
+
+    click.echo(f"\n✓ Update complete ({commands_installed} command(s), {templates_installed} template(s) refreshed)")
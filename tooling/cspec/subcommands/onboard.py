@@ -0,0 +1,151 @@
+"""cspec onboard: print the onboarding prompt for agents."""
+
+import sys
+from pathlib import Path
+
+import click
+
+
+ONBOARD_PROMPT = '''# Project Onboarding
+
+You are onboarding to a spec-driven development project. This command helps populate the AGENTS.md PROJECT CONTEXT section with codebase analysis.
+
+## Process
+
+### Step 1: Check Project Status
+
+Run `cspec status` to assess the current state:
+
+```bash
+cspec status
+```
+
+Review:
+- Whether cspec/specs/ and cspec/work/ directories exist
+- What permanent specs exist
+- What work is in progress
+
+### Step 2: Analyze the Codebase
+
+Explore the project to gather context for AGENTS.md. Analyze:
+
+1. **Project Structure**: Examine directory layout and organization
+2. **Tech Stack**: Identify languages from file extensions, package files (package.json, pyproject.toml, Cargo.toml, go.mod, etc.)
+3. **Architecture**: Look for architectural patterns, key modules, entry points
+4. **Conventions**: Check for linting configs, formatting rules, naming patterns
+5. **Important Files**: Identify entry points, configuration files, core modules
+6. **Testing**: Find test directories, test frameworks, test commands
+7. **Build/Deploy**: Check for build scripts, CI/CD configs, deployment files
+8. **Existing Specs**: Review any specs in cspec/specs/
+
+### Step 3: Update AGENTS.md PROJECT CONTEXT
+
+Find the `## PROJECT CONTEXT` section in AGENTS.md and populate it:
+
+```markdown
+## PROJECT CONTEXT
+
+### Project Overview
+
+<Brief description from codebase analysis>
+
+### Tech Stack
+
+- **Languages**: <list languages>
+- **Frameworks**: <list frameworks>
+- **Key Dependencies**: <list important dependencies>
+- **Package Manager**: <npm/pip/cargo/etc>
+
+### Architecture
+
+<Describe high-level architecture>
+- Entry points: <main files>
+- Key modules: <core components>
+- Data flow: <how data moves through the system>
+
+### Key Conventions
+
+- **Naming**: <camelCase/snake_case/PascalCase patterns>
+- **File Structure**: <how files are organized>
+- **Patterns**: <design patterns used>
+
+### Important Files
+
+| File | Purpose |
+|------|---------|
+| <path> | <description> |
+
+### Testing
+
+- **Framework**: <test framework>
+- **Run Tests**: `<test command>`
+- **Test Location**: <test directory>
+
+### Build & Deploy
+
+- **Build**: `<build command>`
+- **Dev Server**: `<dev command>`
+
+### Domain Knowledge
+
+<Project-specific terminology, business logic, domain concepts>
+```
+
+### Step 4: Summary
+
+Output what was done:
+- Directory structure status
+- Existing specs found
+- AGENTS.md PROJECT CONTEXT populated
+- Next steps: Start work with /cspec:work-start
+
+## Notes
+
+- The goal is to give coding agents enough context to work effectively
+- Preserve existing content - don\'t overwrite user customizations
+- Ask clarifying questions when information is ambiguous
+'''
+
+
+@click.command()
+@click.option("--force", "-f", is_flag=True, help="Run onboarding even if already onboarded")
+def onboard(force: bool):
+    """Onboard to a spec-driven project.
+
+    Checks if AGENTS.md PROJECT CONTEXT is populated.
+    Outputs the LLM prompt for Claude to execute the onboarding process.
+    """
+    project_root = Path.cwd()
+
+    # Check if AGENTS.md exists and has PROJECT CONTEXT filled
+    agents_md = project_root / "AGENTS.md"
+    is_onboarded = False
+
+    if agents_md.exists():
+        content = agents_md.read_text()
+        # Check if PROJECT CONTEXT section has actual content (not just the header)
+        if "## PROJECT CONTEXT" in content:
+            # Look for subsections that indicate it's been filled
+            if "### Project Overview" in content and "### Tech Stack" in content:
+                # Check if there's actual content (not just placeholders)
+                overview_match = content.find("### Project Overview")
+                tech_match = content.find("### Tech Stack")
+                if overview_match < tech_match:
+                    between = content[overview_match:tech_match]
+                    # If there's substantial content between sections, consider it onboarded
+                    if len(between.strip().split("\n")) > 3:
+                        is_onboarded = True
+
+    if is_onboarded and not force:
+        click.echo("Project appears to be already onboarded.")
+        click.echo("AGENTS.md PROJECT CONTEXT section has content.")
+        click.echo()
+        click.echo("Use --force to re-run onboarding anyway.")
+        sys.exit(0)
+
+    # Output the onboarding prompt for Claude to execute
+    if is_onboarded and force:
+        click.echo("# Re-running onboarding (--force)")
+        click.echo()
+
+    click.echo(ONBOARD_PROMPT)
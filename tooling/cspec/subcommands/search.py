@@ -0,0 +1,55 @@
+"""cspec search: ranked search over specs, work items and context."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cspec import api
+from cspec.output import display_path, emit_json, emit_record, format_option
+
+
+@click.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=20, help="Maximum number of results")
+@format_option
+def search(query: tuple[str, ...], limit: int, output_format: str):
+    """Search requirements, scenarios, issues and context documents.
+
+    Words are matched against section headings and text, ranked by
+    relevance. key:value words filter work items on their issue's
+    frontmatter (id, nature, impact, version, status) or on the file kind
+    (spec, issue, proposal, work-spec, context). Comma-separated values are
+    alternatives.
+
+    Examples:
+        cspec search login timeout
+        cspec search session expiry kind:spec
+        cspec search nature:bug status:ready,in-progress
+    """
+    try:
+        results = api.search(Path.cwd(), list(query), limit=limit)
+    except api.NotInitialized as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+    for result in results:
+        result.path = Path(display_path(result.path))
+
+    if output_format == "json":
+        emit_json(results)
+        return
+    if output_format == "ndjson":
+        for result in results:
+            emit_record(result)
+        return
+
+    if not results:
+        click.echo("No matches.")
+        sys.exit(1)
+
+    for result in results:
+        heading = f"  {result.heading}" if result.heading else ""
+        click.echo(click.style(f"{result.path}:{result.line}", fg="cyan") + heading)
+        if result.snippet:
+            click.echo(f"    {result.snippet}")
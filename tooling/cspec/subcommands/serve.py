@@ -0,0 +1,89 @@
+"""cspec serve and cspec watch: long-running daemon and index watcher."""
+
+import sys
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.option("--watch", "-w", "use_watch", is_flag=True, help="Keep the index hot with a filesystem watcher")
+def serve(use_watch: bool):
+    """Serve read-only commands from a long-running process.
+
+    Keeps the artifact index, validated issue frontmatter and parsed
+    templates in memory and answers status, specs, work, templates, search and context
+    over a Unix socket. While it runs, those commands in this project are
+    forwarded to it automatically; set CSPEC_NO_DAEMON=1 to bypass it.
+
+    With --watch, listings are answered from memory without rescanning
+    (Linux only).
+
+    Stop with Ctrl-C or SIGTERM.
+    """
+    import threading
+
+    from cspec.cli import main
+    from cspec.server import serve as serve_forever
+
+    project_root = Path.cwd()
+    watcher = None
+    if use_watch:
+        from cspec.watch import Watcher
+
+        watcher = Watcher(project_root)
+
+    def ready(socket_file: Path):
+        if watcher is not None:
+            threading.Thread(target=watcher.run, name="cspec-watch", daemon=True).start()
+        click.echo(f"Serving {project_root}")
+        click.echo(f"  Socket: {socket_file}")
+        if watcher is not None:
+            click.echo("  Watching cspec/specs and cspec/work")
+        click.echo("  Press Ctrl-C to stop.")
+
+    try:
+        serve_forever(main, project_root, ready=ready)
+    except RuntimeError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        click.echo("\nStopped.")
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+
+@click.command()
+def watch():
+    """Keep the artifact index current as files change.
+
+    Watches cspec/specs and cspec/work with inotify
+    and re-reads only the work items and specs that changed, so later
+    status/specs/work calls find the index already up to date. Bursts of
+    events are coalesced; a kernel queue overflow triggers a full rescan.
+    Linux only. Stop with Ctrl-C.
+    """
+    from cspec.watch import Watcher
+
+    project_root = Path.cwd()
+
+    def report(changes):
+        parts = []
+        if changes.overflow:
+            parts.append("event queue overflowed, rescanned everything")
+        if changes.work:
+            parts.append(f"work: {', '.join(sorted(changes.work))}")
+        if changes.specs:
+            parts.append(f"specs: {', '.join(sorted(changes.specs))}")
+        click.echo(f"  ↻ {'; '.join(parts)}")
+
+    try:
+        watcher = Watcher(project_root, on_change=report)
+        click.echo(f"Watching {project_root} (Ctrl-C to stop)")
+        watcher.run()
+    except OSError as e:
+        click.echo(f"Cannot watch: {e}", err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        click.echo("\nStopped.")
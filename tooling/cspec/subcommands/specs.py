@@ -0,0 +1,362 @@
+"""cspec specs: list, show, merge and template for permanent specs."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cspec import api
+from cspec.output import emit_json, emit_record, format_option, scan_threads_option
+
+
+@click.group()
+def specs():
+    """Commands for managing permanent specs."""
+    pass
+
+
+def _not_found(e: api.NotFound, kind: str) -> None:
+    """Report a missing spec with the ones that exist, and exit."""
+    click.echo(str(e))
+    if e.available:
+        click.echo(f"\nAvailable {kind}: {', '.join(e.available)}")
+    sys.exit(1)
+
+
+@specs.command("list")
+@format_option
+@scan_threads_option
+@click.option("--sort", type=click.Choice(api.SPEC_SORTS), default=None, help="Order by name (default) or mtime (most recent first)")
+@click.option("--offset", type=click.IntRange(min=0), default=0, help="Skip this many specs")
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=None, help="Show at most this many specs")
+def specs_list(output_format: str, scan_threads: int | None, sort: str | None, offset: int, limit: int | None):
+    """List all permanent specs."""
+    project_root = Path.cwd()
+    paged = sort is not None or offset or limit is not None
+
+    try:
+        if output_format == "ndjson" and not paged:
+            for spec in api.iter_specs(project_root, scan_threads):
+                emit_record(spec)
+            return
+        spec_entries = api.list_specs(project_root, scan_threads, sort=sort or "name", offset=offset, limit=limit)
+    except api.NotInitialized as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+    if output_format == "ndjson":
+        for spec in spec_entries:
+            emit_record(spec)
+        return
+
+    if output_format == "json":
+        emit_json(spec_entries)
+        return
+
+    if not spec_entries and paged:
+        click.echo("No specs in this range.")
+        return
+
+    if not spec_entries:
+        click.echo("No specs found.")
+        click.echo("\nCreate a spec by starting work: /cspec:work-start <slug> <description>")
+        return
+
+    click.echo(f"Found {len(spec_entries)} spec(s):\n")
+
+    for spec in spec_entries:
+        diagram_str = f" (+{len(spec.diagrams)} diagrams)" if spec.diagrams else ""
+
+        click.echo(f"  {spec.name}/")
+        click.echo(f"    {spec.title}{diagram_str}")
+        click.echo(f"    {spec.requirements} requirement(s), {spec.scenarios} scenario(s)")
+
+
+@specs.command("show")
+@click.argument("feature")
+@click.option("--requirement", "-r", help="Show only this requirement (name or unique part of it)")
+@click.option("--scenario", "-s", help="Show only this scenario (name or unique part of it)")
+def specs_show(feature: str, requirement: str | None, scenario: str | None):
+    """Show a feature spec, or one requirement or scenario of it.
+
+    With --requirement or --scenario only that section is read from
+    spec.md, using section offsets cached in cspec/.index.
+
+    Examples:
+        cspec specs show auth
+        cspec specs show auth --requirement "Session Expiry"
+        cspec specs show auth --scenario "idle timeout"
+    """
+    project_root = Path.cwd()
+
+    if requirement or scenario:
+        try:
+            click.echo(api.spec_section(project_root, feature, requirement, scenario))
+        except api.SectionNotFound as e:
+            click.echo(str(e), err=True)
+            sys.exit(1)
+        except api.NotFound as e:
+            _not_found(e, "specs")
+        return
+
+    try:
+        spec = api.show_spec(project_root, feature)
+    except api.NotFound as e:
+        _not_found(e, "specs")
+
+    click.echo(spec.text)
+
+    # List diagrams
+    if spec.diagrams:
+        click.echo("\n---")
+        click.echo("Diagrams:")
+        for name in spec.diagrams:
+            click.echo(f"  • {name}")
+
+
+@specs.command("merge")
+@click.argument("slug")
+@click.option("--feature", help="Merge only spec-<feature>.md")
+@click.option("--dry-run", "-n", is_flag=True, help="Show the changes as a unified diff without writing")
+def specs_merge(slug: str, feature: str | None, dry_run: bool):
+    """Merge a work item's specs into the permanent specs.
+
+    Each cspec/work/<slug>/spec-<feature>.md is applied to
+    cspec/specs/<feature>/spec.md: a new feature is copied as-is, otherwise
+    its ADDED/MODIFIED/REMOVED requirements are applied. All specs are
+    checked before any is written.
+
+    Examples:
+        cspec specs merge fix-auth-timeout --dry-run
+        cspec specs merge fix-auth-timeout
+    """
+    from cspec.output import display_path
+
+    try:
+        merges = api.merge_specs(Path.cwd(), slug, feature, write=not dry_run)
+    except api.NotFound as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    except api.MergeConflict as e:
+        for work_spec, problems in e.problems.items():
+            click.echo(f"✗ {display_path(work_spec)}:", err=True)
+            for problem in problems:
+                click.echo(f"  {problem}", err=True)
+        click.echo("\nNothing was written.", err=True)
+        sys.exit(1)
+
+    for merge in merges:
+        result = merge.result
+        if dry_run:
+            import difflib
+
+            old_lines = (merge.original or b"").decode("utf-8", errors="replace").splitlines(keepends=True)
+            new_lines = result.text.decode("utf-8", errors="replace").splitlines(keepends=True)
+            rel = display_path(merge.target)
+            click.echo("".join(difflib.unified_diff(
+                old_lines, new_lines,
+                fromfile="/dev/null" if merge.original is None else f"a/{rel}", tofile=f"b/{rel}",
+            )), nl=False)
+        elif result.created:
+            click.echo(f"✓ Created {display_path(merge.target)} from {merge.work_spec.name}")
+        else:
+            click.echo(
+                f"✓ Merged {merge.work_spec.name} into {display_path(merge.target)} "
+                f"({len(result.added)} added, {len(result.modified)} modified, {len(result.removed)} removed)"
+            )
+
+
+SPEC_TEMPLATE = '''# <feature-name> Specification
+
+## Overview
+
+<1-2 sentence description of what this feature does>
+
+---
+
+## Requirement: <Requirement Name>
+
+The <subject> SHALL <behavior>.
+
+### Scenario: <scenario description>
+
+**Given** <precondition>
+**And** <additional precondition>
+**When** <action>
+**Then** <expected result>
+**And** <additional expected result>
+
+---
+
+## Requirement: <Another Requirement>
+
+The <subject> SHALL <behavior>.
+
+### Scenario: <happy path>
+
+**Given** <precondition>
+**When** <action>
+**Then** <expected result>
+
+### Scenario: <edge case>
+
+**Given** <precondition>
+**When** <action>
+**Then** <expected result>
+
+---
+
+## Delta Markers (for enhancements/changes)
+
+Use these when modifying existing specs:
+
+### ADDED: <new requirement>
+The <subject> SHALL <new behavior>.
+
+### MODIFIED: <changed requirement>
+~~The <subject> SHALL <old behavior>.~~
+The <subject> SHALL <new behavior>.
+
+### REMOVED: <deprecated requirement>
+~~The <subject> SHALL <removed behavior>.~~
+'''
+
+SPEC_TEMPLATE_GUIDE = '''
+## Key Principles
+
+1. **No implementation details** - Pure business rules, no code, no tech decisions
+2. **SHALL statements** - Each requirement is a testable obligation
+3. **Scenarios** - Given/When/Then for unambiguous behavior
+4. **Scoped appropriately** - One feature per spec, split large features
+
+## Location
+
+- Permanent specs: `cspec/specs/<feature>/spec.md`
+- Work-in-progress: `cspec/work/<slug>/spec-<feature>.md`
+
+## Workflow
+
+1. Write spec in work directory during implementation
+2. After verification, merge into permanent spec
+3. Delete work directory
+'''
+
+
+@specs.command("template")
+@click.option("--guide", "-g", is_flag=True, help="Include usage guide")
+def specs_template(guide: bool):
+    """Show the spec template structure.
+
+    Outputs the Gherkin-style spec format for agents to reference
+    when writing specs during natural conversation.
+
+    Examples:
+        cspec specs template           # Just the template
+        cspec specs template --guide   # Template + usage guide
+    """
+    click.echo(SPEC_TEMPLATE)
+
+    if guide:
+        click.echo(SPEC_TEMPLATE_GUIDE)
+
+
+@specs.group("diagrams")
+def diagrams():
+    """Index and render the Mermaid diagrams (*.mmd) of specs."""
+    pass
+
+
+def _diagram_path(info) -> str:
+    return f"{info.spec}/{info.name}"
+
+
+@diagrams.command("list")
+@click.argument("feature", required=False)
+@format_option
+def diagrams_list(feature: str | None, output_format: str):
+    """List diagrams with their node and edge counts.
+
+    Also shows which requirements of the spec each diagram names. Results
+    are cached per file, so only changed diagrams are parsed again.
+    """
+    try:
+        infos = api.list_diagrams(Path.cwd(), feature)
+    except api.NotInitialized as e:
+        click.echo(str(e))
+        sys.exit(1)
+    except api.NotFound as e:
+        _not_found(e, "specs")
+
+    if output_format == "json":
+        emit_json(infos)
+        return
+    if output_format == "ndjson":
+        for info in infos:
+            emit_record(info)
+        return
+
+    if not infos:
+        click.echo("No diagrams found.")
+        return
+
+    click.echo(f"Found {len(infos)} diagram(s):\n")
+    width = max(len(_diagram_path(info)) for info in infos)
+    for info in infos:
+        click.echo(f"  {_diagram_path(info):<{width}}  {info.kind or '?':<16} {info.nodes} node(s), {info.edges} edge(s)")
+        if info.requirements:
+            click.echo(f"    requirements: {', '.join(info.requirements)}")
+
+
+@diagrams.command("render")
+@click.argument("feature", required=False)
+@click.option("--output", "-o", "output_dir", type=click.Path(file_okay=False, path_type=Path), help="Also copy the SVGs to DIR/<feature>/<name>.svg")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=4, help="Renders run at once")
+@click.option("--cache-size", type=click.IntRange(min=0), default=256, help="Size cap of the render cache in MB")
+@format_option
+def diagrams_render(feature: str | None, output_dir: Path | None, jobs: int, cache_size: int, output_format: str):
+    """Render diagrams to SVG.
+
+    SVGs are cached by diagram content in the user cache directory, so only
+    new or changed diagrams are rendered. Rendering uses mermaid-cli (mmdc)
+    or the command in CSPEC_MERMAID_RENDERER. The least recently used SVGs
+    are evicted once the cache exceeds --cache-size.
+
+    \b
+    Examples:
+        cspec specs diagrams render
+        cspec specs diagrams render auth -o build/diagrams
+    """
+    try:
+        results, evicted = api.render_diagrams(Path.cwd(), feature, cache_size * 1024 * 1024, jobs, output_dir)
+    except api.NotInitialized as e:
+        click.echo(str(e))
+        sys.exit(1)
+    except api.NotFound as e:
+        _not_found(e, "specs")
+
+    failed = [r for r in results if r.outcome == "failed"]
+    if output_format != "text":
+        records = [
+            {"path": _diagram_path(r.diagram), "outcome": r.outcome, "svg": r.svg, "error": r.error}
+            for r in results
+        ]
+        if output_format == "json":
+            emit_json({"results": records, "evicted": evicted})
+        else:
+            for record in records:
+                emit_record(record)
+        sys.exit(1 if failed else 0)
+
+    if not results:
+        click.echo("No diagrams found.")
+        return
+    for result in results:
+        detail = result.error if result.error else str(result.svg)
+        click.echo(f"  {result.outcome:<8}  {_diagram_path(result.diagram)}: {detail}")
+    counts = {outcome: sum(r.outcome == outcome for r in results) for outcome in ("rendered", "cached", "failed")}
+    summary = ", ".join(f"{n} {outcome}" for outcome, n in counts.items())
+    if evicted:
+        summary += f"; evicted {evicted} old SVG(s)"
+    click.echo(f"\n{summary}")
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,102 @@
+"""cspec status: project health report."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cspec import api
+from cspec.health import records_healthy
+from cspec.output import emit_json, emit_record, format_option, scan_threads_option
+
+
+@click.command()
+@format_option
+@scan_threads_option
+def status(output_format: str, scan_threads: int | None):
+    """Check project health and report status.
+
+    Reports on directory structure, specs, and work in progress.
+    Exit code 0 if healthy, 1 if issues found.
+    """
+    project_root = Path.cwd()
+
+    if output_format == "ndjson":
+        records = []
+        for record in api.iter_status(project_root, scan_threads):
+            records.append(record)
+            emit_record(record)
+        healthy = records_healthy(records)
+        emit_record({"type": "summary", "healthy": healthy})
+        sys.exit(0 if healthy else 1)
+
+    project = api.status(project_root, scan_threads)
+    healthy = project.healthy
+
+    if output_format == "json":
+        emit_json(project.to_dict())
+        sys.exit(0 if healthy else 1)
+
+    dir_ok = project.directories
+    spec_names = project.specs or []
+    work_records = project.work or []
+    agents_ok = project.agents_md
+
+    click.echo("Coihuin Spec Project Status")
+    click.echo("=" * 40)
+    click.echo()
+
+    # Check directory structure
+    click.echo("Directory Structure:")
+    for name, ok in dir_ok.items():
+        if ok:
+            click.echo(f"  [OK] {name}")
+        else:
+            click.echo(f"  [MISSING] {name}")
+
+    click.echo()
+
+    # Count specs
+    if dir_ok["cspec/specs/"]:
+        click.echo(f"Permanent Specs: {len(spec_names)}")
+        for name in spec_names:
+            click.echo(f"  • {name}/spec.md")
+    else:
+        click.echo("Permanent Specs: (directory missing)")
+
+    click.echo()
+
+    # Count work in progress
+    if dir_ok["cspec/work/"]:
+        click.echo(f"Work in Progress: {len(work_records)}")
+        for record in work_records:
+            # Check what's in the work directory
+            status_parts = []
+            if record["has_issue"]:
+                status_parts.append("issue")
+            if record["spec_files"]:
+                status_parts.append(f"{len(record['spec_files'])} spec(s)")
+            status_str = ", ".join(status_parts) if status_parts else "empty"
+            click.echo(f"  • {record['name']}/ ({status_str})")
+    else:
+        click.echo("Work in Progress: (directory missing)")
+
+    click.echo()
+
+    # Check AGENTS.md
+    if agents_ok:
+        click.echo(f"AGENTS.md: [OK]")
+    else:
+        click.echo(f"AGENTS.md: [MISSING]")
+
+    click.echo()
+
+    # Summary
+    click.echo("=" * 40)
+    if not healthy:
+        click.echo("Status: ISSUES FOUND")
+        click.echo("\nRun 'cspec init' to create missing directories.")
+        sys.exit(1)
+    else:
+        click.echo("Status: HEALTHY")
+        sys.exit(0)
@@ -0,0 +1,73 @@
+"""cspec templates: query the bundled issue templates."""
+
+import sys
+
+import click
+
+from cspec import api
+from cspec.manifest import ISSUE_TEMPLATES_DIR
+from cspec.output import emit_json, emit_record, format_option
+
+
+@click.group()
+def templates():
+    """Commands for querying issue templates."""
+    pass
+
+
+@templates.command("list")
+@format_option
+def templates_list(output_format: str):
+    """List all available issue templates."""
+    if not ISSUE_TEMPLATES_DIR.exists():
+        click.echo("No issue templates found in package.")
+        sys.exit(1)
+
+    compiled = api.list_templates()
+
+    if not compiled:
+        click.echo("No issue templates found.")
+        sys.exit(1)
+
+    records = [
+        {"name": name, "description": compiled[name]["description"], "labels": compiled[name]["labels"]}
+        for name in sorted(compiled)
+    ]
+    if output_format == "json":
+        emit_json(records)
+        return
+    if output_format == "ndjson":
+        for record in records:
+            emit_record(record)
+        return
+
+    click.echo(f"Available issue templates ({len(compiled)}):\n")
+
+    for name in sorted(compiled):
+        template = compiled[name]
+        labels = template["labels"]
+        labels_str = f" [{', '.join(labels)}]" if labels else ""
+
+        click.echo(f"  {name}")
+        click.echo(f"    {template['description']}{labels_str}")
+
+
+@templates.command("get")
+@click.argument("name")
+@click.option("--format", "-f", "output_format", type=click.Choice(["markdown", "yaml", "json"]), default="markdown", help="Output format")
+def templates_get(name: str, output_format: str):
+    """Get an issue template by name.
+
+    Outputs a fillable template that agents can use to create issues.
+
+    Examples:
+        cspec templates get feature
+        cspec templates get bug --format yaml
+    """
+    try:
+        click.echo(api.get_template(name, output_format))
+    except api.NotFound as e:
+        click.echo(str(e), err=True)
+        if e.available:
+            click.echo(f"Available: {', '.join(e.available)}", err=True)
+        sys.exit(1)
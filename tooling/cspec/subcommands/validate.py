@@ -0,0 +1,93 @@
+"""cspec validate: bulk and incremental issue validation."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cspec import api
+from cspec.output import display_path, emit_json, emit_record, format_option
+
+
+@click.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, help="Worker processes (default: CPU count)")
+@format_option
+@click.option("--changed-since", "changed_since", metavar="REF", help="Only validate issues changed since a git ref, plus their dependents")
+@click.option("--stdin", "from_stdin", is_flag=True, help="Only validate changed files listed on stdin, plus their dependents")
+def validate(paths: tuple[Path, ...], jobs: int | None, output_format: str, changed_since: str | None, from_stdin: bool):
+    """Validate issue frontmatter and required context.
+
+    Checks every issue.md (and ISSUE-*.md) under PATHS, or under cspec/work/
+    if no paths are given. Results are printed as each file finishes.
+    Exit code 0 if all issues are valid, 1 otherwise.
+
+    With --changed-since or --stdin, only changed issues are checked, plus
+    any issue whose depends_on/blocks reference a changed issue; their
+    depends_on/blocks must name existing issues (e.g. after a deletion).
+
+    Examples:
+        cspec validate
+        cspec validate cspec/work/login-fix --format json
+        cspec validate --jobs 8 --format ndjson
+        cspec validate --changed-since origin/main
+        git diff --name-only HEAD | cspec validate --stdin
+    """
+    import subprocess
+
+    from cspec.validation import git_changed_files, summarize
+
+    if changed_since and from_stdin:
+        click.echo("Use either --changed-since or --stdin, not both.", err=True)
+        sys.exit(1)
+
+    project_root = Path.cwd()
+    changed = None
+    if changed_since:
+        try:
+            changed = git_changed_files(project_root, changed_since)
+        except FileNotFoundError:
+            click.echo("git not found; --changed-since requires git.", err=True)
+            sys.exit(1)
+        except subprocess.CalledProcessError as e:
+            click.echo(f"git failed: {e.stderr.strip()}", err=True)
+            sys.exit(1)
+    elif from_stdin:
+        changed = [(project_root / line.strip()).absolute() for line in sys.stdin if line.strip()]
+
+    try:
+        stream = api.iter_validate(project_root, list(paths), jobs, changed)
+    except api.NotInitialized as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+    results = []
+    for result in stream:
+        result.path = Path(display_path(result.path))
+        results.append(result)
+
+        if output_format == "ndjson":
+            emit_record(result.to_dict())
+        elif output_format == "text":
+            if result.ok:
+                id_str = f" ({result.issue_id})" if result.issue_id else ""
+                click.echo(f"  ✓ {result.path}{id_str}")
+            else:
+                click.echo(click.style(f"  ✗ {result.path}", fg="red"))
+            for error in result.errors:
+                click.echo(f"      - {error}")
+            for warning in result.warnings:
+                click.echo(click.style(f"      ⚠ {warning}", fg="yellow"))
+
+    summary = summarize(results)
+
+    if output_format == "json":
+        results.sort(key=lambda r: str(r.path))
+        emit_json({"results": [r.to_dict() for r in results], "summary": summary})
+    elif output_format == "ndjson":
+        emit_record({"summary": summary})
+    else:
+        click.echo()
+        click.echo(f"{summary['checked']} issue(s) checked: {summary['passed']} passed, {summary['failed']} failed")
+
+    sys.exit(1 if summary["failed"] else 0)
@@ -0,0 +1,196 @@
+"""cspec work: list and show work in progress."""
+
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from cspec import api
+from cspec.output import emit_json, emit_record, format_option, scan_threads_option
+
+
+@click.group()
+def work():
+    """Commands for managing work in progress."""
+    pass
+
+
+def _work_item_record(summary: api.WorkSummary) -> dict:
+    """Structured record for a work item, with issue summary fields if it has one."""
+    record = {**asdict(summary.item), "issue": None}
+    if summary.fields is not None:
+        fields = summary.fields
+        record["issue"] = {
+            "id": fields.id,
+            "title": fields.title,
+            "status": fields.status,
+            "nature": fields.nature,
+            "impact": fields.impact,
+        }
+    elif summary.issue_errors is not None:
+        record["issue_errors"] = summary.issue_errors
+    return record
+
+
+@work.command("list")
+@format_option
+@scan_threads_option
+@click.option("--status", "status_filter", multiple=True, help="Only items whose issue has this status (repeatable)")
+@click.option("--nature", multiple=True, help="Only items whose issue has this nature (repeatable)")
+@click.option("--has-spec/--no-spec", default=None, help="Only items with (or without) spec-*.md files")
+@click.option("--sort", type=click.Choice(api.WORK_SORTS), default=None, help="Order by name (default), mtime (most recent first) or status")
+@click.option("--offset", type=click.IntRange(min=0), default=0, help="Skip this many items")
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=None, help="Show at most this many items")
+def work_list(
+    output_format: str,
+    scan_threads: int | None,
+    status_filter: tuple[str, ...],
+    nature: tuple[str, ...],
+    has_spec: bool | None,
+    sort: str | None,
+    offset: int,
+    limit: int | None,
+):
+    """List all work in progress.
+
+    \b
+    Examples:
+        cspec work list --status in-progress --nature bug
+        cspec work list --sort mtime --limit 20
+    """
+    project_root = Path.cwd()
+    filters = {"status": list(status_filter), "nature": list(nature), "has_spec": has_spec}
+    paged = sort is not None or offset or limit is not None
+
+    try:
+        if output_format == "ndjson" and not paged:
+            for summary in api.iter_work(project_root, scan_threads, **filters):
+                emit_record(_work_item_record(summary))
+            return
+        summaries = api.list_work(
+            project_root, scan_threads, **filters, sort=sort or "name", offset=offset, limit=limit
+        )
+    except api.InvalidQuery as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    except api.NotInitialized as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+    if output_format == "ndjson":
+        for summary in summaries:
+            emit_record(_work_item_record(summary))
+        return
+
+    if output_format == "json":
+        emit_json([_work_item_record(summary) for summary in summaries])
+        return
+
+    if not summaries and (paged or status_filter or nature or has_spec is not None):
+        click.echo("No matching work items.")
+        return
+
+    if not summaries:
+        click.echo("No work in progress.")
+        click.echo("\nStart work: /cspec:work-start <slug> <description>")
+        return
+
+    click.echo(f"Found {len(summaries)} work item(s):\n")
+
+    name_width = max(len(summary.item.name) for summary in summaries) + 1
+    for summary in summaries:
+        item = summary.item
+        # Status, nature and impact columns from the issue frontmatter
+        columns = ["-", "-", "-"]
+        if summary.fields is not None:
+            columns = [summary.fields.status, summary.fields.nature, summary.fields.impact]
+        elif item.has_issue:
+            columns = ["invalid", "-", "-"]
+
+        parts = []
+        if item.has_issue:
+            parts.append("issue")
+        if item.has_proposal:
+            parts.append("proposal")
+        if item.spec_files:
+            parts.append(f"{len(item.spec_files)} spec(s)")
+        if item.context_files:
+            parts.append(f"{len(item.context_files)} context")
+
+        status_str = ", ".join(parts) if parts else "empty"
+        status_col, nature_col, impact_col = columns
+        click.echo(
+            f"  {item.name + '/':<{name_width}}  {status_col:<11}  {nature_col:<13}  {impact_col:<9}  ({status_str})"
+        )
+
+
+@work.command("show")
+@click.argument("slug")
+@format_option
+def work_show(slug: str, output_format: str):
+    """Show details of a work item."""
+    try:
+        summary = api.show_work(Path.cwd(), slug)
+    except api.NotFound as e:
+        click.echo(str(e))
+        if e.available:
+            click.echo(f"\nAvailable work items: {', '.join(e.available)}")
+        sys.exit(1)
+
+    if output_format != "text":
+        record = {**asdict(summary.item), "issue": summary.issue}
+        if summary.issue_errors is not None:
+            record["issue_errors"] = summary.issue_errors
+        if output_format == "json":
+            emit_json(record)
+        else:
+            emit_record(record)
+        return
+
+    click.echo(click.style(f"═══ Work: {slug} ═══", fg="cyan", bold=True))
+    click.echo()
+
+    item = summary.item
+
+    # Show issue if exists
+    if item.has_issue:
+        click.echo(click.style("Issue:", underline=True))
+        if summary.issue is not None:
+            issue = summary.issue
+            click.echo(f"  {issue.id}: {issue.title}")
+            click.echo(f"  Status: {issue.status.value}")
+            click.echo(f"  Nature: {issue.nature.value} ({issue.impact.value}, {issue.version.value})")
+            click.echo(f"  Updated: {issue.updated.isoformat()}")
+            if issue.depends_on:
+                click.echo(f"  Depends on: {', '.join(issue.depends_on)}")
+            if issue.blocks:
+                click.echo(f"  Blocks: {', '.join(issue.blocks)}")
+            if issue.context.required:
+                click.echo(f"  Context: {', '.join(ref.type for ref in issue.context.required)}")
+        else:
+            click.echo(click.style("  Invalid frontmatter:", fg="yellow"))
+            for error in summary.issue_errors or []:
+                click.echo(f"    - {error}")
+        click.echo()
+
+    # Show proposal if exists
+    if item.has_proposal:
+        click.echo(click.style("Proposal:", underline=True))
+        click.echo("  proposal.md exists")
+        click.echo()
+
+    # Show specs
+    if item.spec_files:
+        click.echo(click.style("Specs:", underline=True))
+        for name in item.spec_files:
+            feature = name.removeprefix("spec-").removesuffix(".md")
+            click.echo(f"  • {name} → cspec/specs/{feature}/spec.md")
+        click.echo()
+
+    # Show context
+    if item.context_files:
+        click.echo(click.style("Context:", underline=True))
+        for name in item.context_files:
+            click.echo(f"  • {name}")
+        click.echo()
@@ -0,0 +1,201 @@
+"""Opt-in timing of where a command spends its time.
+
+Enabled by `cspec --profile <command>` or CSPEC_TRACE=1. Code marks its
+phases with span(); while tracing, filesystem calls (Path.exists, glob,
+read_text, os.stat, os.scandir, ...) and click.echo are wrapped so they are
+counted and timed too. At exit a summary goes to stderr, or a Chrome trace
+(chrome://tracing, Perfetto) is written with --profile-output / CSPEC_TRACE=
+<file>.json.
+
+Categories:
+
+    import    modules imported after startup (command modules, YAML, Pydantic)
+    scan      reading work item / spec directories into the index
+    cache     loading and saving cspec/.index caches
+    yaml      parsing issue frontmatter
+    pydantic  validating issue frontmatter
+    render    click.echo
+    fs        filesystem calls
+
+Only the outermost of nested imports or filesystem calls is counted.
+
+Times are inclusive: a scan span contains the fs calls made during it.
+When tracing is off span() is a shared no-op context manager.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+# Environment switch: "1" for the summary table, a path for a Chrome trace
+TRACE_ENV = "CSPEC_TRACE"
+
+# Events kept for the Chrome trace; the summary counts everything
+MAX_EVENTS = 200_000
+
+# Filesystem functions counted while tracing: (owner, attribute, label)
+FS_CALLS = [
+    (Path, "exists", "Path.exists"),
+    (Path, "is_dir", "Path.is_dir"),
+    (Path, "is_file", "Path.is_file"),
+    (Path, "stat", "Path.stat"),
+    (Path, "glob", "Path.glob"),
+    (Path, "rglob", "Path.rglob"),
+    (Path, "iterdir", "Path.iterdir"),
+    (Path, "read_text", "Path.read_text"),
+    (Path, "read_bytes", "Path.read_bytes"),
+    (Path, "open", "Path.open"),
+    (os, "stat", "os.stat"),
+    (os, "scandir", "os.scandir"),
+    (os, "listdir", "os.listdir"),
+]
+
+_NULL = nullcontext()
+
+_enabled = False
+_origin_ns = 0
+_events: list[tuple[str, str, int, int, int]] = []
+# (category, name) -> [calls, total ns]
+_totals: dict[tuple[str, str], list[int]] = {}
+_local = threading.local()
+_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def _record(category: str, name: str, start_ns: int, end_ns: int) -> None:
+    with _lock:
+        total = _totals.setdefault((category, name), [0, 0])
+        total[0] += 1
+        total[1] += end_ns - start_ns
+        if len(_events) < MAX_EVENTS:
+            _events.append((category, name, start_ns - _origin_ns, end_ns - start_ns, threading.get_ident()))
+
+
+@contextmanager
+def _span(category: str, name: str):
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _record(category, name, start, time.perf_counter_ns())
+
+
+def span(name: str, category: str):
+    """Time a block as one event of category."""
+    if not _enabled:
+        return _NULL
+    return _span(category, name)
+
+
+def _wrap_fs(func, label: str):
+    def traced(*args, **kwargs):
+        if getattr(_local, "depth", 0):
+            return func(*args, **kwargs)
+        _local.depth = 1
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.depth = 0
+            _record("fs", label, start, time.perf_counter_ns())
+
+    traced.__wrapped__ = func
+    return traced
+
+
+def _wrap_import(func):
+    # Wraps __import__ (level is its 5th argument) and importlib.import_module;
+    # relative imports pass through
+    def traced(name, *args, **kwargs):
+        relative = name.startswith(".") or (args[3] if len(args) > 3 else kwargs.get("level", 0))
+        if relative or name in sys.modules or getattr(_local, "importing", False):
+            return func(name, *args, **kwargs)
+        _local.importing = True
+        start = time.perf_counter_ns()
+        try:
+            return func(name, *args, **kwargs)
+        finally:
+            _local.importing = False
+            _record("import", name, start, time.perf_counter_ns())
+
+    return traced
+
+
+def enable() -> None:
+    """Start tracing in this process."""
+    global _enabled, _origin_ns
+    if _enabled:
+        return
+    import builtins
+    import importlib
+
+    import click
+
+    _enabled = True
+    _origin_ns = time.perf_counter_ns()
+    builtins.__import__ = _wrap_import(builtins.__import__)
+    importlib.import_module = _wrap_import(importlib.import_module)
+    for owner, attr, label in FS_CALLS:
+        setattr(owner, attr, _wrap_fs(getattr(owner, attr), label))
+
+    echo = click.echo
+
+    def traced_echo(*args, **kwargs):
+        with _span("render", "click.echo"):
+            return echo(*args, **kwargs)
+
+    click.echo = traced_echo
+
+
+def summary_table(title: str) -> str:
+    """Format the totals by category, then the filesystem calls."""
+    wall_ms = (time.perf_counter_ns() - _origin_ns) / 1e6
+    lines = [f"cspec profile: {title} (wall {wall_ms:.1f} ms)", f"  {'phase':<34} {'calls':>8} {'total ms':>10}"]
+    by_category: dict[str, list[int]] = {}
+    for (category, _), (calls, ns) in _totals.items():
+        if category != "fs":
+            total = by_category.setdefault(category, [0, 0])
+            total[0] += calls
+            total[1] += ns
+    for category, (calls, ns) in sorted(by_category.items(), key=lambda item: -item[1][1]):
+        lines.append(f"  {category:<34} {calls:>8} {ns / 1e6:>10.1f}")
+        for (cat, name), (name_calls, name_ns) in sorted(_totals.items(), key=lambda item: -item[1][1]):
+            if cat == category and name != category:
+                lines.append(f"    {name[:32]:<32} {name_calls:>8} {name_ns / 1e6:>10.1f}")
+    fs = sorted(((name, calls, ns) for (cat, name), (calls, ns) in _totals.items() if cat == "fs"), key=lambda t: -t[1])
+    if fs:
+        lines.append(f"  {'filesystem calls':<34} {sum(c for _, c, _ in fs):>8} {sum(n for _, _, n in fs) / 1e6:>10.1f}")
+        for name, calls, ns in fs:
+            lines.append(f"    {name:<32} {calls:>8} {ns / 1e6:>10.1f}")
+    return "\n".join(lines)
+
+
+def chrome_trace() -> dict:
+    """Events in the Chrome trace event format (complete events, µs)."""
+    pid = os.getpid()
+    return {
+        "traceEvents": [
+            {"name": name, "cat": category, "ph": "X", "ts": start / 1000, "dur": dur / 1000, "pid": pid, "tid": tid}
+            for category, name, start, dur, tid in _events
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def report(title: str, output: str | None = None) -> None:
+    """Write the Chrome trace to output if given, else the summary to stderr."""
+    if not _enabled:
+        return
+    if output:
+        import json
+
+        Path(output).write_text(json.dumps(chrome_trace()))
+        print(f"cspec profile: wrote {len(_events)} event(s) to {output}", file=sys.stderr)
+    else:
+        print(summary_table(title), file=sys.stderr)
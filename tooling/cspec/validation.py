@@ -0,0 +1,253 @@
+"""Bulk validation of issue files.
+
+Files whose frontmatter is already cached are checked in-process. The rest are
+parsed and validated in a process pool, in batches, and results are yielded as
+each batch finishes so callers can stream them.
+"""
+
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterator
+
+from cspec.frontmatter import IssueLoader, LoadedIssue, read_issue
+from cspec.graph import DependencyIndex
+from cspec.schemas import REQUIRED_CONTEXT_BY_NATURE, Status
+
+# Issue files picked up when a directory is given
+ISSUE_FILE_PATTERNS = ("issue.md", "ISSUE-*.md")
+
+# Files per worker task: large enough to amortize IPC, small enough to stream
+BATCH_SIZE = 32
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one issue file."""
+    path: Path
+    issue_id: str | None = None
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> dict:
+        return {
+            "path": str(self.path),
+            "id": self.issue_id,
+            "ok": self.ok,
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+
+def is_issue_file(path: Path) -> bool:
+    """Return True if the file name matches one of ISSUE_FILE_PATTERNS."""
+    return any(fnmatch(path.name, pattern) for pattern in ISSUE_FILE_PATTERNS)
+
+
+def find_issue_files(paths: list[Path]) -> list[Path]:
+    """Expand files and directories into a sorted list of issue files."""
+    found = set()
+    for path in paths:
+        if path.is_dir():
+            for pattern in ISSUE_FILE_PATTERNS:
+                found.update(path.rglob(pattern))
+        else:
+            found.add(path)
+    return sorted(found)
+
+
+def check_issue(loaded: LoadedIssue, known_ids: set[str] | None = None) -> ValidationResult:
+    """Apply schema and nature-specific context checks to a loaded issue.
+
+    With known_ids, depends_on/blocks entries naming any other id are errors.
+    """
+    result = ValidationResult(path=loaded.path, errors=list(loaded.errors))
+    if not loaded.ok:
+        return result
+
+    issue = loaded.issue
+    result.issue_id = issue.id
+
+    present = {ref.type for ref in issue.context.required}
+    missing = [t for t in REQUIRED_CONTEXT_BY_NATURE.get(issue.nature, []) if t not in present]
+    if missing:
+        message = (
+            f"{issue.nature.value.title()} issues require context: {', '.join(missing)}. "
+            f"Add them to `context.required`."
+        )
+        # Required context only gates the move out of draft
+        if issue.status == Status.DRAFT:
+            result.warnings.append(message)
+        else:
+            result.errors.append(message)
+
+    if known_ids is not None:
+        for field_name in ("depends_on", "blocks"):
+            for ref in getattr(issue, field_name):
+                if ref not in known_ids:
+                    result.errors.append(f"{field_name} references unknown issue {ref}")
+
+    return result
+
+
+def _read_one(path: Path, previous: tuple | None) -> tuple[Path, tuple | None, str | None]:
+    try:
+        return path, read_issue(path, previous), None
+    except OSError as e:
+        return path, None, f"Cannot read file: {e.strerror or e}"
+
+
+def _read_batch(batch: list[tuple[Path, tuple | None]]) -> list[tuple[Path, tuple | None, str | None]]:
+    return [_read_one(path, previous) for path, previous in batch]
+
+
+def validate_issues(
+    project_root: Path,
+    files: list[Path],
+    jobs: int | None = None,
+    check_refs: bool = False,
+) -> Iterator[ValidationResult]:
+    """Validate issue files, yielding results as they complete.
+
+    jobs is the number of worker processes (default: CPU count). Small
+    workloads and jobs=1 run serially to avoid pool start-up cost. The
+    dependency index is refreshed with every issue that gets validated.
+
+    With check_refs, depends_on/blocks are also checked against the issues
+    in the dependency index, which must be in sync (see affected_issue_files).
+    """
+    jobs = jobs or os.cpu_count() or 1
+    loader = IssueLoader(project_root)
+    deps = DependencyIndex(project_root)
+    known_ids = deps.ids() if check_refs else None
+
+    def check(path: Path, loaded: LoadedIssue) -> ValidationResult:
+        deps.update(path, loaded.issue)
+        return check_issue(loaded, known_ids)
+
+    def finish(path: Path, entry: tuple | None, error: str | None) -> ValidationResult:
+        if error is not None:
+            deps.remove(path)
+            return ValidationResult(path=path, errors=[error])
+        loader.store(path, entry)
+        return check(path, entry[2])
+
+    try:
+        pending = []
+        for path in files:
+            try:
+                loaded = loader.cached(path)
+            except OSError as e:
+                deps.remove(path)
+                yield ValidationResult(path=path, errors=[f"Cannot read file: {e.strerror or e}"])
+                continue
+            if loaded is not None:
+                yield check(path, loaded)
+            else:
+                pending.append((path, loader.get_entry(path)))
+
+        if jobs == 1 or len(pending) <= BATCH_SIZE:
+            for path, previous in pending:
+                yield finish(*_read_one(path, previous))
+            return
+
+        batches = [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+        with ProcessPoolExecutor(max_workers=min(jobs, len(batches))) as pool:
+            futures = [pool.submit(_read_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                for item in future.result():
+                    yield finish(*item)
+    finally:
+        loader.save()
+        deps.save()
+
+
+def git_changed_files(project_root: Path, ref: str) -> list[Path]:
+    """List files changed since a git ref, including untracked files.
+
+    Raises subprocess.CalledProcessError if git fails (e.g. unknown ref).
+    """
+    def git(*args: str) -> list[str]:
+        proc = subprocess.run(
+            ["git", *args], cwd=project_root, capture_output=True, text=True, check=True
+        )
+        return [name for name in proc.stdout.split("\0") if name]
+
+    names = git("diff", "--name-only", "--relative", "-z", ref, "--")
+    names += git("ls-files", "--others", "--exclude-standard", "-z")
+    return sorted({(project_root / name).absolute() for name in names})
+
+
+def affected_issue_files(project_root: Path, changed: list[Path], scope: list[Path]) -> list[Path]:
+    """Return changed issue files plus the issues whose depends_on/blocks point at them.
+
+    Only files under scope are considered. Deleted issues are dropped from the
+    dependency index but still pull in their dependents. If the index is empty
+    it is built once from every issue under scope and cspec/work/; otherwise
+    indexed files are re-read only if their stat changed. New issues are found
+    through changed. Afterwards the index holds every known issue, so the
+    references of the returned files can be checked against it.
+    """
+    scope = [p.absolute() for p in scope]
+
+    def in_scope(path: Path) -> bool:
+        return any(path == s or path.is_relative_to(s) for s in scope)
+
+    changed_issues = [p.absolute() for p in changed if is_issue_file(p) and in_scope(p.absolute())]
+
+    loader = IssueLoader(project_root)
+    deps = DependencyIndex(project_root)
+    changed_ids = set()
+    affected = set()
+
+    if not len(deps):
+        work_dir = (project_root / "cspec" / "work").absolute()
+        for path in find_issue_files([*scope, work_dir] if work_dir.is_dir() else scope):
+            deps.update(path, loader.load(path).issue)
+    else:
+        # Pick up issues edited since they were last indexed; unchanged files cost one stat
+        for path in deps.paths():
+            try:
+                loaded = loader.cached(path) or loader.load(path)
+            except OSError:
+                changed_ids.add(deps.id_for(path))
+                deps.remove(path)
+                continue
+            deps.update(path, loaded.issue)
+    for path in changed_issues:
+        old_id = deps.id_for(path)
+        if old_id:
+            changed_ids.add(old_id)
+        if path.exists():
+            affected.add(path)
+            loaded = loader.load(path)
+            deps.update(path, loaded.issue)
+            if loaded.ok:
+                changed_ids.add(loaded.issue.id)
+        else:
+            deps.remove(path)
+
+    for issue_id in changed_ids:
+        affected.update(p for p in deps.referrers(issue_id) if in_scope(p) and p.exists())
+
+    loader.save()
+    deps.save()
+    return sorted(affected)
+
+
+def summarize(results: list[ValidationResult]) -> dict:
+    """Build a machine-readable summary of validation results."""
+    failed = sum(1 for r in results if not r.ok)
+    return {
+        "checked": len(results),
+        "passed": len(results) - failed,
+        "failed": failed,
+        "warnings": sum(len(r.warnings) for r in results),
+    }
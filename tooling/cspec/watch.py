@@ -0,0 +1,223 @@
+"""Filesystem watcher that keeps the artifact index hot (Linux inotify).
+
+Watches cspec/specs/ and cspec/work/ recursively.
+Events are coalesced: after the first event the watcher keeps collecting
+until the tree has been quiet for DEBOUNCE seconds (at most MAX_DELAY), then
+re-reads only the affected work items and specs. If the kernel event queue
+overflows, every watch is re-created and the index is rebuilt from scratch.
+
+inotify is reached through ctypes so no extra dependency is needed.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from cspec.frontmatter import IssueLoader
+from cspec.index import update_entries, unwatch_index, watch_index
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+# Quiet period that ends a burst of events, and the longest a burst may be held
+DEBOUNCE = 0.1
+MAX_DELAY = 1.0
+
+# Watched roots, relative to the project root
+WATCH_ROOTS = (Path("cspec") / "specs", Path("cspec") / "work")
+
+
+@dataclass
+class ChangeSet:
+    """Coalesced changes from one burst of events."""
+    work: set[str] = field(default_factory=set)
+    specs: set[str] = field(default_factory=set)
+    overflow: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.work or self.specs or self.overflow)
+
+
+class Inotify:
+    """Minimal ctypes binding for inotify."""
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("File watching requires Linux inotify")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+        self.fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path: Path, mask: int) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def read(self) -> list[tuple[int, int, str]]:
+        """Return pending (wd, mask, name) events without blocking."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class Watcher:
+    """Keeps the work/specs index and issue frontmatter cache current for a project."""
+
+    def __init__(self, project_root: Path, on_change: Callable[[ChangeSet], None] | None = None):
+        self.project_root = project_root
+        self.on_change = on_change
+        self._inotify: Inotify | None = None
+        self._paths: dict[int, Path] = {}
+        self._stopped = False
+
+    def _add_tree(self, root: Path) -> None:
+        """Watch root and every directory below it."""
+        for dirpath, _, _ in os.walk(root):
+            try:
+                wd = self._inotify.add_watch(Path(dirpath), WATCH_MASK)
+            except OSError:
+                # Removed between walk and watch; the parent's event covers it
+                continue
+            self._paths[wd] = Path(dirpath)
+
+    def _start(self) -> None:
+        self._inotify = Inotify()
+        self._paths = {}
+        for root in WATCH_ROOTS:
+            if (self.project_root / root).is_dir():
+                self._add_tree(self.project_root / root)
+        # Watches are in place before the rebuild, so nothing is missed in between
+        for kind in ("work", "specs"):
+            if (self.project_root / "cspec" / kind).is_dir():
+                watch_index(self.project_root, kind)
+
+    def _classify(self, changes: ChangeSet, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            changes.overflow = True
+            return
+        base = self._paths.get(wd)
+        if base is None:
+            return
+        if mask & IN_IGNORED:
+            self._paths.pop(wd, None)
+            return
+
+        path = base / name if name else base
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            # Files may land in a new directory before its watch exists; the
+            # whole entry is re-read below, which covers them
+            self._add_tree(path)
+
+        parts = path.relative_to(self.project_root).parts
+        if parts[:2] == ("cspec", "work") and len(parts) > 2:
+            changes.work.add(parts[2])
+        elif parts[:2] == ("cspec", "specs") and len(parts) > 2:
+            changes.specs.add(parts[2])
+
+    def _collect(self, timeout: float | None) -> ChangeSet:
+        """Wait for a burst of events and coalesce it."""
+        changes = ChangeSet()
+        ready, _, _ = select.select([self._inotify.fd], [], [], timeout)
+        if not ready:
+            return changes
+
+        started = time.monotonic()
+        while True:
+            for wd, mask, name in self._inotify.read():
+                self._classify(changes, wd, mask, name)
+            remaining = MAX_DELAY - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([self._inotify.fd], [], [], min(DEBOUNCE, remaining))
+            if not ready:
+                break
+        return changes
+
+    def _apply(self, changes: ChangeSet) -> None:
+        if changes.overflow:
+            # Events were lost: start over with fresh watches and a full rescan
+            self._inotify.close()
+            self._start()
+            changes.work.clear()
+            changes.specs.clear()
+        if changes.work:
+            update_entries(self.project_root, "work", changes.work)
+            loader = IssueLoader(self.project_root)
+            for name in changes.work:
+                issue_file = self.project_root / "cspec" / "work" / name / "issue.md"
+                try:
+                    loader.load(issue_file)
+                except OSError:
+                    continue
+            loader.save()
+        if changes.specs:
+            update_entries(self.project_root, "specs", changes.specs)
+
+    def poll(self, timeout: float | None = None) -> ChangeSet:
+        """Process one burst of events, waiting up to timeout for it to start."""
+        changes = self._collect(timeout)
+        if changes:
+            self._apply(changes)
+            if self.on_change is not None:
+                self.on_change(changes)
+        return changes
+
+    def run(self) -> None:
+        """Watch until stop() is called."""
+        self._start()
+        try:
+            while not self._stopped:
+                self.poll(timeout=0.5)
+        finally:
+            self._inotify.close()
+            for kind in ("work", "specs"):
+                unwatch_index(self.project_root, kind)
+
+    def stop(self) -> None:
+        self._stopped = True